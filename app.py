@@ -2,7 +2,8 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 
-# Load les data
+# Load les data (mis en cache entre les rechargements de page)
+@st.cache_data
 def load_data(file_path):
     return pd.read_parquet(file_path)
 
@@ -0,0 +1,83 @@
+import datetime
+from typing import Dict, List
+
+import pandas as pd
+
+from azfn_starter_kit.business_logics.weather.data_backfill.weather_backfill import (
+    bulk_upsert_weather_data,
+    weather_backfill_city,
+)
+from azfn_starter_kit.common.durables.activity_results import (
+    FAILURE,
+    MISSING_KEY,
+    SKIPPED,
+    SUCCESS,
+    activity_result,
+    is_retryable,
+)
+from azfn_starter_kit.common.durables.core_entity import CoreEntity
+from azfn_starter_kit.utilities.logger import log_context
+from azfn_starter_kit.utilities.metrics import ActivityMetrics
+
+
+class BackfillActivity(CoreEntity):
+    """
+    Reprocess the raw files of a partition, i.e. one day for a set of cities, and load them with one upsert.
+
+    The input is {"partition_date", "cities": [{"city", "raw_path", "archive_path"}]}, the output holds one
+    result per city: SKIPPED when it has no raw file that day. Transient errors are raised, so that the retry
+    policy reprocesses the whole partition, which is idempotent.
+    """
+
+    def process(self, input_: dict) -> List[dict]:
+        try:
+            partition_date = datetime.date.fromisoformat(input_["partition_date"])
+            cities: List[dict] = input_["cities"]
+        except KeyError as key_err:
+            self.logger.error("Missing key in input data: %s", str(key_err))
+            return [activity_result("backfill", None, MISSING_KEY, str(key_err))]
+
+        results: Dict[str, dict] = {}
+        frames: Dict[str, pd.DataFrame] = {}
+        metrics: Dict[str, ActivityMetrics] = {}
+        for city_input in cities:
+            city = city_input.get("city")
+            metrics[city] = ActivityMetrics()
+            with log_context(city=city):
+                try:
+                    frames[city] = weather_backfill_city(
+                        city_input["city"],
+                        self.fs_,
+                        city_input["raw_path"],
+                        city_input["archive_path"],
+                        partition_date,
+                        metrics=metrics[city],
+                    )
+                except KeyError as key_err:
+                    self.logger.error("Missing key in input data: %s", str(key_err))
+                    results[city] = activity_result("backfill", city, MISSING_KEY, str(key_err))
+                except Exception as _ex:  # pylint: disable=broad-except
+                    if is_retryable(_ex):
+                        self.logger.warning("Retryable error for %s: %s", city, str(_ex))
+                        raise
+                    self.logger.error("%s", str(_ex), exc_info=True)
+                    results[city] = activity_result("backfill", city, FAILURE, str(_ex), metrics[city])
+
+        loaded = [city for city, frame in frames.items() if not frame.empty]
+        try:
+            rows = bulk_upsert_weather_data([frames[city] for city in loaded])
+            self.logger.info("Backfilled %s rows of %s cities on %s", rows, len(loaded), partition_date)
+            for city in loaded:
+                results[city] = activity_result("backfill", city, SUCCESS, metrics=metrics[city])
+        except Exception as _ex:  # pylint: disable=broad-except
+            if is_retryable(_ex):
+                self.logger.warning("Retryable error for the partition %s: %s", partition_date, str(_ex))
+                raise
+            self.logger.error("%s", str(_ex), exc_info=True)
+            for city in loaded:
+                results[city] = activity_result("backfill", city, FAILURE, str(_ex), metrics[city])
+
+        for city, frame in frames.items():
+            if frame.empty:
+                results[city] = activity_result("backfill", city, SKIPPED, metrics=metrics[city])
+        return [results[city_input.get("city")] for city_input in cities]
@@ -1,19 +1,61 @@
+# The activities, and the business logic they pull in (pandas, SQLAlchemy, the storage and weather API clients),
+# are imported on their first run rather than at start-up: most invocations of a worker, such as the triggers
+# and orchestrators, never need them.
 from azfn_starter_kit.azfn import shared_bp
-from azfn_starter_kit.azfn.basic_data_flow_example.activities.extract_activity import ExtractActivity
-from azfn_starter_kit.azfn.basic_data_flow_example.activities.load_activity import LoadActivity
-from azfn_starter_kit.azfn.basic_data_flow_example.activities.transform_activity import TransformActivity
+from azfn_starter_kit.utilities.logger import log_context
 
 
 @shared_bp.activity_trigger(input_name="inputs")
 def weather_data_flow_transform_activity(inputs: dict) -> str:
-    return TransformActivity().process(inputs)
+    from azfn_starter_kit.azfn.basic_data_flow_example.activities.transform_activity import TransformActivity
+
+    with log_context(run_id=inputs.get("run_id"), city=inputs.get("city"), stage="transform"):
+        return TransformActivity().process(inputs)
 
 
 @shared_bp.activity_trigger(input_name="inputs")
 def weather_data_flow_extract_activity(inputs: dict) -> str:
-    return ExtractActivity().process(inputs)
+    from azfn_starter_kit.azfn.basic_data_flow_example.activities.extract_activity import ExtractActivity
+
+    with log_context(run_id=inputs.get("run_id"), city=inputs.get("city"), stage="extract"):
+        return ExtractActivity().process(inputs)
 
 
 @shared_bp.activity_trigger(input_name="inputs")
 def weather_data_flow_load_activity(inputs: dict) -> str:
-    return LoadActivity().process(inputs)
+    from azfn_starter_kit.azfn.basic_data_flow_example.activities.load_activity import LoadActivity
+
+    with log_context(run_id=inputs.get("run_id"), city=inputs.get("city"), stage="load"):
+        return LoadActivity().process(inputs)
+
+
+@shared_bp.activity_trigger(input_name="inputs")
+def weather_data_flow_catalog_activity(inputs: dict) -> list:
+    from azfn_starter_kit.azfn.basic_data_flow_example.activities.catalog_activity import CatalogActivity
+
+    with log_context(run_id=inputs.get("run_id"), stage="catalog"):
+        return CatalogActivity().process(inputs)
+
+
+@shared_bp.activity_trigger(input_name="inputs")
+def weather_data_flow_etl_activity(inputs: dict) -> list:
+    from azfn_starter_kit.azfn.basic_data_flow_example.activities.etl_activity import EtlActivity
+
+    with log_context(run_id=inputs.get("run_id"), stage="etl"):
+        return EtlActivity().process(inputs)
+
+
+@shared_bp.activity_trigger(input_name="inputs")
+def weather_data_flow_metrics_activity(inputs: dict) -> str:
+    from azfn_starter_kit.azfn.basic_data_flow_example.activities.metrics_activity import MetricsActivity
+
+    with log_context(run_id=inputs.get("run_id"), stage="metrics"):
+        return MetricsActivity().process(inputs)
+
+
+@shared_bp.activity_trigger(input_name="inputs")
+def weather_data_flow_backfill_activity(inputs: dict) -> list:
+    from azfn_starter_kit.azfn.basic_data_flow_example.activities.backfill_activity import BackfillActivity
+
+    with log_context(run_id=inputs.get("run_id"), stage="backfill"):
+        return BackfillActivity().process(inputs)
@@ -0,0 +1,20 @@
+from typing import List
+
+from azfn_starter_kit.business_logics.weather.city_catalog.city_catalog import load_city_catalog
+from azfn_starter_kit.common.durables.activity_results import is_retryable
+from azfn_starter_kit.common.durables.core_entity import CoreEntity
+
+
+class CatalogActivity(CoreEntity):
+    def process(self, input_: dict) -> List[str]:
+        # An empty catalog would end the run as a silent no-op: the error is raised to the orchestrator instead,
+        # which retries the activity with its retry policy.
+        try:
+            return load_city_catalog(self.settings.ORCHESTRATION_SETTINGS, self.fs_)
+
+        except Exception as _ex:  # pylint: disable=broad-except
+            if is_retryable(_ex):
+                self.logger.warning("Retryable error while loading the city catalog: %s", str(_ex))
+            else:
+                self.logger.error("%s", str(_ex), exc_info=True)
+            raise
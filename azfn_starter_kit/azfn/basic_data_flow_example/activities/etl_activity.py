@@ -0,0 +1,69 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from azfn_starter_kit.business_logics.weather.data_etl.weather_etl import weather_etl_process
+from azfn_starter_kit.common.durables.activity_results import (
+    FAILURE,
+    MISSING_KEY,
+    SKIPPED,
+    SUCCESS,
+    activity_result,
+    is_retryable,
+)
+from azfn_starter_kit.common.durables.core_entity import CoreEntity
+from azfn_starter_kit.utilities.logger import log_context
+from azfn_starter_kit.utilities.metrics import ActivityMetrics
+
+
+class EtlActivity(CoreEntity):
+    def process(self, input_: dict) -> List[dict]:
+        try:
+            cities: List[dict] = input_["cities"]
+        except KeyError as key_err:
+            self.logger.error("Missing key in input data: %s", str(key_err))
+            return [activity_result("etl", None, MISSING_KEY, str(key_err))]
+
+        results = []
+        with ThreadPoolExecutor(max_workers=self.fs_.max_concurrency) as executor:
+            for city_input in cities:
+                with log_context(city=city_input.get("city")):
+                    results.append(self._process_city(city_input, executor))
+        return results
+
+    def _process_city(self, city_input: dict, executor: ThreadPoolExecutor) -> dict:
+        """
+        Run the ETL of a city, reporting any error in its result so that the rest of the batch is kept. A transient
+        error is raised instead, for the retry policy to run the batch again.
+        """
+        city: Optional[str] = city_input.get("city")
+        metrics = ActivityMetrics()
+        try:
+            city = city_input["city"]
+            state = dict(city_input.get("state") or {})
+            file_date = datetime.date.fromisoformat(city_input["file_date"]) if city_input.get("file_date") else None
+            writes = weather_etl_process(
+                city,
+                self.fs_,
+                city_input["raw_path"],
+                city_input["archive_path"],
+                executor,
+                compression=self.settings.DLS_SETTINGS.RAW_COMPRESSION,
+                metrics=metrics,
+                state=state,
+                file_date=file_date,
+            )
+            with metrics.phase("persist"):
+                for write in writes:
+                    metrics.bytes_written += write.result()
+            return activity_result("etl", city, SUCCESS if writes else SKIPPED, metrics=metrics, state=state)
+
+        except KeyError as key_err:
+            self.logger.error("Missing key in input data: %s", str(key_err))
+            return activity_result("etl", city, MISSING_KEY, str(key_err))
+        except Exception as _ex:  # pylint: disable=broad-except
+            if is_retryable(_ex):
+                self.logger.warning("Retryable error for %s: %s", city, str(_ex))
+                raise
+            self.logger.error("%s", str(_ex), exc_info=True)
+            return activity_result("etl", city, FAILURE, str(_ex), metrics)
@@ -1,20 +1,45 @@
-import traceback
+import datetime
+from typing import Optional
 
 from azfn_starter_kit.business_logics.weather.data_extraction.weather_data_extraction import extract_weather_data
+from azfn_starter_kit.common.durables.activity_results import (
+    FAILURE,
+    MISSING_KEY,
+    SKIPPED,
+    SUCCESS,
+    activity_result,
+    is_retryable,
+)
 from azfn_starter_kit.common.durables.core_entity import CoreEntity
+from azfn_starter_kit.utilities.metrics import ActivityMetrics
 
 
 class ExtractActivity(CoreEntity):
-    def process(self, input_: dict) -> str:
+    def process(self, input_: dict) -> dict:
+        city: Optional[str] = input_.get("city")
+        metrics = ActivityMetrics()
         try:
-            city: str = input_["city"]
+            city = input_["city"]
             dest_path: str = input_["dest_path"]
-            extract_weather_data(city, self.fs_, dest_path)
-            return f"EXTRACTION WEATHER {city} SUCCESS"
+            state = dict(input_.get("state") or {})
+            file_date = datetime.date.fromisoformat(input_["file_date"]) if input_.get("file_date") else None
+            raw_file = extract_weather_data(
+                city,
+                self.fs_,
+                dest_path,
+                compression=self.settings.DLS_SETTINGS.RAW_COMPRESSION,
+                metrics=metrics,
+                state=state,
+                file_date=file_date,
+            )
+            return activity_result("extract", city, SUCCESS if raw_file else SKIPPED, metrics=metrics, state=state)
 
         except KeyError as key_err:
             self.logger.error("Missing key in input data: %s", str(key_err))
-            return "EXTRACTION MISSING_KEY"
+            return activity_result("extract", city, MISSING_KEY, str(key_err))
         except Exception as _ex:  # pylint: disable=broad-except
-            self.logger.error("%s: \n%s", str(_ex), traceback.format_exc())
-            return "EXTRACTION FAILURE"
+            if is_retryable(_ex):
+                self.logger.warning("Retryable error for %s: %s", city, str(_ex))
+                raise
+            self.logger.error("%s", str(_ex), exc_info=True)
+            return activity_result("extract", city, FAILURE, str(_ex), metrics)
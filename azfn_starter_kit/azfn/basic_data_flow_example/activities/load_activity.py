@@ -1,21 +1,39 @@
-import traceback
+from typing import Optional
 
 from azfn_starter_kit.business_logics.weather.data_loading.weather_data_loading import weather_loading_process
+from azfn_starter_kit.common.durables.activity_results import (
+    FAILURE,
+    MISSING_KEY,
+    SKIPPED,
+    SUCCESS,
+    activity_result,
+    is_retryable,
+)
 from azfn_starter_kit.common.durables.core_entity import CoreEntity
+from azfn_starter_kit.utilities.metrics import ActivityMetrics
 
 
 class LoadActivity(CoreEntity):
-    def process(self, input_: dict) -> str:
+    def process(self, input_: dict) -> dict:
+        city: Optional[str] = input_.get("city")
+        metrics = ActivityMetrics()
         try:
-            city: str = input_["city"]
+            city = input_["city"]
             src_path: str = input_["src_path"]
             archive_path: str = input_["archive_path"]
-            weather_loading_process(city, self.fs_, src_path, archive_path)
-            return f"LOADING WEATHER {city} SUCCESS"
+            checksum = weather_loading_process(
+                city, self.fs_, src_path, archive_path, metrics=metrics, loaded_checksum=input_.get("loaded_checksum")
+            )
+            if checksum is None:
+                return activity_result("load", city, SKIPPED, metrics=metrics)
+            return activity_result("load", city, SUCCESS, metrics=metrics, state={"loaded_checksum": checksum})
 
         except KeyError as key_err:
             self.logger.error("Missing key in input data: %s", str(key_err))
-            return "LOADING MISSING_KEY"
+            return activity_result("load", city, MISSING_KEY, str(key_err))
         except Exception as _ex:  # pylint: disable=broad-except
-            self.logger.error("%s: \n%s", str(_ex), traceback.format_exc())
-            return "LOADING FAILURE"
+            if is_retryable(_ex):
+                self.logger.warning("Retryable error for %s: %s", city, str(_ex))
+                raise
+            self.logger.error("%s", str(_ex), exc_info=True)
+            return activity_result("load", city, FAILURE, str(_ex), metrics)
@@ -0,0 +1,27 @@
+import datetime
+
+from azfn_starter_kit.business_logics.run_metrics.run_metrics import persist_run_metrics
+from azfn_starter_kit.common.durables.activity_results import FAILURE, MISSING_KEY, SUCCESS
+from azfn_starter_kit.common.durables.core_entity import CoreEntity
+
+
+class MetricsActivity(CoreEntity):
+    def process(self, input_: dict) -> str:
+        try:
+            orchestration_settings = self.settings.ORCHESTRATION_SETTINGS
+            persist_run_metrics(
+                self.fs_,
+                orchestration_settings.METRICS_PATH,
+                orchestration_settings.METRICS_TABLE,
+                input_["run_id"],
+                datetime.datetime.fromisoformat(input_["run_time"]),
+                input_["records"],
+            )
+            return SUCCESS
+
+        except KeyError as key_err:
+            self.logger.error("Missing key in input data: %s", str(key_err))
+            return MISSING_KEY
+        except Exception as _ex:  # pylint: disable=broad-except
+            self.logger.error("%s", str(_ex), exc_info=True)
+            return FAILURE
@@ -1,22 +1,35 @@
-import traceback
+from typing import Optional
 
 from azfn_starter_kit.business_logics.weather.data_transformation.weather_data_transform import (
     weather_transform_process,
 )
+from azfn_starter_kit.common.durables.activity_results import (
+    FAILURE,
+    MISSING_KEY,
+    SUCCESS,
+    activity_result,
+    is_retryable,
+)
 from azfn_starter_kit.common.durables.core_entity import CoreEntity
+from azfn_starter_kit.utilities.metrics import ActivityMetrics
 
 
 class TransformActivity(CoreEntity):
-    def process(self, input_: dict) -> str:
+    def process(self, input_: dict) -> dict:
+        city: Optional[str] = input_.get("city")
+        metrics = ActivityMetrics()
         try:
-            city: str = input_["city"]
+            city = input_["city"]
             src_path: str = input_["src_path"]
             dest_path: str = input_["dest_path"]
-            weather_transform_process(city, self.fs_, src_path, dest_path)
-            return f"TRANSFORMATION WEATHER {city} SUCCESS"
+            weather_transform_process(city, self.fs_, src_path, dest_path, metrics=metrics)
+            return activity_result("transform", city, SUCCESS, metrics=metrics)
         except KeyError as key_err:
             self.logger.error("Missing key in input data: %s", str(key_err))
-            return "TRANSFORMATION MISSING_KEY"
+            return activity_result("transform", city, MISSING_KEY, str(key_err))
         except Exception as _ex: 
-            self.logger.error("%s: \n%s", str(_ex), traceback.format_exc())
-            return "TRANSFORMATION FAILURE"
+            if is_retryable(_ex):
+                self.logger.warning("Retryable error for %s: %s", city, str(_ex))
+                raise
+            self.logger.error("%s", str(_ex), exc_info=True)
+            return activity_result("transform", city, FAILURE, str(_ex), metrics)
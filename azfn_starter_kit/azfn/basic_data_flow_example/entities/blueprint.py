@@ -0,0 +1,9 @@
+import azure.durable_functions as df
+
+from azfn_starter_kit.azfn import shared_bp
+from azfn_starter_kit.azfn.basic_data_flow_example.entities.city_state_entity import CityStateEntity
+
+
+@shared_bp.entity_trigger(context_name="context")
+def weather_city_state(context: df.DurableEntityContext) -> None:
+    CityStateEntity().operate(context)
@@ -0,0 +1,76 @@
+import datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, Generator, List, Optional
+
+import azure.durable_functions as df
+
+from azfn_starter_kit.common.durables.activity_results import is_failure
+from azfn_starter_kit.common.durables.base_entity import BaseEntity
+
+CITY_STATE_ENTITY = "weather_city_state"
+
+# Fields telling whether the forecast of a city changed; they are only saved once the whole pipeline succeeded,
+# so that a city which failed half-way is seen as stale by the next run.
+FRESHNESS_FIELDS = ("last_modified", "expires", "loaded_checksum")
+
+
+class CityStateEntity(BaseEntity):
+    """
+    Durable entity holding the freshness state of a city, keyed by the city name.
+
+    The state holds the coordinates of the city (`latitude`, `longitude`), the `Last-Modified` and `Expires`
+    headers of its last forecast, its last raw file (`raw_file`) and the checksum of the data last loaded
+    (`loaded_checksum`). Operations: "get" returns the state, "update" merges the given fields into it and
+    "reset" clears it.
+    """
+
+    def operate(self, context: df.DurableEntityContext) -> None:
+        state: dict = context.get_state(dict)
+        operation = context.operation_name
+        if operation == "update":
+            state = {**state, **(context.get_input() or {})}
+        elif operation == "reset":
+            state = {}
+        elif operation != "get":
+            raise ValueError(f"Unknown operation on {CITY_STATE_ENTITY}: {operation}")
+        context.set_state(state)
+        context.set_result(state)
+
+
+def city_state_id(city: str) -> df.EntityId:
+    return df.EntityId(CITY_STATE_ENTITY, city)
+
+
+def read_city_states(context: df.DurableOrchestrationContext, cities: List[str]) -> Generator:
+    """Read the freshness state of each city from its entity, returning them by city, empty when unknown."""
+    entity_calls = [context.call_entity(city_state_id(city), "get") for city in cities]
+    states: List[Optional[dict]] = yield context.task_all(entity_calls)
+    city_states: Dict[str, dict] = {city: state or {} for city, state in zip(cities, states)}
+    return city_states
+
+
+def is_stale(state: Optional[dict], now: datetime.datetime) -> bool:
+    """Tell whether the forecast of a city may have changed since it was last loaded, from its `Expires` header."""
+    if not state or not state.get("expires"):
+        return True
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=datetime.timezone.utc)
+    return parsedate_to_datetime(state["expires"]) <= now
+
+
+def save_city_state(context: df.DurableOrchestrationContext, city: str, results: List[dict]) -> None:
+    """
+    Signal the state updates returned by the activities of a city to its entity.
+
+    Args:
+        context (df.DurableOrchestrationContext): The durable orchestration context.
+        city (str): The city.
+        results (List[dict]): The activity results of the city, in stage order.
+    """
+    state: dict = {}
+    for result in results:
+        state.update(result.get("state") or {})
+    if any(is_failure(result) for result in results):
+        state = {key: value for key, value in state.items() if key not in FRESHNESS_FIELDS}
+    if state:
+        context.signal_entity(city_state_id(city), "update", state)
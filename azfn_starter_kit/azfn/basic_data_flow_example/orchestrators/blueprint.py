@@ -3,9 +3,21 @@ from typing import Generator
 import azure.durable_functions as df
 
 from azfn_starter_kit.azfn import shared_bp
+from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_backfill_orchestrator import (
+    WeatherBackfillDataflowOrchestrator,
+)
+from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_city_orchestrator import (
+    WeatherCityDataflowOrchestrator,
+)
+from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_monitor_orchestrator import (
+    WeatherMonitorDataflowOrchestrator,
+)
 from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_orchestrator import (
     WeatherDataflowOrchestrator,
 )
+from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_shard_orchestrator import (
+    WeatherShardDataflowOrchestrator,
+)
 
 
 @shared_bp.orchestration_trigger(context_name="context")
@@ -13,3 +25,31 @@ def weather_data_flow_orchestrator(
     context: df.DurableOrchestrationContext,
 ) -> Generator:
     return WeatherDataflowOrchestrator().call_activities(context)
+
+
+@shared_bp.orchestration_trigger(context_name="context")
+def weather_data_flow_shard_orchestrator(
+    context: df.DurableOrchestrationContext,
+) -> Generator:
+    return WeatherShardDataflowOrchestrator().call_activities(context)
+
+
+@shared_bp.orchestration_trigger(context_name="context")
+def weather_data_flow_city_orchestrator(
+    context: df.DurableOrchestrationContext,
+) -> Generator:
+    return WeatherCityDataflowOrchestrator().call_activities(context)
+
+
+@shared_bp.orchestration_trigger(context_name="context")
+def weather_data_flow_backfill_orchestrator(
+    context: df.DurableOrchestrationContext,
+) -> Generator:
+    return WeatherBackfillDataflowOrchestrator().call_activities(context)
+
+
+@shared_bp.orchestration_trigger(context_name="context")
+def weather_data_flow_monitor_orchestrator(
+    context: df.DurableOrchestrationContext,
+) -> Generator:
+    return WeatherMonitorDataflowOrchestrator().call_activities(context)
@@ -0,0 +1,82 @@
+import datetime
+import logging
+import traceback
+from typing import Dict, Generator, List, Optional
+
+import azure.durable_functions as df
+
+from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_orchestrator import (
+    WeatherDataflowOrchestrator,
+)
+
+
+class WeatherBackfillDataflowOrchestrator(WeatherDataflowOrchestrator):
+    """
+    Reprocess the raw files already extracted for a set of cities over a range of days.
+
+    The input is {"start_date", "end_date", "cities"}, the dates being ISO formatted and inclusive, and the cities
+    defaulting to the catalog. Each day and group of cities is a partition, reprocessed by one activity with a
+    single upsert, in parallel with the others. The progress is reported as the custom status of the instance:
+    {"start_date", "end_date", "partitions", "completed"}.
+    """
+
+    def call_activities(self, context: df.DurableOrchestrationContext) -> Generator:
+        run_time = context.current_utc_datetime
+        try:
+            client_input: dict = context.get_input() or {}
+            start_date = datetime.date.fromisoformat(client_input["start_date"])
+            end_date = datetime.date.fromisoformat(client_input.get("end_date") or client_input["start_date"])
+            dates = self._date_range(start_date, end_date, self.settings.ORCHESTRATION_SETTINGS.BACKFILL_MAX_DAYS)
+            cities: Optional[List[str]] = client_input.get("cities")
+            if cities is None:
+                cities = yield self.call_activity(context, "weather_data_flow_catalog_activity", {})
+
+            partitions = self._build_partitions(cities, dates)
+            progress = {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "partitions": len(partitions),
+                "completed": 0,
+            }
+            context.set_custom_status(progress)
+            outputs = yield from self.run_activities(
+                context,
+                "weather_data_flow_backfill_activity",
+                partitions,
+                on_progress=lambda completed: context.set_custom_status({**progress, "completed": completed}),
+            )
+
+            city_results: Dict[str, List[dict]] = {city: [] for city in cities}
+            for partition_results in outputs:
+                for result in partition_results:
+                    city_results.setdefault(result["city"], []).append(result)
+            city_outputs = [{"city": city, "results": results} for city, results in city_results.items()]
+            yield from self._report_metrics(context, run_time, city_outputs)
+            return city_outputs
+
+        except Exception as catched_ex:
+            self.conditional_log(context, "%s: \n%s", str(catched_ex), traceback.format_exc(), level=logging.ERROR)
+            return None
+
+    @staticmethod
+    def _date_range(start_date: datetime.date, end_date: datetime.date, max_days: int) -> List[datetime.date]:
+        """The days from `start_date` to `end_date`, both included."""
+        days = (end_date - start_date).days + 1
+        if days <= 0:
+            raise ValueError(f"The backfill ends on {end_date}, before it starts on {start_date}")
+        if days > max_days:
+            raise ValueError(f"The backfill spans {days} days, more than the {max_days} allowed")
+        return [start_date + datetime.timedelta(days=offset) for offset in range(days)]
+
+    def _build_partitions(self, cities: List[str], dates: List[datetime.date]) -> List[dict]:
+        """Build one backfill input per day and group of cities, with the paths of each city for that day."""
+        partitioned_layout = self.settings.DLS_SETTINGS.PARTITIONED_LAYOUT
+        partition_size = self.settings.ORCHESTRATION_SETTINGS.BACKFILL_PARTITION_SIZE
+        return [
+            {
+                "partition_date": date_.isoformat(),
+                "cities": self._build_etl_inputs(city_group, date_ if partitioned_layout else None),
+            }
+            for date_ in dates
+            for city_group in self._shard(cities, partition_size)
+        ]
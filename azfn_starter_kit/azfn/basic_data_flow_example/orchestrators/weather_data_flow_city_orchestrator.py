@@ -0,0 +1,49 @@
+import logging
+import traceback
+from typing import Generator, List
+
+import azure.durable_functions as df
+
+from azfn_starter_kit.azfn.basic_data_flow_example.entities.city_state_entity import save_city_state
+from azfn_starter_kit.common.durables.activity_results import (
+    FAILURE,
+    activity_result,
+    add_retries,
+    is_failure,
+    is_success,
+)
+from azfn_starter_kit.common.durables.base_entity import BaseEntity
+
+# Stages of the pipeline of a city, in order: key of the stage input, activity.
+STAGES = [
+    ("extract", "weather_data_flow_extract_activity"),
+    ("transform", "weather_data_flow_transform_activity"),
+    ("load", "weather_data_flow_load_activity"),
+]
+
+
+class WeatherCityDataflowOrchestrator(BaseEntity):
+    def call_activities(self, context: df.DurableOrchestrationContext) -> Generator:
+        city_input: dict = context.get_input()
+        results: List[dict] = []
+        try:
+            for stage, activity_name in STAGES:
+                task = self.call_activity(context, activity_name, city_input[stage])
+                try:
+                    result: dict = yield task
+                except Exception as activity_ex:  # the activity kept failing after its retries
+                    result = activity_result(stage, city_input["city"], FAILURE, str(activity_ex))
+                add_retries(result, self.durable_retries(task))
+                results.append(result)
+                if not is_success(result):
+                    level = logging.WARNING if is_failure(result) else logging.INFO
+                    self.conditional_log(
+                        context, "%s stopped at %s: %s", city_input["city"], stage, result, level=level
+                    )
+                    break
+            save_city_state(context, city_input["city"], results)
+
+        except Exception as catched_ex:
+            self.conditional_log(context, "%s: \n%s", str(catched_ex), traceback.format_exc(), level=logging.ERROR)
+
+        return {"city": city_input.get("city"), "results": results}
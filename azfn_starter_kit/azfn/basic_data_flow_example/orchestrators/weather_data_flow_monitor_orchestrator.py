@@ -0,0 +1,57 @@
+import datetime
+import logging
+import traceback
+from typing import Generator, List, Optional
+
+import azure.durable_functions as df
+
+from azfn_starter_kit.azfn.basic_data_flow_example.entities.city_state_entity import is_stale, read_city_states
+from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_orchestrator import (
+    WeatherDataflowOrchestrator,
+)
+
+
+class WeatherMonitorDataflowOrchestrator(WeatherDataflowOrchestrator):
+    """
+    Eternal orchestration refreshing the cities whose forecast expired, at a fixed cadence.
+
+    The input is {"cities", "mode", "interval_minutes"}, all optional: the cities default to the catalog, read
+    again at each refresh, and the cadence to the `MONITOR_INTERVAL_MINUTES` setting. Each refresh runs the
+    weather pipeline as a sub-orchestration, only for the stale cities, then waits on a durable timer and
+    continues as new, which keeps the history bounded. The custom status tells when the last refresh ran, what
+    it found, and when the next one is due. An error in a refresh is logged and does not stop the monitor.
+    """
+
+    def call_activities(self, context: df.DurableOrchestrationContext) -> Generator:
+        monitor_input: dict = context.get_input() or {}
+        status: dict = {"last_refresh": context.current_utc_datetime.isoformat()}
+        try:
+            status.update((yield from self._refresh(context, monitor_input)))
+        except Exception as catched_ex:
+            self.conditional_log(context, "%s: \n%s", str(catched_ex), traceback.format_exc(), level=logging.ERROR)
+            status["error"] = str(catched_ex)
+
+        interval_minutes = monitor_input.get("interval_minutes")
+        interval_minutes = interval_minutes or self.settings.ORCHESTRATION_SETTINGS.MONITOR_INTERVAL_MINUTES
+        next_refresh = context.current_utc_datetime + datetime.timedelta(minutes=interval_minutes)
+        context.set_custom_status({**status, "next_refresh": next_refresh.isoformat()})
+        yield context.create_timer(next_refresh)
+        context.continue_as_new(monitor_input)
+
+    def _refresh(self, context: df.DurableOrchestrationContext, monitor_input: dict) -> Generator:
+        """Run the pipeline for the stale cities, returning the figures of the refresh."""
+        cities: Optional[List[str]] = monitor_input.get("cities")
+        if cities is None:
+            cities = yield self.call_activity(context, "weather_data_flow_catalog_activity", {})
+        states = yield from read_city_states(context, cities)
+        stale_cities = [city for city in cities if is_stale(states[city], context.current_utc_datetime)]
+        if not stale_cities:
+            self.conditional_log(context, "No forecast expired among %s cities", len(cities))
+            return {"cities": len(cities), "stale_cities": 0}
+
+        self.conditional_log(context, "Refreshing %s cities with an expired forecast", len(stale_cities))
+        run_id = f"{context.instance_id}:{context.current_utc_datetime:%Y%m%dT%H%M%S}"
+        yield context.call_sub_orchestrator(
+            "weather_data_flow_orchestrator", {"cities": stale_cities, "mode": monitor_input.get("mode")}, run_id
+        )
+        return {"cities": len(cities), "stale_cities": len(stale_cities), "run_id": run_id}
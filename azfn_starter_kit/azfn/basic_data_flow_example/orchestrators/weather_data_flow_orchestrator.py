@@ -1,46 +1,123 @@
+import datetime
 import logging
 import traceback
-from typing import Generator, List
+from typing import Generator, List, Optional
 
 import azure.durable_functions as df
 
-from azfn_starter_kit.common.durables.core_entity import CoreEntity
-from azfn_starter_kit.utilities.file_system import path_builder
+from azfn_starter_kit.common.durables.activity_results import metric_records
+from azfn_starter_kit.common.durables.base_entity import BaseEntity
+from azfn_starter_kit.utilities.file_system import date_partition, path_builder
+from azfn_starter_kit.utilities.metrics import summarize_metrics
 
 
-class WeatherDataflowOrchestrator(CoreEntity):
+class WeatherDataflowOrchestrator(BaseEntity):
     def call_activities(self, context: df.DurableOrchestrationContext) -> Generator:
+        # The orchestrator replays from its first event, so the current time at this point is its start time.
+        run_time = context.current_utc_datetime
         try:
-            cities = ["PARIS", "MARSEILLE", "LYON"]
-            inputs_extract, inputs_transform, inputs_load = self._build_inputs(cities)
-            yield from self.run_activities(context, "weather_data_flow_extract_activity", inputs_extract)
-            yield from self.run_activities(context, "weather_data_flow_transform_activity", inputs_transform)
-            yield from self.run_activities(context, "weather_data_flow_load_activity", inputs_load)
+            client_input: dict = context.get_input() or {}
+            cities: Optional[List[str]] = client_input.get("cities")
+            if cities is None:
+                cities = yield self.call_activity(context, "weather_data_flow_catalog_activity", {})
+            mode: str = client_input.get("mode") or self.settings.ORCHESTRATION_SETTINGS.PIPELINE_MODE
+            partition_date = None
+            if self.settings.DLS_SETTINGS.PARTITIONED_LAYOUT:
+                partition_date = context.current_utc_datetime.date().isoformat()
 
-        except Exception as catched_ex: 
+            shards = self._shard(cities, self.settings.ORCHESTRATION_SETTINGS.SHARD_SIZE)
+            force: bool = bool(client_input.get("force", False))
+            inputs = [
+                {"cities": shard, "partition_date": partition_date, "mode": mode, "force": force} for shard in shards
+            ]
+            instance_ids = [f"{context.instance_id}:shard-{index}" for index in range(len(shards))]
+            outputs = yield from self.run_sub_orchestrators(
+                context, "weather_data_flow_shard_orchestrator", inputs, instance_ids
+            )
+            city_outputs = [city_output for shard_outputs in outputs for city_output in shard_outputs]
+            yield from self._report_metrics(context, run_time, city_outputs)
+            return city_outputs
+
+        except Exception as catched_ex:
             self.conditional_log(context, "%s: \n%s", str(catched_ex), traceback.format_exc(), level=logging.ERROR)
+            return None
+
+    def _report_metrics(
+        self, context: df.DurableOrchestrationContext, run_time: datetime.datetime, city_outputs: List[dict]
+    ) -> Generator:
+        """Log the summary of the run metrics and persist them, keyed by the start time of the run.
+
+        A failure to persist them does not fail the run.
+        """
+        records = metric_records(city_outputs)
+        if not records:
+            return
+        self.conditional_log(context, "Run summary: %s", summarize_metrics(records))
+        metrics_input = {
+            "run_id": context.instance_id,
+            "run_time": run_time.isoformat(),
+            "records": records,
+        }
+        try:
+            yield self.call_activity(context, "weather_data_flow_metrics_activity", metrics_input)
+        except Exception as catched_ex:
+            self.conditional_log(context, "Run metrics not saved: %s", str(catched_ex), level=logging.WARNING)
+
+    @staticmethod
+    def _shard(cities: List[str], shard_size: int) -> List[List[str]]:
+        """Split the cities into consecutive shards of at most `shard_size` cities."""
+        return [cities[start : start + shard_size] for start in range(0, len(cities), max(shard_size, 1))]
+
+    def _build_city_inputs(self, cities: List[str], partition_date: Optional[datetime.date] = None) -> List[dict]:
+        """Group the stage inputs by city, as expected by the city sub-orchestration."""
+        inputs_extract, inputs_transform, inputs_load = self._build_inputs(cities, partition_date)
+        return [
+            {"city": city, "extract": extract, "transform": transform, "load": load}
+            for city, extract, transform, load in zip(cities, inputs_extract, inputs_transform, inputs_load)
+        ]
+
+    def _build_etl_inputs(self, cities: List[str], partition_date: Optional[datetime.date] = None) -> List[dict]:
+        """Build the inputs of the fused ETL activity, which reads nothing back from the lake."""
+        inputs_extract, _, inputs_load = self._build_inputs(cities, partition_date)
+        etl_inputs = [
+            {"city": city, "raw_path": extract["dest_path"], "archive_path": load["archive_path"]}
+            for city, extract, load in zip(cities, inputs_extract, inputs_load)
+        ]
+        for etl_input, extract in zip(etl_inputs, inputs_extract):
+            if "file_date" in extract:
+                etl_input["file_date"] = extract["file_date"]
+        return etl_inputs
+
+    def _build_inputs(self, cities: List[str], partition_date: Optional[datetime.date] = None):
+        def city_path(layer_path: str, city: str) -> str:
+            if partition_date is None:
+                return path_builder(layer_path, city)
+            return path_builder(layer_path, city, date_partition(partition_date))
 
-    def _build_inputs(self, cities: List[str]):
         inputs_extract: list = [
             {
                 "city": city,
-                "dest_path": path_builder(self.fs_.raw_path, city),
+                "dest_path": city_path(self.raw_path, city),
             }
             for city in cities
         ]
+        if partition_date is not None:
+            # Raw files are named after their partition date rather than the clock of the activity.
+            for input_extract in inputs_extract:
+                input_extract["file_date"] = partition_date.isoformat()
         inputs_transform: list = [
             {
                 "city": city,
-                "src_path": path_builder(self.fs_.raw_path, city),
-                "dest_path": path_builder(self.fs_.transformed_path, city),
+                "src_path": city_path(self.raw_path, city),
+                "dest_path": city_path(self.transformed_path, city),
             }
             for city in cities
         ]
         inputs_load: list = [
             {
                 "city": city,
-                "src_path": path_builder(self.fs_.transformed_path, city),
-                "archive_path": path_builder(self.fs_.computed_path, city),
+                "src_path": city_path(self.transformed_path, city),
+                "archive_path": city_path(self.computed_path, city),
             }
             for city in cities
         ]
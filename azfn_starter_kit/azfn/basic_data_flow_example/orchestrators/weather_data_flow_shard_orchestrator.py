@@ -0,0 +1,86 @@
+import datetime
+import logging
+import traceback
+from typing import Dict, Generator, List, Optional
+
+import azure.durable_functions as df
+
+from azfn_starter_kit.azfn.basic_data_flow_example.entities.city_state_entity import (
+    is_stale,
+    read_city_states,
+    save_city_state,
+)
+from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_orchestrator import (
+    WeatherDataflowOrchestrator,
+)
+from azfn_starter_kit.common.durables.activity_results import FAILURE, SKIPPED, activity_result
+
+
+class WeatherShardDataflowOrchestrator(WeatherDataflowOrchestrator):
+    def call_activities(self, context: df.DurableOrchestrationContext) -> Generator:
+        cities: List[str] = []
+        skipped: List[dict] = []
+        try:
+            shard_input: dict = context.get_input()
+            cities = shard_input["cities"]
+            partition_date = None
+            if shard_input.get("partition_date"):
+                partition_date = datetime.date.fromisoformat(shard_input["partition_date"])
+
+            states = yield from read_city_states(context, cities)
+            fresh_cities = []
+            if not shard_input.get("force"):
+                fresh_cities = [city for city in cities if not is_stale(states[city], context.current_utc_datetime)]
+                cities = [city for city in cities if city not in fresh_cities]
+                if fresh_cities:
+                    self.conditional_log(context, "Skipping the cities with a fresh forecast: %s", fresh_cities)
+            skipped = [
+                {"city": city, "results": [activity_result("freshness", city, SKIPPED)]} for city in fresh_cities
+            ]
+            if not cities:
+                return skipped
+
+            if shard_input.get("mode") == "fused":
+                return skipped + (yield from self._run_fused(context, cities, partition_date, states))
+
+            inputs = self._build_city_inputs(cities, partition_date)
+            for city_input in inputs:
+                state = states[city_input["city"]]
+                city_input["extract"]["state"] = state
+                city_input["load"]["loaded_checksum"] = state.get("loaded_checksum")
+            instance_ids = [f"{context.instance_id}:{city}" for city in cities]
+            outputs = yield from self.run_sub_orchestrators(
+                context, "weather_data_flow_city_orchestrator", inputs, instance_ids
+            )
+            return skipped + outputs
+
+        except Exception as catched_ex:
+            self.conditional_log(context, "%s: \n%s", str(catched_ex), traceback.format_exc(), level=logging.ERROR)
+            # The cities left to process are reported as failed rather than dropped from the run output.
+            return skipped + [
+                {"city": city, "results": [activity_result("shard", city, FAILURE, str(catched_ex))]} for city in cities
+            ]
+
+    def _run_fused(
+        self,
+        context: df.DurableOrchestrationContext,
+        cities: List[str],
+        partition_date: Optional[datetime.date],
+        states: Dict[str, dict],
+    ) -> Generator:
+        """Run the cities through the fused ETL activity, by batches, with the same output as the staged mode."""
+        etl_inputs = self._build_etl_inputs(cities, partition_date)
+        for etl_input in etl_inputs:
+            etl_input["state"] = states[etl_input["city"]]
+        batches = self._shard(etl_inputs, self.settings.ORCHESTRATION_SETTINGS.ETL_BATCH_SIZE)
+        outputs = yield from self.run_activities(
+            context, "weather_data_flow_etl_activity", [{"cities": batch} for batch in batches]
+        )
+        # Results are matched by city: a batch whose input was rejected returns a single result without city.
+        results = {result.get("city"): result for batch_results in outputs for result in batch_results}
+        city_outputs = []
+        for city in cities:
+            result = results.get(city) or activity_result("etl", city, FAILURE, "No result returned for the city")
+            save_city_state(context, city, [result])
+            city_outputs.append({"city": city, "results": [result]})
+        return city_outputs
@@ -2,7 +2,7 @@ import azure.durable_functions as df
 import azure.functions as func
 
 from azfn_starter_kit.azfn import shared_bp
-from azfn_starter_kit.common.durables.triggers import HttpTrigger, TimerTrigger
+from azfn_starter_kit.common.durables.triggers import HttpTrigger, RerunFailuresTrigger, TimerTrigger
 
 
 @shared_bp.route(route="weatherDataflowhttp")
@@ -10,10 +10,48 @@ from azfn_starter_kit.common.durables.triggers import HttpTrigger, TimerTrigger
 async def weather_data_flow_http_trigger(
     req: func.HttpRequest, client: df.models.DurableOrchestrationClient
 ) -> func.HttpResponse:
-    return await HttpTrigger(client, "weather_data_flow_orchestrator", req).start()
+    return await HttpTrigger(
+        client, "weather_data_flow_orchestrator", req, optional_params=["cities", "mode", "force"], singleton=True
+    ).start()
+
+
+@shared_bp.route(route="weatherDataflowRerunhttp")
+@shared_bp.durable_client_input(client_name="client")
+async def weather_data_flow_rerun_http_trigger(
+    req: func.HttpRequest, client: df.models.DurableOrchestrationClient
+) -> func.HttpResponse:
+    return await RerunFailuresTrigger(client, "weather_data_flow_orchestrator", req, singleton=True).start()
+
+
+@shared_bp.route(route="weatherDataflowBackfillhttp")
+@shared_bp.durable_client_input(client_name="client")
+async def weather_data_flow_backfill_http_trigger(
+    req: func.HttpRequest, client: df.models.DurableOrchestrationClient
+) -> func.HttpResponse:
+    return await HttpTrigger(
+        client,
+        "weather_data_flow_backfill_orchestrator",
+        req,
+        request_params=["start_date"],
+        optional_params=["end_date", "cities"],
+    ).start()
+
+
+@shared_bp.route(route="weatherDataflowMonitorhttp")
+@shared_bp.durable_client_input(client_name="client")
+async def weather_data_flow_monitor_http_trigger(
+    req: func.HttpRequest, client: df.models.DurableOrchestrationClient
+) -> func.HttpResponse:
+    return await HttpTrigger(
+        client,
+        "weather_data_flow_monitor_orchestrator",
+        req,
+        optional_params=["cities", "mode", "interval_minutes"],
+        singleton=True,
+    ).start()
 
 
 @shared_bp.timer_trigger(arg_name="timer", schedule="0 30 6 * * *", run_on_startup=False)
 @shared_bp.durable_client_input(client_name="client")
 async def weather_data_flow_time_trigger(timer: func.TimerRequest, client: df.DurableOrchestrationClient) -> None:
-    return await TimerTrigger(client, "weather_data_flow_orchestrator", timer).start()
+    return await TimerTrigger(client, "weather_data_flow_orchestrator", timer, singleton=True).start()
@@ -0,0 +1,11 @@
+from azfn_starter_kit.azfn import shared_bp
+from azfn_starter_kit.utilities.logger import log_context
+
+
+@shared_bp.activity_trigger(input_name="inputs")
+def lake_retention_activity(inputs: dict) -> dict:
+    # Imported on first run, to keep the storage clients out of the start-up of the worker
+    from azfn_starter_kit.azfn.lake_retention.activities.retention_activity import RetentionActivity
+
+    with log_context(run_id=inputs.get("run_id"), stage="lake_retention"):
+        return RetentionActivity().process(inputs)
@@ -0,0 +1,26 @@
+import datetime
+
+from azfn_starter_kit.business_logics.lake_retention.lake_retention import apply_retention
+from azfn_starter_kit.common.durables.core_entity import CoreEntity
+
+
+class RetentionActivity(CoreEntity):
+    def process(self, input_: dict) -> dict:
+        try:
+            layer_path: str = input_["layer_path"]
+            report = apply_retention(
+                self.fs_,
+                layer_path,
+                input_["max_age_days"],
+                datetime.datetime.fromisoformat(input_["reference_time"]),
+                action=input_.get("action", "delete"),
+                dry_run=input_.get("dry_run", True),
+            )
+            return {**report, "status": "RETENTION SUCCESS"}
+
+        except KeyError as key_err:
+            self.logger.error("Missing key in input data: %s", str(key_err))
+            return {"status": "RETENTION MISSING_KEY"}
+        except Exception as _ex:  # pylint: disable=broad-except
+            self.logger.error("%s", str(_ex), exc_info=True)
+            return {"layer_path": input_.get("layer_path"), "status": "RETENTION FAILURE"}
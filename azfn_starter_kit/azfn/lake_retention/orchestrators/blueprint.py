@@ -0,0 +1,15 @@
+from typing import Generator
+
+import azure.durable_functions as df
+
+from azfn_starter_kit.azfn import shared_bp
+from azfn_starter_kit.azfn.lake_retention.orchestrators.lake_retention_orchestrator import (
+    LakeRetentionOrchestrator,
+)
+
+
+@shared_bp.orchestration_trigger(context_name="context")
+def lake_retention_orchestrator(
+    context: df.DurableOrchestrationContext,
+) -> Generator:
+    return LakeRetentionOrchestrator().call_activities(context)
@@ -0,0 +1,51 @@
+import datetime
+import logging
+import traceback
+from typing import Generator, List
+
+import azure.durable_functions as df
+
+from azfn_starter_kit.common.durables.base_entity import BaseEntity
+
+
+class LakeRetentionOrchestrator(BaseEntity):
+    def call_activities(self, context: df.DurableOrchestrationContext) -> Generator:
+        try:
+            client_input = context.get_input() or {}
+            dry_run = client_input.get("dry_run", self.settings.RETENTION_SETTINGS.DRY_RUN)
+            inputs = self._build_inputs(context.current_utc_datetime, dry_run)
+            reports: List[dict] = yield from self.run_activities(context, "lake_retention_activity", inputs)
+
+            for report in reports:
+                self.conditional_log(
+                    context,
+                    "%s %s: %s expired files, %s bytes (dry run: %s)",
+                    report.get("status"),
+                    report.get("layer_path"),
+                    len(report.get("expired_files", [])),
+                    report.get("expired_bytes", 0),
+                    dry_run,
+                )
+            return reports
+
+        except Exception as catched_ex:
+            self.conditional_log(context, "%s: \n%s", str(catched_ex), traceback.format_exc(), level=logging.ERROR)
+            return None
+
+    def _build_inputs(self, reference_time: datetime.datetime, dry_run: bool = True) -> List[dict]:
+        retention = self.settings.RETENTION_SETTINGS
+        policies = [
+            (self.raw_path, retention.RAW),
+            (self.transformed_path, retention.TRANSFORMED),
+            (self.computed_path, retention.COMPUTED),
+        ]
+        return [
+            {
+                "layer_path": layer_path,
+                "max_age_days": policy.MAX_AGE_DAYS,
+                "action": policy.ACTION,
+                "dry_run": dry_run,
+                "reference_time": reference_time.isoformat(),
+            }
+            for layer_path, policy in policies
+        ]
@@ -0,0 +1,21 @@
+import azure.durable_functions as df
+import azure.functions as func
+
+from azfn_starter_kit.azfn import shared_bp
+from azfn_starter_kit.common.durables.triggers import HttpTrigger, TimerTrigger
+
+
+@shared_bp.route(route="lakeRetentionhttp")
+@shared_bp.durable_client_input(client_name="client")
+async def lake_retention_http_trigger(
+    req: func.HttpRequest, client: df.models.DurableOrchestrationClient
+) -> func.HttpResponse:
+    return await HttpTrigger(
+        client, "lake_retention_orchestrator", req, request_params=["dry_run"], singleton=True
+    ).start()
+
+
+@shared_bp.timer_trigger(arg_name="timer", schedule="0 0 3 * * *", run_on_startup=False)
+@shared_bp.durable_client_input(client_name="client")
+async def lake_retention_time_trigger(timer: func.TimerRequest, client: df.DurableOrchestrationClient) -> None:
+    return await TimerTrigger(client, "lake_retention_orchestrator", timer, singleton=True).start()
@@ -0,0 +1,131 @@
+import datetime
+import posixpath
+from collections import defaultdict
+from typing import Dict, List, Set
+
+import pandas as pd
+
+from azfn_starter_kit.common.fs.base_file_system import FileInfo, FileSystemClient
+from azfn_starter_kit.utilities.file_system import path_builder
+from azfn_starter_kit.utilities.logger import get_logger
+
+_LOGGER = get_logger(__name__)
+
+COMPACTED_PREFIX = "COMPACTED_"
+_SORT_COLUMNS = ["city", "date"]
+
+
+def _is_partition(directory: str) -> bool:
+    return "=" in posixpath.basename(directory)
+
+
+def _without_partitions(directory: str) -> str:
+    return "/".join(segment for segment in directory.split("/") if segment and "=" not in segment)
+
+
+def _expired_files(file_infos: List[FileInfo], max_age_days: int, reference_time: datetime.datetime) -> List[FileInfo]:
+    expiry = reference_time - datetime.timedelta(days=max_age_days)
+    return [
+        file_info
+        for file_info in file_infos
+        if file_info.last_modified < expiry and not posixpath.basename(file_info.name).startswith(COMPACTED_PREFIX)
+    ]
+
+
+def _removable_directories(file_infos: List[FileInfo], removed: Set[str]) -> List[str]:
+    """Return the outermost partition directories all of whose files are removed."""
+    files_by_directory: Dict[str, Set[str]] = defaultdict(set)
+    for file_info in file_infos:
+        directory = posixpath.dirname(file_info.name)
+        while directory and _is_partition(directory):
+            files_by_directory[directory].add(file_info.name)
+            directory = posixpath.dirname(directory)
+
+    removable = {directory for directory, files in files_by_directory.items() if files <= removed}
+    return sorted(
+        directory
+        for directory in removable
+        if not any(directory.startswith(other + "/") for other in removable if other != directory)
+    )
+
+
+def _compact(
+    fs_: FileSystemClient, layer_path: str, file_infos: List[FileInfo], expired: List[FileInfo]
+) -> List[str]:
+    """Merge the expired parquet files of each directory into one file per month of last modification."""
+    existing = {file_info.name for file_info in file_infos}
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for file_info in expired:
+        if file_info.name.endswith(".parquet"):
+            directory = _without_partitions(posixpath.dirname(file_info.name))
+            compacted_name = f"{COMPACTED_PREFIX}{file_info.last_modified:%Y%m}.parquet"
+            groups[path_builder(directory, compacted_name) if directory else compacted_name].append(file_info.name)
+
+    for compacted_file, files_name in groups.items():
+        if compacted_file in existing:
+            files_name = [compacted_file] + files_name
+        data_frame = pd.concat(
+            [fs_.read_parquet(layer_path, file_name) for file_name in files_name], ignore_index=True
+        ).drop_duplicates(ignore_index=True)
+        sort_by = [column for column in _SORT_COLUMNS if column in data_frame.columns]
+        fs_.write_parquet(layer_path, compacted_file, data_frame, sort_by=sort_by)
+        _LOGGER.info("Compacted %s files into %s", len(files_name), compacted_file)
+    return sorted(groups)
+
+
+def apply_retention(
+    fs_: FileSystemClient,
+    layer_path: str,
+    max_age_days: int,
+    reference_time: datetime.datetime,
+    action: str = "delete",
+    dry_run: bool = True,
+) -> dict:
+    """
+    Removes the files of a lake layer older than its retention period.
+
+    With the "compact" action, expired parquet files are first merged into one `COMPACTED_<YYYYMM>.parquet` file
+    per directory and month, which is never expired itself; other expired files are deleted. Partition
+    directories left empty are deleted as a whole, and the remaining files are deleted concurrently.
+
+    Args:
+        fs_ (FileSystemClient): An instance of the FileSystemClient to interact with the data lake storage.
+        layer_path (str): Path of the layer.
+        max_age_days (int): Age, in days, from which a file expires.
+        reference_time (datetime.datetime): The time ages are computed from.
+        action (str, optional): "delete" or "compact". Defaults to "delete".
+        dry_run (bool, optional): If true, only report what would be done. Defaults to True.
+
+    Returns:
+        dict: The report of the expired files, and of the compacted files and deleted directories.
+    """
+    if action not in ("delete", "compact"):
+        raise ValueError(f"Unknown retention action: {action}")
+
+    file_infos = fs_.list_file_infos(layer_path)
+    expired = _expired_files(file_infos, max_age_days, reference_time)
+    expired_names = {file_info.name for file_info in expired}
+    directories = _removable_directories(file_infos, expired_names)
+    report = {
+        "layer_path": layer_path,
+        "action": action,
+        "max_age_days": max_age_days,
+        "dry_run": dry_run,
+        "expired_files": sorted(expired_names),
+        "expired_bytes": sum(file_info.size for file_info in expired),
+        "deleted_directories": directories,
+        "compacted_files": [],
+    }
+    if dry_run or not expired:
+        return report
+
+    if action == "compact":
+        report["compacted_files"] = _compact(fs_, layer_path, file_infos, expired)
+
+    for directory in directories:
+        fs_.delete_directory(path_builder(layer_path, directory))
+    remaining = [name for name in expired_names if not any(name.startswith(d + "/") for d in directories)]
+    fs_.delete_files(layer_path, sorted(remaining))
+
+    _LOGGER.info("Removed %s expired files from %s", len(expired_names), layer_path)
+    return report
@@ -0,0 +1,83 @@
+import datetime
+import json
+from typing import List
+
+import pandas as pd
+
+from azfn_starter_kit.common.db.database import DatabaseEngine
+from azfn_starter_kit.common.fs.base_file_system import FileSystemClient
+from azfn_starter_kit.config.database_config import AzureSQLConfig
+from azfn_starter_kit.utilities.file_system import date_partition, path_builder
+from azfn_starter_kit.utilities.logger import get_logger
+
+_LOGGER = get_logger(__name__)
+
+RUN_METRICS_COLUMNS = [
+    "run_id",
+    "run_time",
+    "city",
+    "stage",
+    "status",
+    "duration_s",
+    "phases",
+    "bytes_read",
+    "bytes_written",
+    "rows",
+    "retries",
+]
+
+
+def run_metrics_frame(run_id: str, run_time: datetime.datetime, records: List[dict]) -> pd.DataFrame:
+    """
+    Builds the table of the metric records of a run, one row per city and stage.
+
+    The phase timings, whose names depend on the stage, are kept as a JSON object in the `phases` column.
+
+    Args:
+        run_id (str): The instance id of the orchestration.
+        run_time (datetime.datetime): The start time of the run.
+        records (List[dict]): The metric records of the run.
+
+    Returns:
+        pd.DataFrame: The metrics, with the `RUN_METRICS_COLUMNS` columns.
+    """
+    metrics = pd.DataFrame(records, columns=RUN_METRICS_COLUMNS)
+    metrics["run_id"] = run_id
+    metrics["run_time"] = pd.Timestamp(run_time)
+    metrics["phases"] = metrics["phases"].map(lambda phases: json.dumps(phases or {}, sort_keys=True))
+    return metrics
+
+
+def persist_run_metrics(
+    fs_: FileSystemClient,
+    metrics_path: str,
+    metrics_table: str,
+    run_id: str,
+    run_time: datetime.datetime,
+    records: List[dict],
+) -> None:
+    """
+    Writes the metric records of a run to a parquet file of the lake, partitioned by day and named after the
+    run and its start time, and inserts them in the metrics table of the database.
+
+    Args:
+        fs_ (FileSystemClient): An instance of the FileSystemClient to interact with the data lake storage.
+        metrics_path (str): Path of the metrics in the lake.
+        metrics_table (str): Name of the metrics table.
+        run_id (str): The instance id of the orchestration.
+        run_time (datetime.datetime): The start time of the run.
+        records (List[dict]): The metric records of the run.
+
+    Returns:
+        None
+    """
+    metrics = run_metrics_frame(run_id, run_time, records)
+    # Runs started by the timer and over HTTP share an instance id: the start time keeps their files apart.
+    file_name = f"RUN_METRICS_{run_id.replace(':', '_')}_{run_time:%Y%m%dT%H%M%S}.parquet"
+    fs_.write_parquet(path_builder(metrics_path, date_partition(run_time.date())), file_name, metrics)
+
+    db_ = DatabaseEngine(AzureSQLConfig.from_env())
+    db_.df_to_sql(
+        metrics, metrics_table, ["run_id", "run_time", "city", "stage"], "insert", columns=RUN_METRICS_COLUMNS
+    )
+    _LOGGER.info("Saved %s metric records of the run %s", len(metrics), run_id)
@@ -0,0 +1,45 @@
+from typing import List
+
+from azfn_starter_kit.common.db.database import DatabaseEngine
+from azfn_starter_kit.common.fs.base_file_system import FileSystemClient
+from azfn_starter_kit.config.database_config import AzureSQLConfig
+from azfn_starter_kit.config.orchestration_config import OrchestrationConfig
+from azfn_starter_kit.utilities.logger import get_logger
+
+_LOGGER = get_logger(__name__)
+
+_CITY_COLUMN = "city"
+
+
+def load_city_catalog(orchestration_settings: OrchestrationConfig, fs_: FileSystemClient) -> List[str]:
+    """
+    Loads the cities to process from the configured catalog.
+
+    The catalog is either the `CITIES` setting, a CSV file of the lake or a SQL table, both with a `city`
+    column. Blank and duplicated cities are dropped, keeping the catalog order.
+
+    Args:
+        orchestration_settings (OrchestrationConfig): The orchestration settings.
+        fs_ (FileSystemClient): An instance of the FileSystemClient to interact with the data lake storage.
+
+    Returns:
+        List[str]: The cities of the catalog.
+    """
+    source = orchestration_settings.CATALOG_SOURCE
+    if source == "settings":
+        cities = list(orchestration_settings.CITIES)
+    elif source == "lake":
+        catalog = fs_.read_csv(
+            orchestration_settings.CATALOG_PATH, orchestration_settings.CATALOG_FILE_NAME, usecols=[_CITY_COLUMN]
+        )
+        cities = catalog[_CITY_COLUMN].astype(str).tolist()
+    elif source == "sql":
+        db_ = DatabaseEngine(AzureSQLConfig.from_env())
+        cities = db_.sql_to_df(orchestration_settings.CATALOG_TABLE, columns=[_CITY_COLUMN])[_CITY_COLUMN].tolist()
+    else:
+        raise ValueError(f"Unknown city catalog source: {source}")
+
+    cities = list(dict.fromkeys(city.strip() for city in cities if city and city.strip()))
+    _LOGGER.info("Loaded %s cities from the %s catalog", len(cities), source)
+    return cities
+
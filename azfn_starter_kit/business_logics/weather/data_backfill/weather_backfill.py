@@ -0,0 +1,112 @@
+import datetime
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+from azure.core.exceptions import ResourceNotFoundError
+
+from azfn_starter_kit.business_logics.weather.data_loading.weather_data_loading import (
+    WEATHER_COLUMNS,
+    upsert_weather_data,
+)
+from azfn_starter_kit.business_logics.weather.data_transformation.weather_data_transform import weather_transform
+from azfn_starter_kit.common.fs.base_file_system import FileSystemClient
+from azfn_starter_kit.common.fs.compression import strip_compression_suffix
+from azfn_starter_kit.utilities.logger import get_logger
+from azfn_starter_kit.utilities.metrics import ActivityMetrics
+
+_LOGGER = get_logger(__name__)
+
+
+def find_raw_files(
+    city: str, fs_: FileSystemClient, raw_path: str, date_: datetime.date, prefix_file_name: str = "WEATHER"
+) -> List[str]:
+    """
+    Lists the raw files of a city extracted on a given day, whether compressed or not.
+
+    Args:
+        city (str): The city.
+        fs_ (FileSystemClient): An instance of the FileSystemClient to interact with the data lake storage.
+        raw_path (str): Path of the raw files of the city, the day partition in a partitioned layout.
+        date_ (datetime.date): The day of the extraction.
+        prefix_file_name(str, optional)
+
+    Returns:
+        List[str]: The names of the raw files, sorted, empty if there is none or no such path.
+    """
+    try:
+        return fs_.list_files(raw_path, pattern=f"{prefix_file_name}_{city}_{date_:%Y%m%d}")
+    except (FileNotFoundError, ResourceNotFoundError):
+        return []
+
+
+def weather_backfill_city(
+    city: str,
+    fs_: FileSystemClient,
+    raw_path: str,
+    archive_path: str,
+    date_: datetime.date,
+    prefix_file_name: str = "WEATHER",
+    metrics: Optional[ActivityMetrics] = None,
+) -> pd.DataFrame:
+    """
+    Transforms again the raw files of a city for a given day, and rewrites their computed parquet files.
+
+    The data is returned rather than loaded, so that the caller loads a whole partition with a single upsert.
+
+    Args:
+        city (str): The city.
+        fs_ (FileSystemClient): An instance of the FileSystemClient to interact with the data lake storage.
+        raw_path (str): Path of the raw files of the city.
+        archive_path (str): Path to write the computed data.
+        date_ (datetime.date): The day of the extraction.
+        prefix_file_name(str, optional)
+        metrics (Optional[ActivityMetrics]): Collects the phase timings, bytes and rows of the process.
+
+    Returns:
+        pd.DataFrame: The transformed data of the city, with the `WEATHER_COLUMNS` columns, empty if there is
+        no raw file for that day.
+    """
+    metrics = metrics or ActivityMetrics()
+    with metrics.phase("discover"):
+        raw_files = find_raw_files(city, fs_, raw_path, date_, prefix_file_name)
+
+    transformed_frames = []
+    for raw_file in raw_files:
+        with metrics.phase("download"):
+            data_df = fs_.read_json(raw_path, raw_file, lines=True)
+        with metrics.phase("parse"):
+            transformed_data = weather_transform(city, data_df)
+        with metrics.phase("archive"):
+            metrics.bytes_written += fs_.write_parquet(
+                archive_path,
+                str(Path(strip_compression_suffix(raw_file)).with_suffix(".parquet")),
+                transformed_data,
+                sort_by=["city", "date"],
+            )
+        transformed_frames.append(transformed_data)
+
+    if not transformed_frames:
+        _LOGGER.info("No raw file of %s on %s", city, date_)
+        return pd.DataFrame(columns=WEATHER_COLUMNS)
+    data = pd.concat(transformed_frames, ignore_index=True)[WEATHER_COLUMNS]
+    metrics.rows += len(data)
+    return data
+
+
+def bulk_upsert_weather_data(frames: List[pd.DataFrame]) -> int:
+    """
+    Upserts the weather data of several cities or files at once, keeping the last row of each city and date.
+
+    Args:
+        frames (List[pd.DataFrame]): The transformed weather data, with the `WEATHER_COLUMNS` columns.
+
+    Returns:
+        int: The number of rows upserted.
+    """
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return 0
+    data = pd.concat(frames, ignore_index=True).drop_duplicates(subset=["city", "date"], keep="last")
+    upsert_weather_data(data)
+    return len(data)
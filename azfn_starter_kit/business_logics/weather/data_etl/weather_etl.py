@@ -0,0 +1,89 @@
+import datetime
+import io
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+from azfn_starter_kit.business_logics.weather.data_extraction.weather_data_extraction import (
+    fetch_weather_forecast,
+    weather_file_name,
+)
+from azfn_starter_kit.business_logics.weather.data_loading.weather_data_loading import (
+    upsert_weather_data,
+    weather_data_checksum,
+)
+from azfn_starter_kit.business_logics.weather.data_transformation.weather_data_transform import weather_transform
+from azfn_starter_kit.common.fs.base_file_system import FileSystemClient
+from azfn_starter_kit.utilities.logger import get_logger
+from azfn_starter_kit.utilities.metrics import ActivityMetrics
+
+_LOGGER = get_logger(__name__)
+
+
+def weather_etl_process(
+    city: str,
+    fs_: FileSystemClient,
+    raw_path: str,
+    archive_path: str,
+    executor: Executor,
+    prefix_file_name: str = "WEATHER",
+    compression: Optional[str] = None,
+    metrics: Optional[ActivityMetrics] = None,
+    state: Optional[dict] = None,
+    file_date: Optional[datetime.date] = None,
+) -> List[Future]:
+    """
+    Extracts, transforms and loads the weather data of a city, passing the data in memory between the steps.
+
+    The raw and computed files are still written for lineage, but in the background on the given executor
+    while the next steps run; the caller must wait for the returned futures before reporting success. Nothing
+    is done when the forecast did not change, and the upsert is skipped when the data did not.
+
+    Args:
+        city (str): The city to process.
+        fs_ (FileSystemClient): An instance of the FileSystemClient to interact with the data lake storage.
+        raw_path (str): Path to write the raw data.
+        archive_path (str): Path to write the computed data.
+        executor (Executor): The executor running the writes.
+        prefix_file_name(str, optional)
+        compression (Optional[str]): Compression codec of the raw file. Defaults to None.
+        metrics (Optional[ActivityMetrics]): Collects the phase timings, bytes read and rows of the process.
+        state (Optional[dict]): The freshness state of the city, updated in place with the coordinates, the
+            headers of the forecast, the raw file and the checksum of the loaded data.
+        file_date (Optional[datetime.date]): Date in the name of the files, that of their date partition.
+            Defaults to the current UTC date.
+
+    Returns:
+        List[Future]: The pending writes of the raw and computed files, each returning the size it wrote; none
+        if the forecast did not change.
+    """
+    metrics = metrics or ActivityMetrics()
+    state = {} if state is None else state
+    raw_data = fetch_weather_forecast(city, state, metrics)
+    if raw_data is None:
+        return []
+    raw_file_name = weather_file_name(city, prefix_file_name, file_date)
+
+    def write_raw() -> int:
+        state["raw_file"] = fs_.write_file(raw_path, raw_file_name, raw_data, compression=compression)
+        return len(raw_data)
+
+    writes = [executor.submit(write_raw)]
+
+    with metrics.phase("parse"):
+        transformed_data = weather_transform(city, pd.read_json(io.StringIO(raw_data), lines=True))
+    computed_file_name = str(Path(raw_file_name).with_suffix(".parquet"))
+    writes.append(
+        executor.submit(fs_.write_parquet, archive_path, computed_file_name, transformed_data, sort_by=["city", "date"])
+    )
+
+    checksum = weather_data_checksum(transformed_data)
+    if checksum != state.get("loaded_checksum"):
+        with metrics.phase("upsert"):
+            upsert_weather_data(transformed_data)
+        metrics.rows += len(transformed_data)
+        state["loaded_checksum"] = checksum
+    _LOGGER.info("Successfully processed and loaded: %s", city)
+    return writes
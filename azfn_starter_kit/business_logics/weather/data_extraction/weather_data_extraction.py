@@ -1,54 +1,130 @@
 import datetime
+import functools
 import json
 import time
-from typing import Any
+from typing import Optional
 
 import requests
 from geopy.geocoders import Nominatim
 
-from azfn_starter_kit.common.fs.datalake_file_system import DataLakeGen2FileSystemClient
+from azfn_starter_kit.common.fs.base_file_system import FileSystemClient
 from azfn_starter_kit.config.weather_api import WeatherApiSettings
 from azfn_starter_kit.utilities.logger import get_logger
+from azfn_starter_kit.utilities.metrics import ActivityMetrics
 
 _LOGGER = get_logger(__name__)
 
 _GEO_USER_AGENT = "testapplication"
 
-_WEATHER_API_SETTINGS = WeatherApiSettings()
 
+@functools.lru_cache(maxsize=None)
+def _weather_api_settings() -> WeatherApiSettings:
+    return WeatherApiSettings()
 
-class WeatherAPIError(Exception):
+
+class WeatherAPIError(ConnectionError):
     pass
 
 
-def _call_weather_api(url: str, headers: dict, max_retries: int) -> Any:
+def _call_weather_api(url: str, headers: dict, max_retries: int, metrics: ActivityMetrics) -> requests.Response:
     retry_count = 0
     while retry_count < max_retries:
         try:
-            data = requests.get(url, headers=headers, timeout=3).json()
-            return data
+            return requests.get(url, headers=headers, timeout=3)
         except requests.exceptions.RequestException as req_exc:
             _LOGGER.warning("API call failed:%s", req_exc)
             retry_count += 1
+            metrics.retries += 1
             time.sleep(3)
     raise WeatherAPIError("Maximum retries reached. API call failed.")
 
 
-def _get_data_from_weather_api(city: str) -> str:
-    geolocator = Nominatim(user_agent=_GEO_USER_AGENT)
-    location = geolocator.geocode(city)
-    data = _call_weather_api(
-        f"{_WEATHER_API_SETTINGS.API_URI}?lat={location.latitude}&lon={location.longitude}",
-        headers=_WEATHER_API_SETTINGS.HEADER,
-        max_retries=5,
-    )
-    return json.dumps(data)
+def fetch_weather_forecast(city: str, state: dict, metrics: Optional[ActivityMetrics] = None) -> Optional[str]:
+    """
+    Fetches the forecast of a city, unless it did not change since the one described by its freshness state.
+
+    The coordinates cached in the state spare the geocoding, and its `last_modified` header is sent back as
+    `If-Modified-Since`. The state is updated in place with the coordinates and the `Last-Modified` and
+    `Expires` headers of the response.
+
+    Args:
+        city (str): The city.
+        state (dict): The freshness state of the city, possibly empty.
+        metrics (Optional[ActivityMetrics]): Collects the phase timings, bytes and retries of the call.
+
+    Returns:
+        Optional[str]: The forecast, as JSON, or None if it did not change.
+    """
+    metrics = metrics or ActivityMetrics()
+    if state.get("latitude") is None or state.get("longitude") is None:
+        with metrics.phase("geocode"):
+            location = Nominatim(user_agent=_GEO_USER_AGENT).geocode(city)
+        state.update(latitude=location.latitude, longitude=location.longitude)
+
+    api_settings = _weather_api_settings()
+    headers = dict(api_settings.HEADER)
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    with metrics.phase("fetch"):
+        response = _call_weather_api(
+            f"{api_settings.API_URI}?lat={state['latitude']}&lon={state['longitude']}",
+            headers=headers,
+            max_retries=5,
+            metrics=metrics,
+        )
+        for header, key in (("Last-Modified", "last_modified"), ("Expires", "expires")):
+            if response.headers.get(header):
+                state[key] = response.headers[header]
+        if response.status_code == 304:
+            _LOGGER.info("The forecast of %s did not change", city)
+            return None
+        weather_data = json.dumps(response.json())
+    metrics.bytes_read += len(weather_data)
+    return weather_data
+
+
+def weather_file_name(city: str, prefix_file_name: str = "WEATHER", date_: Optional[datetime.date] = None) -> str:
+    """Name the raw file of a city after the given date, or the current UTC date, as the date partitions are."""
+    date_ = date_ or datetime.datetime.now(datetime.timezone.utc).date()
+    return f"{prefix_file_name}_{city}_{date_:%Y%m%d}.json"
 
 
 def extract_weather_data(
-    city: str, fs_: DataLakeGen2FileSystemClient, dest_path: str, prefix_file_name: str = "WEATHER"
-) -> None:
-    current_date = datetime.datetime.now().strftime("%Y%m%d")
-    dest_file_name = f"{prefix_file_name}_{city}_{current_date}.json"
-    weather_data = _get_data_from_weather_api(city)
-    fs_.write_file(dest_path, dest_file_name, weather_data)
+    city: str,
+    fs_: FileSystemClient,
+    dest_path: str,
+    prefix_file_name: str = "WEATHER",
+    compression: Optional[str] = None,
+    metrics: Optional[ActivityMetrics] = None,
+    state: Optional[dict] = None,
+    file_date: Optional[datetime.date] = None,
+) -> Optional[str]:
+    """
+    Writes the forecast of a city to the raw layer, unless it did not change since the last extraction.
+
+    Args:
+        city (str): The city.
+        fs_ (FileSystemClient): An instance of the FileSystemClient to interact with the data lake storage.
+        dest_path (str): Path to write the raw data.
+        prefix_file_name(str, optional)
+        compression (Optional[str]): Compression codec of the raw file. Defaults to None.
+        metrics (Optional[ActivityMetrics]): Collects the phase timings, bytes and retries of the process.
+        state (Optional[dict]): The freshness state of the city, updated in place, see `fetch_weather_forecast`.
+        file_date (Optional[datetime.date]): Date in the name of the raw file, that of its date partition.
+            Defaults to the current UTC date.
+
+    Returns:
+        Optional[str]: The name of the raw file, or None if the forecast did not change.
+    """
+    metrics = metrics or ActivityMetrics()
+    state = {} if state is None else state
+    weather_data = fetch_weather_forecast(city, state, metrics)
+    if weather_data is None:
+        return None
+    with metrics.phase("upload"):
+        dest_file_name = fs_.write_file(
+            dest_path, weather_file_name(city, prefix_file_name, file_date), weather_data, compression=compression
+        )
+    metrics.bytes_written += len(weather_data)
+    state["raw_file"] = dest_file_name
+    return dest_file_name
@@ -1,48 +1,93 @@
+import hashlib
 from pathlib import Path
+from typing import Optional
+
+import pandas as pd
 
 from azfn_starter_kit.common.db.database import DatabaseEngine
-from azfn_starter_kit.common.fs.datalake_file_system import DataLakeGen2FileSystemClient
+from azfn_starter_kit.common.fs.base_file_system import FileSystemClient
 from azfn_starter_kit.config.database_config import AzureSQLConfig
 from azfn_starter_kit.utilities.logger import get_logger
+from azfn_starter_kit.utilities.metrics import ActivityMetrics
 
 _LOGGER = get_logger(__name__)
 
+WEATHER_COLUMNS = ["city", "date", "temperature", "humidity_level", "weather_description"]
+
+
+def upsert_weather_data(data_to_load: pd.DataFrame) -> None:
+    """
+    Upserts weather data into the `weather` table, keyed by city and date.
+
+    Args:
+        data_to_load (pd.DataFrame): The transformed weather data.
+
+    Returns:
+        None
+    """
+    config = AzureSQLConfig.from_env()
+    db_ = DatabaseEngine(config)
+
+    db_.df_to_sql(
+        data_to_load,
+        "weather",
+        ["city", "date"],
+        "upsert",
+        columns=WEATHER_COLUMNS,
+    )
+
+
+def weather_data_checksum(data: pd.DataFrame) -> str:
+    """Checksum of the weather data, independent of the row index, to tell whether it changed since a load."""
+    row_hashes = pd.util.hash_pandas_object(data[WEATHER_COLUMNS], index=False)
+    return hashlib.sha256(row_hashes.values.tobytes()).hexdigest()
+
 
 def weather_loading_process(
-    city: str, fs_: DataLakeGen2FileSystemClient, src_path: str, archive_path: str, prefix_file_name: str = "WEATHER"
-) -> None:
+    city: str,
+    fs_: FileSystemClient,
+    src_path: str,
+    archive_path: str,
+    prefix_file_name: str = "WEATHER",
+    metrics: Optional[ActivityMetrics] = None,
+    loaded_checksum: Optional[str] = None,
+) -> Optional[str]:
     """
     Transforms the data from a csv file and writes the transformed data to a parquet file.
 
     Args:
-        fs_ (DataLakeGen2FileSystemClient): An instance of the DataLakeGen2FileSystemClient to interact with Azure
-        Data Lake storage.
+        fs_ (FileSystemClient): An instance of the FileSystemClient to interact with the data lake
+        storage.
         city (str): Path to the source files.
         src_path (str): Path to the source files.
         archive_path (str): Path to write the transformed data.
         prefix_file_name(str, optional)
+        metrics (Optional[ActivityMetrics]): Collects the phase timings and rows of the process.
+        loaded_checksum (Optional[str]): Checksum of the data last loaded for the city; the upsert is skipped
+            when the data did not change.
 
     Returns:
-        None
+        Optional[str]: The checksum of the loaded data, or None if the upsert was skipped.
     """
-    file_to_load = fs_.list_files(src_path, pattern=f"{prefix_file_name}_{city}", descending_sort=True)[0]
+    metrics = metrics or ActivityMetrics()
+    file_to_load = fs_.latest_file(src_path, pattern=f"{prefix_file_name}_{city}")
 
     _LOGGER.info("Processing file: %s", file_to_load)
 
-    data_to_load = fs_.read_parquet(src_path, file_to_load)
     target_file_name = str(Path(file_to_load).with_suffix(".parquet"))
+    with metrics.phase("archive"):
+        fs_.copy_files(src_path, archive_path, [file_to_load], dest_files_name=[target_file_name])
 
-    fs_.write_parquet(archive_path, target_file_name, data_to_load)
-
-    config = AzureSQLConfig.from_env()
-    db_ = DatabaseEngine(config)
-
-    db_.df_to_sql(
-        data_to_load,
-        "weather",
-        ["city", "date"],
-        "upsert",
-        columns=["city", "date", "temperature", "humidity_level", "weather_description"],
-    )
+    # The transformed file only holds the upserted columns: reading it whole avoids the ranged requests.
+    with metrics.phase("download"):
+        data_to_load = fs_.read_parquet(src_path, file_to_load)
+    checksum = weather_data_checksum(data_to_load)
+    if checksum == loaded_checksum:
+        _LOGGER.info("The data of %s did not change since its last load", file_to_load)
+        return None
+    with metrics.phase("upsert"):
+        upsert_weather_data(data_to_load)
+    metrics.rows += len(data_to_load)
 
     _LOGGER.info("Successfully processed and saved: %s", file_to_load)
+    return checksum
@@ -1,12 +1,16 @@
+from typing import Optional
+
 import pandas as pd
 
-from azfn_starter_kit.common.fs.datalake_file_system import DataLakeGen2FileSystemClient
+from azfn_starter_kit.common.fs.base_file_system import FileSystemClient
+from azfn_starter_kit.common.fs.compression import strip_compression_suffix
 from azfn_starter_kit.utilities.logger import get_logger
+from azfn_starter_kit.utilities.metrics import ActivityMetrics
 
 _LOGGER = get_logger(__name__)
 
 
-def _weather_transform(city: str, df_weather: pd.DataFrame) -> pd.DataFrame:
+def weather_transform(city: str, df_weather: pd.DataFrame) -> pd.DataFrame:
     df_weather = pd.json_normalize(df_weather["properties"], record_path="timeseries", sep="_")
     df_weather.rename(
         columns={
@@ -23,29 +27,41 @@ def _weather_transform(city: str, df_weather: pd.DataFrame) -> pd.DataFrame:
 
 
 def weather_transform_process(
-    city: str, fs_: DataLakeGen2FileSystemClient, src_path: str, dest_path: str, prefix_file_name: str = "WEATHER"
+    city: str,
+    fs_: FileSystemClient,
+    src_path: str,
+    dest_path: str,
+    prefix_file_name: str = "WEATHER",
+    metrics: Optional[ActivityMetrics] = None,
 ) -> None:
     """
     Transforms the data from a csv file and writes the transformed data to a parquet file.
 
     Args:
-        fs_ (DataLakeGen2FileSystemClient): An instance of the DataLakeGen2FileSystemClient to interact with Azure
-        Data Lake storage.
+        fs_ (FileSystemClient): An instance of the FileSystemClient to interact with the data lake
+        storage.
         city (str): Path to the source files.
         src_path (str): Path to the source files.
         dest_path (str): Path to write the transformed data.
         prefix_file_name(str, optional)
+        metrics (Optional[ActivityMetrics]): Collects the phase timings, bytes and rows of the process.
 
     Returns:
         None
     """
-
-    file_to_transform = fs_.list_files(src_path, pattern=f"{prefix_file_name}_{city}", descending_sort=True)[0]
+    metrics = metrics or ActivityMetrics()
+    file_to_transform = fs_.latest_file(src_path, pattern=f"{prefix_file_name}_{city}")
     
     _LOGGER.info("Processing file: %s", file_to_transform)
 
-    data_df = fs_.read_json(src_path, file_to_transform, lines=True)
-    transformed_data = _weather_transform(city, data_df)
-    fs_.write_parquet(dest_path, file_to_transform, transformed_data)
+    with metrics.phase("download"):
+        data_df = fs_.read_json(src_path, file_to_transform, lines=True)
+    with metrics.phase("parse"):
+        transformed_data = weather_transform(city, data_df)
+    with metrics.phase("upload"):
+        metrics.bytes_written += fs_.write_parquet(
+            dest_path, strip_compression_suffix(file_to_transform), transformed_data, sort_by=["city", "date"]
+        )
+    metrics.rows += len(transformed_data)
 
     _LOGGER.info("Successfully processed and saved: %s", file_to_transform)
@@ -0,0 +1,106 @@
+import functools
+from typing import Any, List, Optional, Tuple, Type
+
+from azfn_starter_kit.utilities.metrics import ActivityMetrics
+
+SUCCESS = "SUCCESS"
+FAILURE = "FAILURE"
+MISSING_KEY = "MISSING_KEY"
+# Nothing to do for the city, e.g. its forecast did not change: the next stages are not run.
+SKIPPED = "SKIPPED"
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+def activity_result(
+    stage: str,
+    city: Optional[str],
+    status: str,
+    error: Optional[str] = None,
+    metrics: Optional[ActivityMetrics] = None,
+    state: Optional[dict] = None,
+) -> dict:
+    """Build the result an activity returns for a city, e.g. {"city": "PARIS", "stage": "load", "status": "SUCCESS"}."""
+    result = {"city": city, "stage": stage, "status": status}
+    if error is not None:
+        result["error"] = error
+    if metrics is not None:
+        result["metrics"] = metrics.to_dict()
+    if state:
+        result["state"] = state
+    return result
+
+
+def is_success(result: dict) -> bool:
+    return result.get("status") == SUCCESS
+
+
+def is_failure(result: dict) -> bool:
+    return result.get("status") not in (SUCCESS, SKIPPED)
+
+
+@functools.lru_cache(maxsize=None)
+def retryable_exceptions() -> Tuple[Type[Exception], ...]:
+    """
+    Transient network, storage and database errors: the activity raises them so that the durable retry policy
+    applies. They are imported on first use, as this module is also loaded by the orchestrators, which should
+    not pull the HTTP, storage and database clients in at start-up.
+    """
+    import requests
+    from azure.core.exceptions import ServiceRequestError, ServiceResponseError
+    from sqlalchemy.exc import OperationalError
+
+    return (
+        ConnectionError,
+        TimeoutError,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        ServiceRequestError,
+        ServiceResponseError,
+        OperationalError,
+    )
+
+
+def is_retryable(exception: Exception) -> bool:
+    """Tell whether an error is transient, and worth retrying the activity for."""
+    from azure.core.exceptions import HttpResponseError
+
+    if isinstance(exception, HttpResponseError) and exception.status_code in RETRYABLE_STATUS_CODES:
+        return True
+    return isinstance(exception, retryable_exceptions())
+
+
+def add_retries(output: Any, retries: int) -> None:
+    """
+    Add the retries of the durable retry policy to the metrics of an activity output, a result or a list of
+    results. A retry runs the whole activity again, so it counts for each result. A result without metrics, such
+    as that of an activity which kept failing, gets metrics of its retries only.
+    """
+    if retries <= 0:
+        return
+    for result in output if isinstance(output, list) else [output]:
+        if isinstance(result, dict) and "stage" in result:
+            metrics = result.setdefault("metrics", ActivityMetrics().to_dict())
+            metrics["retries"] = metrics.get("retries", 0) + retries
+
+
+def failed_cities(outputs: List[dict]) -> List[str]:
+    """Return the cities of an orchestration output, as a list of {"city", "results"}, which did not succeed."""
+    return [
+        output["city"]
+        for output in outputs
+        if not output.get("results") or any(is_failure(result) for result in output["results"])
+    ]
+
+
+def metric_records(outputs: List[dict]) -> List[dict]:
+    """
+    Flatten the results of an orchestration output, as a list of {"city", "results"}, into one metric record per
+    city and stage. Results without metrics, such as those of activities which failed at once, are skipped.
+    """
+    return [
+        {"city": output["city"], "stage": result["stage"], "status": result["status"], **result["metrics"]}
+        for output in outputs
+        for result in output.get("results", [])
+        if "metrics" in result
+    ]
@@ -0,0 +1,184 @@
+import logging
+from typing import Callable, Dict, Generator, List, Optional
+
+import azure.durable_functions as df
+from azure.durable_functions.models.Task import RetryAbleTask, TaskBase
+
+from azfn_starter_kit.common.durables.activity_results import add_retries
+from azfn_starter_kit.config.environment import get_settings
+from azfn_starter_kit.utilities.logger import get_logger
+
+
+class BaseEntity:
+    """
+    A class that provides settings, logging, and the data lake layer paths to the inheriting classes.
+
+    It does not create any storage client, which keeps it cheap to instantiate for orchestrators, which are
+    replayed many times per run, and for triggers. Classes doing I/O should inherit from CoreEntity instead.
+
+    Attributes:
+        settings (Settings): An object containing the application-wide settings.
+        logger (Logger): A logger object, configured specifically for the inheriting class.
+
+    """
+
+    def __init__(self) -> None:
+        self.settings = get_settings()
+        self.logger = get_logger(self.__class__.__name__)
+        if type(self) is BaseEntity:
+            self.logger.warning("%s should not be instantiated directly.", __name__)
+
+    @property
+    def raw_path(self) -> str:
+        return self.settings.DLS_SETTINGS.RAW_PATH
+
+    @property
+    def transformed_path(self) -> str:
+        return self.settings.DLS_SETTINGS.TRANSFORMED_PATH
+
+    @property
+    def computed_path(self) -> str:
+        return self.settings.DLS_SETTINGS.COMPUTED_PATH
+
+    def conditional_log(
+        self, context: df.DurableOrchestrationContext, message: str, *args, level: Optional[int] = logging.INFO
+    ):
+        """
+        Log a message conditionally if the context is not replaying.
+
+        Parameters:
+        - context (df.DurableOrchestrationContext): The durable orchestration context.
+        - message (str): Message string to be logged.
+        - args: Additional arguments.
+        - level (int, optional): The logging level (e.g., logging.INFO, logging.ERROR). Defaults to logging.INFO.
+        """
+        if not context.is_replaying:
+            log_method = self.logger.info
+            if level:
+                log_method = getattr(self.logger, logging.getLevelName(level).lower(), self.logger.info)
+            log_method(message, *args, extra={"run_id": context.instance_id})
+
+    def call_activity(self, context: df.DurableOrchestrationContext, activity_name: str, input_: dict) -> TaskBase:
+        """
+        Schedule an activity, with the retry policy configured for it in the orchestration settings, if any. The
+        instance id of the orchestration is added to the input as `run_id`, for the activity to log it.
+
+        Args:
+            context (df.DurableOrchestrationContext): The durable orchestration context.
+            activity_name (str): The name of the activity function.
+            input_ (dict): The input of the activity.
+
+        Returns:
+            TaskBase: The task of the activity.
+        """
+        input_ = {**input_, "run_id": context.instance_id}
+        policy = self.settings.ORCHESTRATION_SETTINGS.RETRY_POLICIES.get(activity_name)
+        if policy is None:
+            return context.call_activity(activity_name, input_)
+        retry_options = df.RetryOptions(policy.FIRST_RETRY_INTERVAL_MS, policy.MAX_NUMBER_OF_ATTEMPTS)
+        return context.call_activity_with_retry(activity_name, retry_options, input_)
+
+    @staticmethod
+    def durable_retries(task: TaskBase) -> int:
+        """Return the number of times a completed activity task was retried by its retry policy."""
+        return task.num_attempts - 1 if isinstance(task, RetryAbleTask) else 0
+
+    def run_activities(
+        self,
+        context: df.DurableOrchestrationContext,
+        activity_name: str,
+        inputs: List[dict],
+        max_concurrency: Optional[int] = None,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> Generator:
+        tasks: Dict[int, TaskBase] = {}
+
+        def schedule(index: int) -> TaskBase:
+            tasks[index] = self.call_activity(context, activity_name, inputs[index])
+            return tasks[index]
+
+        outputs_: List[str] = yield from self._fan_out(
+            context, schedule, len(inputs), self._max_concurrency(activity_name, max_concurrency), on_progress
+        )
+        for index, output in enumerate(outputs_):
+            add_retries(output, self.durable_retries(tasks[index]))
+
+        self.conditional_log(context, "%s status: %s", activity_name, outputs_)
+
+        return outputs_
+
+    def run_sub_orchestrators(
+        self,
+        context: df.DurableOrchestrationContext,
+        orchestrator_name: str,
+        inputs: List[dict],
+        instance_ids: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> Generator:
+        instance_ids = instance_ids or [None] * len(inputs)
+        outputs_: list = yield from self._fan_out(
+            context,
+            lambda index: context.call_sub_orchestrator(orchestrator_name, inputs[index], instance_ids[index]),
+            len(inputs),
+            self._max_concurrency(orchestrator_name, max_concurrency),
+            on_progress,
+        )
+
+        self.conditional_log(context, "%s status: %s", orchestrator_name, outputs_)
+
+        return outputs_
+
+    def _max_concurrency(self, function_name: str, max_concurrency: Optional[int]) -> int:
+        if max_concurrency is None:
+            return self.settings.ORCHESTRATION_SETTINGS.MAX_CONCURRENCY.get(function_name, 0)
+        return max_concurrency
+
+    @staticmethod
+    def _fan_out(
+        context: df.DurableOrchestrationContext,
+        schedule: Callable[[int], TaskBase],
+        count: int,
+        max_concurrency: int,
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> Generator:
+        """
+        Run `count` tasks and return their results in order, keeping at most `max_concurrency` of them in flight.
+
+        Without a limit, or when it is not reached, every task is scheduled at once with a single `task_all`.
+        Otherwise a window of tasks is scheduled, and each completion reported by `task_any` schedules the next one.
+        As with `task_all`, the first failed task raises its exception.
+
+        Args:
+            context (df.DurableOrchestrationContext): The durable orchestration context.
+            schedule (Callable[[int], TaskBase]): Schedules the task of the given input index.
+            count (int): Number of tasks to run.
+            max_concurrency (int): Maximum number of tasks in flight, 0 for no limit.
+            on_progress (Optional[Callable[[int], None]]): Called with the number of completed tasks after each
+                completion, or once all are completed when they are scheduled at once.
+
+        Returns:
+            list: The results of the tasks, in input order.
+        """
+        if max_concurrency <= 0 or max_concurrency >= count:
+            outputs = yield context.task_all([schedule(index) for index in range(count)])
+            if on_progress is not None:
+                on_progress(count)
+            return outputs
+
+        outputs = [None] * count
+        in_flight = [(index, schedule(index)) for index in range(max_concurrency)]
+        next_index = max_concurrency
+        while in_flight:
+            finished = yield context.task_any([task for _, task in in_flight])
+            position = next(position for position, (_, task) in enumerate(in_flight) if task is finished)
+            index, _ = in_flight.pop(position)
+            if isinstance(finished.result, Exception):
+                raise finished.result
+            outputs[index] = finished.result
+            if on_progress is not None:
+                on_progress(next_index - len(in_flight))
+            if next_index < count:
+                in_flight.append((next_index, schedule(next_index)))
+                next_index += 1
+        return outputs
@@ -1,14 +1,11 @@
-import logging
-from typing import Generator, List, Optional
+from typing import Optional
 
-import azure.durable_functions as df
+from azfn_starter_kit.common.durables.base_entity import BaseEntity
+from azfn_starter_kit.common.fs.base_file_system import FileSystemClient
+from azfn_starter_kit.common.fs.factory import get_file_system_client
 
-from azfn_starter_kit.common.fs.datalake_file_system import DataLakeGen2FileSystemClient
-from azfn_starter_kit.config.environment import get_settings
-from azfn_starter_kit.utilities.logger import get_logger
 
-
-class CoreEntity:
+class CoreEntity(BaseEntity):
     """
     A class that provides settings, logging, and filesystem access to the inheriting classes.
 
@@ -17,50 +14,26 @@ class CoreEntity:
 
     Attributes:
         settings (Settings): An object containing the application-wide settings.
-        fs_ (DataLakeGen2FileSystemClient): A client to interact with Azure Data Lake storage based on the given
-         settings.
+        fs_ (FileSystemClient): A client to interact with the data lake storage, whose backend (Azure Data Lake,
+         local directory or memory) is chosen by the given settings. It is shared by the whole process and
+         only created on first use.
         logger (Logger): A logger object, configured specifically for the inheriting class.
 
     """
 
     def __init__(self) -> None:
-        self.settings = get_settings()
-        self.fs_ = DataLakeGen2FileSystemClient(
-            self.settings.DLS_SETTINGS.STORAGE_NAME,
-            self.settings.DLS_SETTINGS.CONTAINER_NAME,
-            self.settings.DLS_SETTINGS.RAW_PATH,
-            self.settings.DLS_SETTINGS.TRANSFORMED_PATH,
-            self.settings.DLS_SETTINGS.COMPUTED_PATH,
-            self.settings.DLS_SETTINGS.ACCOUNT_KEY,
-        )
-        self.logger = get_logger(self.__class__.__name__)
-        if type(self) is CoreEntity:  
+        super().__init__()
+        self._fs: Optional[FileSystemClient] = None
+        if type(self) is CoreEntity:
             self.logger.warning("%s should not be instantiated directly.", __name__)
 
-    def conditional_log(
-        self, context: df.DurableOrchestrationContext, message: str, *args, level: Optional[int] = logging.INFO
-    ):
-        """
-        Log a message conditionally if the context is not replaying.
-
-        Parameters:
-        - context (df.DurableOrchestrationContext): The durable orchestration context.
-        - message (str): Message string to be logged.
-        - args: Additional arguments.
-        - level (int, optional): The logging level (e.g., logging.INFO, logging.ERROR). Defaults to logging.INFO.
-        """
-        if not context.is_replaying:
-            log_method = self.logger.info
-            if level:
-                log_method = getattr(self.logger, logging.getLevelName(level).lower(), self.logger.info)
-            log_method(message, *args)
-
-    def run_activities(
-        self, context: df.DurableOrchestrationContext, activity_name: str, inputs: List[dict]
-    ) -> Generator:
-        activities_ = [context.call_activity(activity_name, input_) for input_ in inputs]
-        outputs_: List[str] = yield context.task_all(activities_)
-
-        self.conditional_log(context, "%s status: %s", activity_name, outputs_)
+    @property
+    def fs_(self) -> FileSystemClient:
+        """The process-wide file system client of the settings, created on first use."""
+        if self._fs is None:
+            self._fs = get_file_system_client(self.settings.DLS_SETTINGS)
+        return self._fs
 
-        return outputs_
+    @fs_.setter
+    def fs_(self, fs_: FileSystemClient) -> None:
+        self._fs = fs_
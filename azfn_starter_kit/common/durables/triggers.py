@@ -1,34 +1,69 @@
+import hashlib
+import json
 import traceback
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional
 
 import azure.durable_functions as df
 import azure.functions as func
 
-from azfn_starter_kit.common.durables.core_entity import CoreEntity
+from azfn_starter_kit.common.durables.activity_results import failed_cities
+from azfn_starter_kit.common.durables.base_entity import BaseEntity
 
+# Statuses of an instance which still runs, or may resume, and would compete with a new one
+ACTIVE_STATUSES = (
+    df.OrchestrationRuntimeStatus.Pending,
+    df.OrchestrationRuntimeStatus.Running,
+    df.OrchestrationRuntimeStatus.ContinuedAsNew,
+    df.OrchestrationRuntimeStatus.Suspended,
+)
 
-class Trigger(CoreEntity, ABC):
-    def __init__(self, client: df.DurableOrchestrationClient, orchestration_function_name: str) -> None:
+
+class Trigger(BaseEntity, ABC):
+    def __init__(
+        self, client: df.DurableOrchestrationClient, orchestration_function_name: str, singleton: bool = False
+    ) -> None:
         """
         Initialize a Trigger object.
 
         :param orchestration_function_name: The name of the orchestration function to trigger.
+        :param singleton: Whether to start the orchestration under a deterministic instance id, and not at all
+            while an instance with this id is active.
         """
         super().__init__()
         self.client = client
         self.orchestration_function_name = orchestration_function_name
+        self.singleton = singleton
 
     @abstractmethod
     async def start(self):
         pass 
 
+    def _singleton_instance_id(self, client_input: Optional[dict]) -> str:
+        """
+        The deterministic instance id of a run: one per orchestrator, and one per set of cities when the input
+        restricts the run to some cities, whatever the other parameters and the order of the cities.
+        """
+        cities = (client_input or {}).get("cities")
+        if not cities:
+            return self.orchestration_function_name
+        digest = hashlib.sha256(json.dumps(sorted(set(cities))).encode()).hexdigest()[:16]
+        return f"{self.orchestration_function_name}:{digest}"
+
+    async def _is_active(self, instance_id: str) -> bool:
+        status = await self.client.get_status(instance_id)
+        return bool(status) and status.runtime_status in ACTIVE_STATUSES
+
 
 class TimerTrigger(Trigger):
     def __init__(
-        self, client: df.DurableOrchestrationClient, orchestration_function_name: str, timer_request: func.TimerRequest
+        self,
+        client: df.DurableOrchestrationClient,
+        orchestration_function_name: str,
+        timer_request: func.TimerRequest,
+        singleton: bool = False,
     ) -> None:
-        super().__init__(client, orchestration_function_name)
+        super().__init__(client, orchestration_function_name, singleton)
         self.timer_request = timer_request
 
     async def start(
@@ -40,6 +75,11 @@ class TimerTrigger(Trigger):
             if self.timer_request.past_due:
                 self.logger.info("The timer is past due!")
             else:
+                if self.singleton:
+                    instance_id = instance_id or self._singleton_instance_id(client_input)
+                    if await self._is_active(instance_id):
+                        self.logger.info("The orchestration %s is still running, not starting another one", instance_id)
+                        return
                 instance_id = await self.client.start_new(
                     self.orchestration_function_name, instance_id=instance_id, client_input=client_input
                 )
@@ -59,27 +99,45 @@ class HttpTrigger(Trigger):
         orchestration_function_name: str,
         http_request: func.HttpRequest,
         request_params: Optional[List[str]] = None,
+        optional_params: Optional[List[str]] = None,
+        singleton: bool = False,
     ) -> None:
-        super().__init__(client, orchestration_function_name)
+        super().__init__(client, orchestration_function_name, singleton)
         self.http_request = http_request
         self.request_params = request_params
+        self.optional_params = optional_params
 
     def _validate_request(self) -> dict:
         """Validates the request and returns the parsed request body.
 
+        A request without body is valid when only optional parameters are expected.
+
         Raises:
             ValueError: If there's no valid body in the request.
             InvalidBodyException: If the request body doesn't contain the required parameters.
         """
-        if self.request_params is None:
+        if self.request_params is None and self.optional_params is None:
             return {}
 
-        request_body: dict = self.http_request.get_json()
-        if any(param not in request_body.keys() for param in self.request_params):
+        try:
+            request_body: dict = self.http_request.get_json()
+        except ValueError:
+            if self.request_params:
+                raise
+            return {}
+        if any(param not in request_body.keys() for param in self.request_params or []):
             raise InvalidBodyException(f"Your request body doesn't contain {self.request_params} parameters")
 
         return request_body
 
+    async def _build_client_input(self, request_body: dict) -> dict:
+        """Build the input of the orchestration from the request body, which is passed as is by default.
+
+        Raises:
+            InvalidBodyException: If the orchestration cannot be started from this request.
+        """
+        return request_body
+
     async def start(
         self,
         instance_id: Optional[str] = None,
@@ -92,13 +150,58 @@ class HttpTrigger(Trigger):
             return func.HttpResponse(str(invalid_body_exc), status_code=400)
 
         try:
+            client_input = await self._build_client_input(request_body)
+            if self.singleton:
+                instance_id = instance_id or self._singleton_instance_id(client_input)
+                if await self._is_active(instance_id):
+                    self.logger.info("The orchestration '%s' is still running, not starting another one.", instance_id)
+                    return self.client.create_check_status_response(self.http_request, instance_id)
             instance_id = await self.client.start_new(
-                self.orchestration_function_name, instance_id=instance_id, client_input=request_body
+                self.orchestration_function_name, instance_id=instance_id, client_input=client_input
             )
             self.logger.info("Started orchestration with ID = '%s'.", instance_id)
 
             status: func.HttpResponse = self.client.create_check_status_response(self.http_request, instance_id)
             return status
 
+        except InvalidBodyException as invalid_body_exc:
+            return func.HttpResponse(str(invalid_body_exc), status_code=400)
         except Exception as catched_exc: 
             return func.HttpResponse(str(catched_exc) + ": \n" + traceback.format_exc(), status_code=400)
+
+
+def _decoded(value: Any) -> Any:
+    """The status API may return the input and output of an orchestration as serialized JSON."""
+    return json.loads(value) if isinstance(value, str) else value
+
+
+class RerunFailuresTrigger(HttpTrigger):
+    """
+    Start an orchestration again for the cities which failed in a previous, completed, instance.
+
+    The request body holds the `instance_id` of that instance, whose output is a list of {"city", "results"}.
+    The new instance gets the same input, restricted to the failed cities.
+    """
+
+    def __init__(
+        self,
+        client: df.DurableOrchestrationClient,
+        orchestration_function_name: str,
+        http_request: func.HttpRequest,
+        singleton: bool = False,
+    ) -> None:
+        super().__init__(
+            client, orchestration_function_name, http_request, request_params=["instance_id"], singleton=singleton
+        )
+
+    async def _build_client_input(self, request_body: dict) -> dict:
+        instance_id = request_body["instance_id"]
+        status = await self.client.get_status(instance_id)
+        if not status or status.runtime_status != df.OrchestrationRuntimeStatus.Completed:
+            raise InvalidBodyException(f"The orchestration {instance_id} is not completed")
+
+        cities = failed_cities(_decoded(status.output) or [])
+        if not cities:
+            raise InvalidBodyException(f"The orchestration {instance_id} has no failed city to re-run")
+        self.logger.info("Re-running %s failed cities of %s: %s", len(cities), instance_id, cities)
+        return {**(_decoded(status.input_) or {}), "cities": cities}
@@ -0,0 +1,585 @@
+import asyncio
+import functools
+import posixpath
+import re
+from typing import IO, AsyncIterable, Awaitable, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+from azure.core.exceptions import ResourceNotFoundError
+from azure.identity.aio import DefaultAzureCredential
+from azure.storage.blob.aio import ContainerClient
+from azure.storage.filedatalake import ContentSettings
+from azure.storage.filedatalake.aio import DataLakeServiceClient
+from azfn_starter_kit.common.fs.base_file_system import (
+    DEFAULT_BLOCK_SIZE,
+    DEFAULT_CSV_CHUNK_ROWS,
+    DEFAULT_MAX_CONCURRENCY,
+    FileInfo,
+    UploadPayload,
+    iter_blocks,
+    iter_csv_chunks,
+    latest_matching_file,
+    newest_partitions,
+    partition_path,
+    transfer_arguments,
+)
+from azfn_starter_kit.common.fs.compression import (
+    compressed_file_name,
+    compression_from_name,
+    decompressing_reader,
+    new_compressor,
+)
+from azfn_starter_kit.common.fs.datalake_file_system import (
+    STORAGE_SCOPE,
+    BufferWriter,
+    copy_source,
+    service_client_credential,
+)
+from azfn_starter_kit.utilities.file_system import PARTITION_KEYS, path_builder
+from azfn_starter_kit.utilities.logger import get_logger
+
+AsyncUploadPayload = Union[UploadPayload, AsyncIterable[Union[str, bytes]]]
+
+
+@functools.lru_cache(maxsize=None)
+def get_async_credential() -> DefaultAzureCredential:
+    """Return the process-wide asynchronous Azure AD credential, shared as `get_credential` is by the sync clients.
+
+    It is bound to the event loop of its first token request, which is the single loop of a function worker.
+    """
+    return DefaultAzureCredential()
+
+
+class AsyncDataLakeGen2FileSystemClient:
+    """
+    Asynchronous client for interacting with Azure Data Lake Storage Gen2 file system.
+
+    It mirrors the API of DataLakeGen2FileSystemClient with coroutines, so that many reads and writes can
+    run concurrently under a single event loop. All network calls of the client share a semaphore of
+    `max_concurrency` slots, and parsing or serializing DataFrames is offloaded to a worker thread so that
+    it does not block the event loop.
+
+    Unlike the sync clients, it has no read cache, reads parquet files with a single download rather than
+    ranged reads, and only copies or moves files from another asynchronous data lake client.
+
+    Use it as an async context manager, or call `close` once done, to release the connections.
+
+    Args:
+        storage_name (str): The name of the Azure Data Lake Storage Gen2 account.
+        container_name (str): The name of the container (often referred as file system) within the storage account.
+        raw_path (str): The raw path to be used.
+        transformed_path (str): The transformed path to be used.
+        computed_path (str): The computed path to be used.
+        storage_account_key (Optional[str]): The access key for the storage account.
+            If provided, it will be used for authentication.
+        service_client (Optional[DataLakeServiceClient]): The asynchronous service client to be used.
+            If not provided, a new instance will be created.
+        max_concurrency (int): Maximum number of network calls in flight across the client.
+        block_size (int): Size in bytes of the blocks a payload is split into during an upload.
+    """
+
+    BASE_URL = "https://{}.dfs.core.windows.net"
+    BLOB_URL = "https://{}.blob.core.windows.net"
+
+    def __init__(
+        self,
+        storage_name: str,
+        container_name: str,
+        raw_path: str,
+        transformed_path: str,
+        computed_path: str,
+        storage_account_key: Optional[str] = None,
+        service_client: Optional[DataLakeServiceClient] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ):
+        self.logger = get_logger(__name__)
+        self.storage_name = storage_name
+        self.container_name = container_name
+        self.raw_path = raw_path
+        self.transformed_path = transformed_path
+        self.computed_path = computed_path
+        self.max_concurrency = max(1, max_concurrency)
+        self.block_size = block_size
+        self._storage_account_key = storage_account_key
+        self._credential = None
+        self._blob_container_client: Optional[ContainerClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        if storage_account_key:
+            self._credential = {"account_name": storage_name, "account_key": storage_account_key}
+        if service_client is None:
+            if self._credential is None:
+                self._credential = get_async_credential()
+            service_client = DataLakeServiceClient(self.BASE_URL.format(storage_name), credential=self._credential)
+        elif self._credential is None:
+            self._credential = service_client_credential(service_client)
+            if isinstance(self._credential, dict):
+                self._storage_account_key = self._credential["account_key"]
+        self.service_client = service_client
+        self.fs_client = service_client.get_file_system_client(container_name)
+
+    async def __aenter__(self) -> "AsyncDataLakeGen2FileSystemClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying clients. The shared credential is kept for the other clients of the process."""
+        await self.service_client.close()
+        if self._blob_container_client is not None:
+            await self._blob_container_client.close()
+
+    @property
+    def blob_container_client(self) -> ContainerClient:
+        """Blob endpoint client of the container, used for server-side copies."""
+        if self._blob_container_client is None:
+            self._blob_container_client = ContainerClient(
+                self.BLOB_URL.format(self.storage_name), self.container_name, credential=self._credential
+            )
+        return self._blob_container_client
+
+    async def _limited(self, awaitable: Awaitable):
+        """Await a network call once a concurrency slot is available."""
+        if self._semaphore is None:
+            # Created lazily so that it binds to the running event loop.
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await awaitable
+
+    async def _aiter_blocks(self, data: AsyncUploadPayload):
+        if not hasattr(data, "__aiter__"):
+            for block in iter_blocks(data, self.block_size):
+                yield block
+            return
+
+        buffer = bytearray()
+        async for chunk in data:
+            buffer += chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            while len(buffer) >= self.block_size:
+                yield bytes(buffer[: self.block_size])
+                del buffer[: self.block_size]
+        if buffer:
+            yield bytes(buffer)
+
+    async def _acompress_blocks(self, data: AsyncUploadPayload, compression: str):
+        """Compress the blocks of a payload lazily, in a worker thread so as not to block the event loop."""
+        compressor = new_compressor(compression)
+        async for block in self._aiter_blocks(data):
+            chunk = await asyncio.to_thread(compressor.compress, block)
+            if chunk:
+                yield chunk
+        yield compressor.flush()
+
+    async def _upload(self, file_client, data: AsyncUploadPayload) -> dict:
+        """Append a payload to a freshly created file and commit it, appending its blocks concurrently.
+
+        Args:
+            file_client (DataLakeFileClient): Asynchronous client of the file to upload to.
+            data (AsyncUploadPayload): String, bytes, stream, iterator or async iterator of chunks.
+
+        Returns:
+            dict: The response of the final flush.
+        """
+        offset = 0
+        pending: set = set()
+        async for block in self._aiter_blocks(data):
+            if len(pending) >= self.max_concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+            append = file_client.append_data(data=block, offset=offset, length=len(block))
+            pending.add(asyncio.ensure_future(self._limited(append)))
+            offset += len(block)
+        if pending:
+            done, _ = await asyncio.wait(pending)
+            for task in done:
+                task.result()
+        return await self._limited(file_client.flush_data(offset))
+
+    async def _write(
+        self, path: str, file_name: str, data: AsyncUploadPayload, content_encoding: Optional[str] = None
+    ) -> None:
+        directory_client = self.fs_client.get_directory_client(path)
+        if content_encoding is None:
+            create_file = directory_client.create_file(file_name)
+        else:
+            create_file = directory_client.create_file(
+                file_name, content_settings=ContentSettings(content_encoding=content_encoding)
+            )
+        file_client = await self._limited(create_file)
+        await self._upload(file_client, data)
+
+    async def read_bytes(self, path: str, file_name: str) -> memoryview:
+        """Download a file into a single pre-sized buffer, fetching its ranges concurrently.
+
+        Args:
+            path (str): Directory path where the file is located.
+            file_name (str): Name of the file.
+
+        Returns:
+            memoryview: A view over the downloaded content.
+        """
+        file_client = self.fs_client.get_file_client(path_builder(path, file_name))
+        downloader = await self._limited(
+            file_client.download_file(max_concurrency=self.max_concurrency, decompress=False)
+        )
+        buffer = bytearray(downloader.size)
+        await self._limited(downloader.readinto(BufferWriter(memoryview(buffer))))
+        return memoryview(buffer)
+
+    async def _open_buffer(self, path: str, file_name: str) -> pa.BufferReader:
+        return pa.BufferReader(pa.py_buffer(await self.read_bytes(path, file_name)))
+
+    async def _open_decompressed(self, path: str, file_name: str) -> IO:
+        """Open a file, decompressing it on the fly when its extension names a compression codec."""
+        stream = await self._open_buffer(path, file_name)
+        compression = compression_from_name(file_name)
+        return stream if compression is None else decompressing_reader(stream, compression)
+
+    async def _list_children(self, path: str, directories: bool) -> List[str]:
+        async def list_paths() -> List[str]:
+            return [
+                p.name.removeprefix(path + "/")
+                async for p in self.fs_client.get_paths(path=path, recursive=False)
+                if bool(p.is_directory) == directories
+            ]
+
+        return await self._limited(list_paths())
+
+    async def list_files(
+        self, path: str, pattern: Optional[str] = None, min_blob_size: int = 0, descending_sort: bool = False
+    ) -> List[str]:
+        """Get a list of file names in the specified directory.
+
+        Args:
+            path (str): Directory path to search for files.
+            pattern (str, optional): Regular expression pattern to match file names. Defaults to None.
+            min_blob_size (int, optional): Minimum size of the blob content in bytes for a
+            file to be included in the list. Defaults to 0.
+            descending_sort(bool): If true, sort files in desc order
+
+        Returns:
+            List[str]: A list of file names in the directory that match the pattern and minimum blob size criteria.
+        """
+
+        async def list_paths() -> List[str]:
+            return [
+                p.name.removeprefix(path + "/")
+                async for p in self.fs_client.get_paths(path=path)
+                if p.content_length >= min_blob_size
+            ]
+
+        directory_content = await self._limited(list_paths())
+        if pattern is not None:
+            directory_content = [path for path in directory_content if re.match(pattern, path)]
+        return sorted(directory_content, reverse=descending_sort)
+
+    async def list_file_infos(self, path: str) -> List[FileInfo]:
+        """List the files of a directory and its sub-directories, with their size and last modification time.
+
+        Args:
+            path (str): Directory path to search for files.
+
+        Returns:
+            List[FileInfo]: The files found, named relatively to `path`.
+        """
+
+        async def list_paths() -> List[FileInfo]:
+            return [
+                FileInfo(p.name.removeprefix(path + "/"), p.content_length, p.last_modified)
+                async for p in self.fs_client.get_paths(path=path)
+                if not p.is_directory
+            ]
+
+        return await self._limited(list_paths())
+
+    async def latest_file(self, path: str, pattern: Optional[str] = None) -> str:
+        """Get the most recent file of a directory, descending into its newest date partition if any.
+
+        When a partition holds no matching file, the next older one is searched.
+
+        Args:
+            path (str): Directory path to search for files.
+            pattern (str, optional): Regular expression pattern to match file names. Defaults to None.
+
+        Returns:
+            str: The path of the latest file, relative to `path`.
+
+        Raises:
+            FileNotFoundError: If no file matches the pattern.
+        """
+        latest = await self._latest_in_partition(path, "", 0, pattern)
+        if latest is None:
+            raise FileNotFoundError(f"No file matching '{pattern}' found in '{path}'")
+        return latest
+
+    async def _latest_in_partition(
+        self, path: str, partition: str, depth: int, pattern: Optional[str]
+    ) -> Optional[str]:
+        current_path = partition_path(path, partition)
+        if depth < len(PARTITION_KEYS):
+            partitions = newest_partitions(await self._list_children(current_path, directories=True), depth)
+            if partitions:
+                for name in partitions:
+                    latest = await self._latest_in_partition(path, partition_path(partition, name), depth + 1, pattern)
+                    if latest is not None:
+                        return latest
+                return None
+        return latest_matching_file(await self._list_children(current_path, directories=False), pattern, partition)
+
+    async def write_csv(
+        self,
+        path: str,
+        file_name: str,
+        separator: str,
+        data: Union[pd.DataFrame, Iterable[List[str]]],
+        chunk_rows: int = DEFAULT_CSV_CHUNK_ROWS,
+    ) -> None:
+        """Put the contents of a DataFrame or list of lists as a CSV file in the specified directory.
+
+        Chunks of `chunk_rows` rows are encoded in a worker thread and uploaded as soon as they are ready.
+
+        Args:
+            path (str): Directory path where the CSV file will be created.
+            file_name (str): Name of the CSV file.
+            separator (str): Separator to use for CSV file (e.g., ',' or ';').
+            data (Union[pd.DataFrame, Iterable[List[str]]]): Data to write to the CSV file.
+            chunk_rows (int): Number of rows encoded at a time.
+        """
+        chunks = iter_csv_chunks(data, separator, chunk_rows)
+
+        async def encode_chunks():
+            while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                yield chunk
+
+        await self._write(path, file_name, encode_chunks())
+
+    async def read_csv(self, path: str, file_name: str, separator: str = ",", **kwargs) -> pd.DataFrame:
+        """Read the contents of a CSV file from the specified directory and return as a DataFrame.
+
+        Files with a compression extension (`.gz`, `.zst`) are decompressed while they are parsed.
+
+        Args:
+            path (str): Directory path where the CSV file is located.
+            file_name (str): Name of the CSV file.
+            separator (str): Separator used in the CSV file (e.g., ',' or ';').
+            **kwargs: Additional keyword arguments to pass to pandas read_csv function.
+        """
+        stream = await self._open_decompressed(path, file_name)
+        return await asyncio.to_thread(
+            pd.read_csv, filepath_or_buffer=stream, sep=separator, engine="python", **kwargs
+        )
+
+    async def write_parquet(
+        self,
+        path: str,
+        file_name: str,
+        data_frame: pd.DataFrame,
+        sort_by: Optional[List[str]] = None,
+        row_group_size: Optional[int] = None,
+    ) -> int:
+        """Write a DataFrame's contents into a Parquet file in the specified directory.
+
+        Args:
+            path (str): Directory path where the Parquet file will be created.
+            file_name (str): Name of the Parquet file.
+            data_frame (pd.DataFrame): DataFrame containing the data to be written.
+            sort_by (Optional[List[str]]): Columns to sort the rows by before writing. Defaults to None.
+            row_group_size (Optional[int]): Maximum number of rows per row group. Defaults to the pyarrow one.
+
+        Returns:
+            int: The size of the Parquet file, in bytes.
+        """
+        if sort_by:
+            data_frame = data_frame.sort_values(sort_by, ignore_index=True)
+        file_contents = await asyncio.to_thread(
+            data_frame.to_parquet, use_dictionary=False, write_statistics=True, row_group_size=row_group_size
+        )
+        await self._write(path, file_name, file_contents)
+        return len(file_contents)
+
+    async def read_parquet(
+        self,
+        path: str,
+        file_name: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Tuple]] = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """Read the contents of a Parquet file as a DataFrame.
+
+        Args:
+            path (str): Directory path where the Parquet file is located.
+            file_name (str): Name of the Parquet file.
+            columns (Optional[List[str]]): Columns to read. Defaults to all of them.
+            filters (Optional[List[Tuple]]): Row filters in the pyarrow format. Defaults to None.
+            **kwargs: Additional keyword arguments to pass to pd.read_parquet().
+        """
+        stream = await self._open_buffer(path, file_name)
+        return await asyncio.to_thread(pd.read_parquet, path=stream, columns=columns, filters=filters, **kwargs)
+
+    async def write_file(
+        self, path: str, file_name: str, content: AsyncUploadPayload, compression: Optional[str] = None
+    ) -> str:
+        """Write the contents into a file in the specified directory.
+
+        When a compression codec is given, the content is compressed block by block while it is uploaded and
+        the extension of the codec is appended to the file name (`.gz` for gzip, `.zst` for zstd).
+
+        Args:
+            path (str): Directory path where the file will be created.
+            file_name (str): Name of the file.
+            content (AsyncUploadPayload): The content to be written to the file. Can be a string, bytes,
+            a stream, an iterator or an async iterator of chunks.
+            compression (Optional[str]): Compression codec, "gzip" or "zstd". Defaults to None.
+
+        Returns:
+            str: The name of the written file.
+        """
+        if compression is None:
+            await self._write(path, file_name, content)
+            return file_name
+
+        file_name = compressed_file_name(file_name, compression)
+        await self._write(path, file_name, self._acompress_blocks(content, compression), content_encoding=compression)
+        return file_name
+
+    async def read_json(self, path: str, file_name: str, **kwargs) -> pd.DataFrame:
+        """Read the contents of a JSON file as a DataFrame.
+
+        Files with a compression extension (`.gz`, `.zst`) are decompressed while they are parsed.
+
+        Args:
+            path (str): Directory path where the JSON file is located.
+            file_name (str): Name of the JSON file.
+            **kwargs: Additional keyword arguments to pass to pd.read_json().
+        """
+        stream = await self._open_decompressed(path, file_name)
+        return await asyncio.to_thread(pd.read_json, path_or_buf=stream, **kwargs)
+
+    async def delete_file(self, path: str, file_name: str) -> None:
+        """Delete a file from the specified directory in the Data Lake Gen2 file system.
+
+        Args:
+            path (str): Directory path where the file is located.
+            file_name (str): Name of the file to be deleted.
+        """
+        file_client = self.fs_client.get_file_client(path_builder(path, file_name))
+        await self._limited(file_client.delete_file())
+
+    async def delete_files(self, path: str, files_name: List[str]) -> None:
+        """Delete files of a directory concurrently, within the concurrency limit of the client.
+
+        Args:
+            path (str): Directory path where the files are located.
+            files_name (List[str]): Names of the files to delete, relative to `path`.
+        """
+        arguments = [posixpath.split(path_builder(path, file_name)) for file_name in files_name]
+        await asyncio.gather(*(self.delete_file(*args) for args in arguments))
+
+    async def delete_directory(self, directory: str) -> None:
+        """Delete a directory from the Data Lake Gen2 file system.
+
+        Args:
+            directory (str): Directory path to be deleted.
+        """
+        directory_client = self.fs_client.get_directory_client(directory)
+        await self._limited(directory_client.delete_directory())
+
+    async def _source_url(self, file_path: str) -> Tuple[str, Optional[str]]:
+        url, token_credential = copy_source(
+            self.BLOB_URL.format(self.storage_name),
+            self.storage_name,
+            self.container_name,
+            file_path,
+            self._storage_account_key,
+            self._credential,
+        )
+        if token_credential is None:
+            return url, None
+        access_token = await token_credential.get_token(STORAGE_SCOPE)
+        return url, f"Bearer {access_token.token}"
+
+    async def _copy_file(
+        self, source_fs: "AsyncDataLakeGen2FileSystemClient", src_file_path: str, dest_file_path: str
+    ) -> None:
+        source_url, source_authorization = await source_fs._source_url(src_file_path)
+        blob_client = self.blob_container_client.get_blob_client(dest_file_path)
+        if source_authorization:
+            copy = blob_client.upload_blob_from_url(
+                source_url, overwrite=True, source_authorization=source_authorization
+            )
+        else:
+            copy = blob_client.upload_blob_from_url(source_url, overwrite=True)
+        await self._limited(copy)
+
+    async def _move_file(
+        self, source_fs: "AsyncDataLakeGen2FileSystemClient", src_file_path: str, dest_file_path: str
+    ) -> None:
+        file_client = source_fs.fs_client.get_file_client(src_file_path)
+        if source_fs.storage_name == self.storage_name:
+            new_name = f"{self.container_name}/{dest_file_path}"
+            try:
+                await self._limited(file_client.rename_file(new_name))
+            except ResourceNotFoundError:
+                # A rename does not create the parent directories of its destination.
+                dest_directory = posixpath.dirname(dest_file_path)
+                if not dest_directory:
+                    raise
+                await self._limited(self.fs_client.get_directory_client(dest_directory).create_directory())
+                await self._limited(file_client.rename_file(new_name))
+        else:
+            await self._copy_file(source_fs, src_file_path, dest_file_path)
+            await source_fs._limited(file_client.delete_file())
+
+    async def copy_files(
+        self,
+        src_path: str,
+        dest_path: str,
+        files_name: list,
+        source_fs: Optional["AsyncDataLakeGen2FileSystemClient"] = None,
+        dest_files_name: Optional[list] = None,
+    ) -> None:
+        """Copy specified files server-side from a source directory to a destination directory, concurrently.
+
+        Args:
+            src_path (str): Source directory path.
+            dest_path (str): Destination directory path.
+            files_name (list): List of file names to copy.
+            source_fs (AsyncDataLakeGen2FileSystemClient, optional): Source file system client if copying
+            from another file system. Defaults to None.
+            dest_files_name (list, optional): Names of the copies, in the order of `files_name`.
+            Defaults to None (same names as the sources).
+        """
+        source_fs = source_fs or self
+        arguments = transfer_arguments(src_path, dest_path, files_name, dest_files_name)
+        await asyncio.gather(*(self._copy_file(source_fs, src, dest) for src, dest in arguments))
+
+    async def move_files(
+        self,
+        src_path: str,
+        dest_path: str,
+        files_name: list,
+        source_fs: Optional["AsyncDataLakeGen2FileSystemClient"] = None,
+        dest_files_name: Optional[list] = None,
+    ) -> None:
+        """Move specified files from a source directory to a destination directory, concurrently.
+
+        Within an account, files are renamed. Across accounts, they are copied server-side and the sources
+        are deleted.
+
+        Args:
+            src_path (str): Source directory path.
+            dest_path (str): Destination directory path.
+            files_name (list): List of file names to move.
+            source_fs (AsyncDataLakeGen2FileSystemClient, optional): Source file system client if moving
+            from another file system. Defaults to None.
+            dest_files_name (list, optional): Names of the moved files, in the order of `files_name`.
+            Defaults to None (same names as the sources).
+        """
+        source_fs = source_fs or self
+        arguments = transfer_arguments(src_path, dest_path, files_name, dest_files_name)
+        await asyncio.gather(*(self._move_file(source_fs, src, dest) for src, dest in arguments))
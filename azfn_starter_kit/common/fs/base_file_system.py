@@ -0,0 +1,525 @@
+import datetime
+import posixpath
+import re
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+
+from azfn_starter_kit.common.fs.compression import (
+    compress_blocks,
+    compressed_file_name,
+    compression_from_name,
+    decompressing_reader,
+)
+from azfn_starter_kit.utilities.file_system import PARTITION_KEYS, path_builder
+
+
+class FileInfo(NamedTuple):
+    """Name, relative to the listed directory, size in bytes and last modification time of a file."""
+
+    name: str
+    size: int
+    last_modified: datetime.datetime
+
+
+UploadPayload = Union[str, bytes, bytearray, memoryview, IO, Iterable[Union[str, bytes]]]
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+DEFAULT_CSV_CHUNK_ROWS = 50_000
+
+
+def iter_blocks(data: UploadPayload, block_size: int) -> Iterator[bytes]:
+    """Split a payload into blocks of at most `block_size` bytes.
+
+    Bytes-like payloads are sliced directly, streams are read block by block and iterators are
+    re-buffered so that small chunks are coalesced into full blocks.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        view = memoryview(data)
+        for start in range(0, len(view), block_size):
+            yield bytes(view[start : start + block_size])
+        return
+
+    chunks = _iter_stream(data, block_size) if hasattr(data, "read") else iter(data)
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        while len(buffer) >= block_size:
+            yield bytes(buffer[:block_size])
+            del buffer[:block_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def iter_csv_chunks(
+    data: Union[pd.DataFrame, Iterable[List[str]]], separator: str, chunk_rows: int = DEFAULT_CSV_CHUNK_ROWS
+) -> Iterator[str]:
+    """Encode a DataFrame or rows of strings as CSV, `chunk_rows` rows at a time.
+
+    DataFrames are encoded slice by slice with the vectorized pandas writer, the header being written with the
+    first slice only. Rows of strings are joined by separator, without a trailing newline.
+    """
+    if isinstance(data, pd.DataFrame):
+        for start in range(0, max(len(data), 1), chunk_rows):
+            yield data.iloc[start : start + chunk_rows].to_csv(index=False, sep=separator, header=start == 0)
+        return
+
+    lines: List[str] = []
+    first_chunk = True
+    for line in data:
+        lines.append(separator.join(line))
+        if len(lines) >= chunk_rows:
+            yield ("" if first_chunk else "\n") + "\n".join(lines)
+            first_chunk = False
+            lines = []
+    if lines:
+        yield ("" if first_chunk else "\n") + "\n".join(lines)
+
+
+def _iter_stream(stream: IO, block_size: int) -> Iterator[Union[str, bytes]]:
+    while True:
+        chunk = stream.read(block_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def newest_partitions(children: List[str], depth: int) -> List[str]:
+    """Select the date partitions of a level among the names of its sub-directories, newest first.
+
+    Args:
+        children (List[str]): Names of the sub-directories of the level.
+        depth (int): Depth of the level, the partition key being `PARTITION_KEYS[depth]`.
+
+    Returns:
+        List[str]: The partitions of the level, empty past the day level or if the level is not partitioned.
+    """
+    if depth >= len(PARTITION_KEYS):
+        return []
+    return sorted((name for name in children if name.startswith(f"{PARTITION_KEYS[depth]}=")), reverse=True)
+
+
+def partition_path(path: str, partition: str) -> str:
+    """Join a partition, possibly empty, to a path."""
+    return path_builder(path, partition) if partition else path
+
+
+def latest_matching_file(files: List[str], pattern: Optional[str], partition: str = "") -> Optional[str]:
+    """Select the latest of the files matching a pattern and return its path relative to the partition root.
+
+    Args:
+        files (List[str]): Names of the files of the partition.
+        pattern (Optional[str]): Regular expression pattern to match file names. None matches any file.
+        partition (str): Path of the partition holding the files. Defaults to none.
+
+    Returns:
+        Optional[str]: The path of the latest matching file, None if no file matches.
+    """
+    if pattern is not None:
+        files = [file for file in files if re.match(pattern, file)]
+    return partition_path(partition, max(files)) if files else None
+
+
+def transfer_arguments(
+    src_path: str, dest_path: str, files_name: list, dest_files_name: Optional[list]
+) -> List[Tuple[str, str]]:
+    """Pair the source and destination paths of the files of a batch copy or move.
+
+    Raises:
+        ValueError: If the destination names are given but not as many as the source ones.
+    """
+    dest_files_name = dest_files_name or files_name
+    if len(dest_files_name) != len(files_name):
+        raise ValueError("files_name and dest_files_name must have the same length")
+    return [
+        (path_builder(src_path, str(file)), path_builder(dest_path, str(dest_file)))
+        for file, dest_file in zip(files_name, dest_files_name)
+    ]
+
+
+class FileSystemClient(ABC):
+    """
+    Interface of the file systems holding the data lake layers.
+
+    Backends implement the storage primitives (reading and writing raw bytes, listing, deleting), while the
+    file format helpers (parquet, json, csv), the partition-aware lookup and the batch transfers are shared.
+    This lets every pipeline stage run unchanged against the data lake, a local directory or memory.
+
+    Args:
+        raw_path (str): The raw path to be used.
+        transformed_path (str): The transformed path to be used.
+        computed_path (str): The computed path to be used.
+        max_concurrency (int): Maximum number of operations run in parallel by a batch transfer.
+        block_size (int): Size in bytes of the blocks a payload is split into when written.
+    """
+
+    def __init__(
+        self,
+        raw_path: str,
+        transformed_path: str,
+        computed_path: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ):
+        self.raw_path = raw_path
+        self.transformed_path = transformed_path
+        self.computed_path = computed_path
+        self.max_concurrency = max(1, max_concurrency)
+        self.block_size = block_size
+
+    @abstractmethod
+    def read_bytes(self, path: str, file_name: str) -> memoryview:
+        """Read the whole content of a file.
+
+        Args:
+            path (str): Directory path where the file is located.
+            file_name (str): Name of the file.
+
+        Returns:
+            memoryview: A view over the content, which can be handed to parsers without copy.
+        """
+
+    @abstractmethod
+    def _write(self, path: str, file_name: str, data: UploadPayload, content_encoding: Optional[str] = None) -> None:
+        """Create or replace a file with the given payload.
+
+        `content_encoding` names the compression codec of the payload, for backends able to store it as
+        metadata. The file extension always carries it as well.
+        """
+
+    @abstractmethod
+    def _list_children(self, path: str, directories: bool) -> List[str]:
+        """List the names of the direct children of a directory, either its sub-directories or its files."""
+
+    @abstractmethod
+    def list_files(
+        self, path: str, pattern: Optional[str] = None, min_blob_size: int = 0, descending_sort: bool = False
+    ) -> List[str]:
+        """Get a list of file names in the specified directory.
+
+        Args:
+            path (str): Directory path to search for files.
+            pattern (str, optional): Regular expression pattern to match file names. Defaults to None.
+            min_blob_size (int, optional): Minimum size of the blob content in bytes for a
+            file to be included in the list. Defaults to 0.
+            descending_sort(bool): If true, sort files in desc order
+
+        Returns:
+            List[str]: A list of file names in the directory that match the pattern and minimum blob size criteria.
+        """
+
+    @abstractmethod
+    def list_file_infos(self, path: str) -> List[FileInfo]:
+        """List the files of a directory and its sub-directories, with their size and last modification time.
+
+        Args:
+            path (str): Directory path to search for files.
+
+        Returns:
+            List[FileInfo]: The files found, named relatively to `path`.
+        """
+
+    @abstractmethod
+    def delete_file(self, path: str, file_name: str) -> None:
+        """Delete a file from the specified directory.
+
+        Args:
+            path (str): Directory path where the file is located.
+            file_name (str): Name of the file to be deleted.
+        """
+
+    @abstractmethod
+    def delete_directory(self, directory: str) -> None:
+        """Delete a directory and its content.
+
+        Args:
+            directory (str): Directory path to be deleted.
+        """
+
+    def delete_files(self, path: str, files_name: List[str]) -> None:
+        """Delete files of a directory with up to `max_concurrency` deletions in flight.
+
+        Args:
+            path (str): Directory path where the files are located.
+            files_name (List[str]): Names of the files to delete, relative to `path`.
+        """
+        arguments = [posixpath.split(path_builder(path, file_name)) for file_name in files_name]
+        self._run_concurrently(self.delete_file, arguments)
+
+    def _open_buffer(self, path: str, file_name: str) -> pa.BufferReader:
+        """Read a file and wrap it in a zero-copy Arrow reader consumable by pandas parsers."""
+        return pa.BufferReader(pa.py_buffer(self.read_bytes(path, file_name)))
+
+    def _open_decompressed(self, path: str, file_name: str) -> IO:
+        """Open a file, decompressing it on the fly when its extension names a compression codec."""
+        stream = self._open_buffer(path, file_name)
+        compression = compression_from_name(file_name)
+        return stream if compression is None else decompressing_reader(stream, compression)
+
+    def _open_parquet(self, path: str, file_name: str, partial: bool) -> pa.NativeFile:
+        """Open a parquet file for reading.
+
+        `partial` tells that only some columns or row groups are needed, so backends able to read byte ranges
+        can serve the footer and the selected column chunks without fetching the whole file.
+        """
+        return self._open_buffer(path, file_name)
+
+    def latest_file(self, path: str, pattern: Optional[str] = None) -> str:
+        """Get the most recent file of a directory, descending into its newest date partition if any.
+
+        Only the direct children of each level are listed: the newest `year=` partition, then its newest
+        `month=` and `day=` partitions, and finally the files of that single day. When a partition holds no
+        matching file, the next older one is searched, so the cost only grows with the number of empty days
+        at the end of the history. Directories without partitions are listed flat.
+
+        Args:
+            path (str): Directory path to search for files.
+            pattern (str, optional): Regular expression pattern to match file names. Defaults to None.
+
+        Returns:
+            str: The path of the latest file, relative to `path`.
+
+        Raises:
+            FileNotFoundError: If no file matches the pattern.
+        """
+        latest = self._latest_in_partition(path, "", 0, pattern)
+        if latest is None:
+            raise FileNotFoundError(f"No file matching '{pattern}' found in '{path}'")
+        return latest
+
+    def _latest_in_partition(self, path: str, partition: str, depth: int, pattern: Optional[str]) -> Optional[str]:
+        """Search the latest matching file of a partition, walking its sub-partitions newest first."""
+        current_path = partition_path(path, partition)
+        if depth < len(PARTITION_KEYS):
+            partitions = newest_partitions(self._list_children(current_path, directories=True), depth)
+            if partitions:
+                for name in partitions:
+                    latest = self._latest_in_partition(path, partition_path(partition, name), depth + 1, pattern)
+                    if latest is not None:
+                        return latest
+                return None
+        return latest_matching_file(self._list_children(current_path, directories=False), pattern, partition)
+
+    def _run_concurrently(self, function: Callable, arguments: List[tuple]) -> None:
+        """Call a function once per tuple of arguments with up to `max_concurrency` calls in flight."""
+        if len(arguments) <= 1 or self.max_concurrency == 1:
+            for args in arguments:
+                function(*args)
+            return
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for future in [executor.submit(function, *args) for args in arguments]:
+                future.result()
+
+    def _copy_file(self, source_fs: "FileSystemClient", src_file_path: str, dest_file_path: str) -> None:
+        src_path, src_file_name = posixpath.split(src_file_path)
+        dest_path, dest_file_name = posixpath.split(dest_file_path)
+        self._write(dest_path, dest_file_name, source_fs.read_bytes(src_path, src_file_name))
+
+    def _move_file(self, source_fs: "FileSystemClient", src_file_path: str, dest_file_path: str) -> None:
+        self._copy_file(source_fs, src_file_path, dest_file_path)
+        source_fs.delete_file(*posixpath.split(src_file_path))
+
+    def copy_files(
+        self,
+        src_path: str,
+        dest_path: str,
+        files_name: list,
+        source_fs: Optional["FileSystemClient"] = None,
+        dest_files_name: Optional[list] = None,
+    ) -> None:
+        """Copy specified files from a source directory to a destination directory.
+
+        The files of the batch are copied concurrently. When the source is of the same kind, backends copy
+        natively, e.g. server-side within the data lake. Otherwise the content is read and written back.
+
+        Args:
+            src_path (str): Source directory path.
+            dest_path (str): Destination directory path.
+            files_name (list): List of file names to copy.
+            source_fs (FileSystemClient, optional): Source file system client if copying
+            from another file system. Defaults to None.
+            dest_files_name (list, optional): Names of the copies, in the order of `files_name`.
+            Defaults to None (same names as the sources).
+        """
+        source_fs = source_fs or self
+        arguments = transfer_arguments(src_path, dest_path, files_name, dest_files_name)
+        self._run_concurrently(self._copy_file, [(source_fs, src, dest) for src, dest in arguments])
+
+    def move_files(
+        self,
+        src_path: str,
+        dest_path: str,
+        files_name: list,
+        source_fs: Optional["FileSystemClient"] = None,
+        dest_files_name: Optional[list] = None,
+    ) -> None:
+        """Move specified files from a source directory to a destination directory.
+
+        The files of the batch are moved concurrently. When the source is of the same kind, backends move
+        natively, e.g. by renaming within a data lake account. Otherwise the files are copied and the
+        sources are deleted.
+
+        Args:
+            src_path (str): Source directory path.
+            dest_path (str): Destination directory path.
+            files_name (list): List of file names to move.
+            source_fs (FileSystemClient, optional): Source file system client if moving
+            from another file system. Defaults to None.
+            dest_files_name (list, optional): Names of the moved files, in the order of `files_name`.
+            Defaults to None (same names as the sources).
+        """
+        source_fs = source_fs or self
+        arguments = transfer_arguments(src_path, dest_path, files_name, dest_files_name)
+        self._run_concurrently(self._move_file, [(source_fs, src, dest) for src, dest in arguments])
+
+    def write_csv(
+        self,
+        path: str,
+        file_name: str,
+        separator: str,
+        data: Union[pd.DataFrame, Iterable[List[str]]],
+        chunk_rows: int = DEFAULT_CSV_CHUNK_ROWS,
+    ) -> None:
+        """Put the contents of a DataFrame or list of lists as a CSV file in the specified directory.
+
+        The CSV is encoded `chunk_rows` rows at a time and each chunk is uploaded as soon as it is encoded, so
+        memory stays bounded by the chunk size whatever the size of the data.
+
+        Args:
+            path (str): Directory path where the CSV file will be created.
+            file_name (str): Name of the CSV file.
+            separator (str): Separator to use for CSV file (e.g., ',' or ';').
+            data (Union[pd.DataFrame, Iterable[List[str]]]): Data to write to the CSV file.
+            Can be either a pandas DataFrame or a list (or any iterable) of lists.
+            chunk_rows (int): Number of rows encoded at a time.
+
+        Returns:
+            None
+        """
+        self._write(path, file_name, iter_csv_chunks(data, separator, chunk_rows))
+
+    def read_csv(self, path: str, file_name: str, separator: str = ",", **kwargs) -> pd.DataFrame:
+        """Read the contents of a CSV file from the specified directory and return as a DataFrame.
+
+        Args:
+            path (str): Directory path where the CSV file is located.
+            file_name (str): Name of the CSV file.
+            separator (str): Separator used in the CSV file (e.g., ',' or ';').
+            **kwargs: Additional keyword arguments to pass to pandas read_csv function.
+
+        Returns:
+            pd.DataFrame: DataFrame containing the CSV file contents.
+        """
+        stream = self._open_decompressed(path, file_name)
+        df_result = pd.read_csv(filepath_or_buffer=stream, sep=separator, engine="python", **kwargs)
+
+        return df_result
+
+    def write_parquet(
+        self,
+        path: str,
+        file_name: str,
+        data_frame: pd.DataFrame,
+        sort_by: Optional[List[str]] = None,
+        row_group_size: Optional[int] = None,
+    ) -> int:
+        """Write a DataFrame's contents into a Parquet file in the specified directory.
+
+        Column statistics are written for every row group. Sorting the rows on the columns queries filter on
+        keeps the value ranges of the row groups narrow, so that readers can skip most of them.
+
+        Args:
+            path (str): Directory path where the Parquet file will be created.
+            file_name (str): Name of the Parquet file.
+            data_frame (pd.DataFrame): DataFrame containing the data to be written.
+            sort_by (Optional[List[str]]): Columns to sort the rows by before writing. Defaults to None.
+            row_group_size (Optional[int]): Maximum number of rows per row group. Defaults to the pyarrow one.
+
+        Returns:
+            int: The size of the Parquet file, in bytes.
+        """
+        if sort_by:
+            data_frame = data_frame.sort_values(sort_by, ignore_index=True)
+        content = data_frame.to_parquet(use_dictionary=False, write_statistics=True, row_group_size=row_group_size)
+        self._write(path, file_name, content)
+        return len(content)
+
+    def read_parquet(
+        self,
+        path: str,
+        file_name: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Tuple]] = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """Read the contents of a Parquet file as a DataFrame.
+
+        When columns or filters are given, only the selected columns are decoded and the row groups whose
+        statistics do not match the filters are skipped; backends supporting ranged reads then only fetch
+        the footer and the needed column chunks.
+
+        Args:
+            path (str): Directory path where the Parquet file is located.
+            file_name (str): Name of the Parquet file.
+            columns (Optional[List[str]]): Columns to read. Defaults to all of them.
+            filters (Optional[List[Tuple]]): Row filters in the pyarrow format, e.g.
+                `[("date", ">=", "2024-07-01")]`. Defaults to None.
+            **kwargs: Additional keyword arguments to pass to pd.read_parquet().
+
+        Returns:
+            pd.DataFrame: DataFrame containing the data from the Parquet file.
+        """
+        partial = columns is not None or filters is not None
+        source = self._open_parquet(path, file_name, partial)
+        df_result = pd.read_parquet(path=source, columns=columns, filters=filters, **kwargs)
+        return df_result
+
+    def write_file(
+        self, path: str, file_name: str, content: UploadPayload, compression: Optional[str] = None
+    ) -> str:
+        """Write the contents into a file in the specified directory.
+
+        When a compression codec is given, the content is compressed block by block while it is uploaded and
+        the extension of the codec is appended to the file name (`.gz` for gzip, `.zst` for zstd).
+
+        Args:
+            path (str): Directory path where the file will be created.
+            file_name (str): Name of the file.
+            content (UploadPayload): The content to be written to the file. Can be a string, bytes,
+            a stream or an iterator of chunks.
+            compression (Optional[str]): Compression codec, "gzip" or "zstd". Defaults to None.
+
+        Returns:
+            str: The name of the written file.
+        """
+        if compression is None:
+            self._write(path, file_name, content)
+            return file_name
+
+        file_name = compressed_file_name(file_name, compression)
+        blocks = compress_blocks(iter_blocks(content, self.block_size), compression)
+        self._write(path, file_name, blocks, content_encoding=compression)
+        return file_name
+
+    def read_json(self, path: str, file_name: str, **kwargs) -> pd.DataFrame:
+        """Read the contents of a JSON file as a DataFrame.
+
+        Files with a compression extension (`.gz`, `.zst`) are decompressed while they are parsed.
+
+        Args:
+            path (str): Directory path where the JSON file is located.
+            file_name (str): Name of the JSON file.
+            **kwargs: Additional keyword arguments to pass to pd.read_json().
+
+        Returns:
+            pd.DataFrame: DataFrame containing the data from the JSON file.
+        """
+        stream = self._open_decompressed(path, file_name)
+        df_result = pd.read_json(path_or_buf=stream, **kwargs)
+        return df_result
@@ -0,0 +1,81 @@
+import gzip
+import zlib
+from typing import IO, Iterable, Iterator, Optional
+
+# Compression codec -> file extension. The codec name is also the HTTP Content-Encoding of the stored file.
+COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def _zstandard():
+    try:
+        import zstandard  # pylint: disable=import-outside-toplevel
+    except ImportError as import_error:
+        raise ImportError("zstd compression requires the `zstandard` package.") from import_error
+    return zstandard
+
+
+def _check_compression(compression: str) -> None:
+    if compression not in COMPRESSION_EXTENSIONS:
+        raise ValueError(f"Unsupported compression: {compression}")
+
+
+def compressed_file_name(file_name: str, compression: str) -> str:
+    """Append the extension of a compression codec to a file name."""
+    _check_compression(compression)
+    return file_name + COMPRESSION_EXTENSIONS[compression]
+
+
+def compression_from_name(file_name: str) -> Optional[str]:
+    """Return the compression codec of a file from its extension, or None if it is not compressed."""
+    for compression, extension in COMPRESSION_EXTENSIONS.items():
+        if file_name.endswith(extension):
+            return compression
+    return None
+
+
+def strip_compression_suffix(file_name: str) -> str:
+    """Remove the compression extension of a file name, if any, e.g. `file.json.gz` -> `file.json`."""
+    compression = compression_from_name(file_name)
+    return file_name if compression is None else file_name[: -len(COMPRESSION_EXTENSIONS[compression])]
+
+
+def new_compressor(compression: str):
+    """Create a streaming compressor of a codec, exposing `compress(block)` and a final `flush()`."""
+    _check_compression(compression)
+    if compression == "zstd":
+        return _zstandard().ZstdCompressor().compressobj()
+    return zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+
+
+def compress_blocks(blocks: Iterable[bytes], compression: str) -> Iterator[bytes]:
+    """Compress a stream of blocks lazily, so that an upload can start before the whole payload is encoded.
+
+    Args:
+        blocks (Iterable[bytes]): The uncompressed content.
+        compression (str): The codec to use, "gzip" or "zstd".
+
+    Returns:
+        Iterator[bytes]: The compressed content, in chunks.
+    """
+    compressor = new_compressor(compression)
+    for block in blocks:
+        chunk = compressor.compress(block)
+        if chunk:
+            yield chunk
+    yield compressor.flush()
+
+
+def decompressing_reader(stream: IO, compression: str) -> IO:
+    """Wrap a binary stream in a reader decompressing it on the fly.
+
+    Args:
+        stream (IO): The compressed binary stream.
+        compression (str): The codec the stream is compressed with, "gzip" or "zstd".
+
+    Returns:
+        IO: A binary stream of the decompressed content.
+    """
+    _check_compression(compression)
+    if compression == "zstd":
+        return _zstandard().ZstdDecompressor().stream_reader(stream)
+    return gzip.GzipFile(fileobj=stream, mode="rb")
@@ -1,15 +1,167 @@
+import datetime
+import functools
 import io
+import posixpath
 import re
-from typing import List, Optional, Union
-
-import pandas as pd
-from azure.storage.filedatalake import DataLakeServiceClient
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import chain
+from typing import Any, List, Optional, Tuple
+from urllib.parse import quote
+
+import pyarrow as pa
+from azure.core.exceptions import ResourceNotFoundError
+from azure.storage.blob import BlobSasPermissions, ContainerClient, generate_blob_sas
+from azure.storage.filedatalake import ContentSettings, DataLakeServiceClient
 from azure.identity import DefaultAzureCredential
+from azfn_starter_kit.common.fs.base_file_system import (
+    DEFAULT_BLOCK_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    FileInfo,
+    FileSystemClient,
+    UploadPayload,
+    iter_blocks,
+)
+from azfn_starter_kit.common.fs.file_cache import FileCache
 from azfn_starter_kit.utilities.file_system import path_builder
 from azfn_starter_kit.utilities.logger import get_logger
 
+STORAGE_SCOPE = "https://storage.azure.com/.default"
+_SOURCE_SAS_VALIDITY = datetime.timedelta(hours=1)
+
+
+@functools.lru_cache(maxsize=None)
+def get_credential() -> DefaultAzureCredential:
+    """Return the process-wide Azure AD credential, so that its discovery and token cache are shared."""
+    return DefaultAzureCredential()
+
+
+def service_client_credential(service_client) -> Any:
+    """Return the credential of a data lake service client, in a form the blob clients accept.
+
+    A shared key is exposed by the service client as its signing policy, so it is turned back into the
+    account name and key; other credentials, such as token or SAS credentials, are returned as they are.
+    """
+    credential = getattr(service_client, "credential", None)
+    if getattr(credential, "account_key", None):
+        return {"account_name": credential.account_name, "account_key": credential.account_key}
+    return credential
+
+
+def copy_source(
+    account_url: str,
+    storage_name: str,
+    container_name: str,
+    file_path: str,
+    account_key: Optional[str],
+    credential: Any,
+) -> Tuple[str, Any]:
+    """Select how a server-side copy reads its source file.
+
+    The storage service reads the source itself, so the source must carry its own authorization: a short-lived
+    read SAS when the account key is known, an OAuth bearer token of the credential otherwise.
+
+    Args:
+        account_url (str): Blob endpoint of the source account.
+        storage_name (str): Name of the source account.
+        container_name (str): Container of the source file.
+        file_path (str): Path of the source file within its container.
+        account_key (Optional[str]): Access key of the source account, if known.
+        credential (Any): Credential of the source client.
+
+    Returns:
+        Tuple[str, Any]: The source URL, and the token credential whose bearer token must authorize the read,
+        None if the URL carries its own authorization or none is available.
+    """
+    url = f"{account_url}/{container_name}/{quote(file_path)}"
+    if account_key:
+        sas_token = generate_blob_sas(
+            storage_name,
+            container_name,
+            file_path,
+            account_key=account_key,
+            permission=BlobSasPermissions(read=True),
+            expiry=datetime.datetime.now(datetime.timezone.utc) + _SOURCE_SAS_VALIDITY,
+        )
+        return f"{url}?{sas_token}", None
+    return url, credential if hasattr(credential, "get_token") else None
+
+
+class BufferWriter(io.RawIOBase):
+    """Seekable binary writer over a pre-allocated buffer.
+
+    Lets the storage SDK download ranges in parallel directly into their final position, without
+    growing an intermediate stream.
+    """
+
+    def __init__(self, buffer: memoryview):
+        super().__init__()
+        self._buffer = buffer
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        self._position = offset
+        return self._position
+
+    def write(self, data) -> int:
+        size = len(data)
+        self._buffer[self._position : self._position + size] = data
+        self._position += size
+        return size
+
+
+class RangedReader(io.RawIOBase):
+    """Seekable binary reader fetching each read from a data lake file with a ranged request.
+
+    Lets Arrow read the parquet footer and then only the column chunks it needs, instead of the whole file.
+    """
+
+    def __init__(self, file_client, size: int):
+        super().__init__()
+        self._file_client = file_client
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
 
-class DataLakeGen2FileSystemClient:
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._position = offset
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        length = min(len(buffer), self._size - self._position)
+        if length <= 0:
+            return 0
+        downloader = self._file_client.download_file(offset=self._position, length=length, decompress=False)
+        downloader.readinto(BufferWriter(memoryview(buffer)[:length]))
+        self._position += length
+        return length
+
+
+class DataLakeGen2FileSystemClient(FileSystemClient):
     """
     Client for interacting with Azure Data Lake Storage Gen2 file system.
 
@@ -22,15 +174,20 @@ class DataLakeGen2FileSystemClient:
             If not provided, a new instance will be created.
         storage_account_key (Optional[str]): The access key for the storage account.
             If provided, it will be used for authentication.
+        max_concurrency (int): Maximum number of blocks appended, or ranges downloaded, in parallel.
+        block_size (int): Size in bytes of the blocks a payload is split into during an upload.
+        cache (Optional[FileCache]): Read-through cache of downloaded and written files. Defaults to None.
 
     Attributes:
         storage_name (str): The name of the Azure Data Lake Storage Gen2 account.
+        container_name (str): The name of the container.
         raw_path (str): The raw path.
         computed_path (str): The computed path.
         fs_client (FileSystemClient): The file system client for interacting with Data Lake.
     """
 
     BASE_URL = "https://{}.dfs.core.windows.net"
+    BLOB_URL = "https://{}.blob.core.windows.net"
 
     def __init__(
         self,
@@ -41,48 +198,193 @@ class DataLakeGen2FileSystemClient:
         computed_path: str,
         storage_account_key: Optional[str] = None,
         service_client: Optional[DataLakeServiceClient] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        cache: Optional[FileCache] = None,
     ):
+        super().__init__(raw_path, transformed_path, computed_path, max_concurrency, block_size)
         self.logger = get_logger(__name__)
         self.storage_name = storage_name
-        self.raw_path = raw_path
-        self.transformed_path = transformed_path
-        self.computed_path = computed_path
-
+        self.container_name = container_name
+        self.cache = cache
+        self._storage_account_key = storage_account_key
+        self._credential = None
+        self._blob_container_client: Optional[ContainerClient] = None
+
+        if storage_account_key:
+            self._credential = {"account_name": storage_name, "account_key": storage_account_key}
         if service_client is None:
             account_url = self.BASE_URL.format(storage_name)
-            if storage_account_key:
-                service_client = DataLakeServiceClient(account_url, credential={"account_name": storage_name, "account_key": storage_account_key})
-            else:
-                credential = DefaultAzureCredential()
-                service_client = DataLakeServiceClient(account_url, credential=credential)
+            if self._credential is None:
+                self._credential = get_credential()
+            service_client = DataLakeServiceClient(account_url, credential=self._credential)
+        elif self._credential is None:
+            self._credential = service_client_credential(service_client)
+            if isinstance(self._credential, dict):
+                self._storage_account_key = self._credential["account_key"]
         self.fs_client = service_client.get_file_system_client(container_name)
 
-    def copy_files(
-        self,
-        src_path: str,
-        dest_path: str,
-        files_name: list,
-        source_fs: Optional["DataLakeGen2FileSystemClient"] = None,
-    ) -> None:
-        """Copy specified files from a source directory to a destination directory.
+    @property
+    def blob_container_client(self) -> ContainerClient:
+        """Blob endpoint client of the container, used for server-side copies."""
+        if self._blob_container_client is None:
+            self._blob_container_client = ContainerClient(
+                self.BLOB_URL.format(self.storage_name), self.container_name, credential=self._credential
+            )
+        return self._blob_container_client
+
+    def _upload(self, file_client, data: UploadPayload) -> dict:
+        """Append a payload to a freshly created file and commit it.
+
+        The payload is split into blocks which are appended at their final offset, so up to
+        `max_concurrency` blocks can be in flight at once. At most `max_concurrency` blocks are
+        buffered, which keeps memory bounded for streams and iterators.
 
         Args:
-            src_path (str): Source directory path.
-            dest_path (str): Destination directory path.
-            files_name (list): List of file names to copy.
-            source_fs (DataLakeGen2FileSystemClient, optional): Source file system client if copying
-            from another file system. Defaults to None.
+            file_client (DataLakeFileClient): Client of the file to upload to.
+            data (UploadPayload): String, bytes, binary or text stream, or iterator of chunks.
+
+        Returns:
+            dict: The response of the final flush.
         """
-        directory_client = self.fs_client.get_directory_client(dest_path)
-        for file in files_name:
-            if source_fs:
-                data_ = source_fs.fs_client.get_file_client(path_builder(src_path, file)).download_file()
-            else:
-                data_ = self.fs_client.get_file_client(path_builder(src_path, file)).download_file()
-            data = data_.readall()
-            file_client = directory_client.create_file(str(file))
-            file_client.append_data(data, offset=0, length=len(data))
-            file_client.flush_data(len(data))
+        blocks = iter_blocks(data, self.block_size)
+        first_block = next(blocks, None)
+        if first_block is None:
+            return file_client.flush_data(0)
+        second_block = next(blocks, None)
+        if second_block is None or self.max_concurrency == 1:
+            offset = 0
+            for block in chain([first_block], [] if second_block is None else [second_block], blocks):
+                file_client.append_data(data=block, offset=offset, length=len(block))
+                offset += len(block)
+            return file_client.flush_data(offset)
+
+        offset = 0
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            pending: set = set()
+            for block in chain([first_block, second_block], blocks):
+                if len(pending) >= self.max_concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(executor.submit(file_client.append_data, data=block, offset=offset, length=len(block)))
+                offset += len(block)
+            for future in wait(pending).done:
+                future.result()
+        return file_client.flush_data(offset)
+
+    def _write(self, path: str, file_name: str, data: UploadPayload, content_encoding: Optional[str] = None) -> None:
+        """Create a file, upload its content and keep in-memory payloads in the cache for later reads."""
+        directory_client = self.fs_client.get_directory_client(path)
+        if content_encoding is None:
+            file_client = directory_client.create_file(file_name)
+        else:
+            file_client = directory_client.create_file(
+                file_name, content_settings=ContentSettings(content_encoding=content_encoding)
+            )
+        response = self._upload(file_client, data)
+
+        if self.cache is not None and isinstance(data, (str, bytes, bytearray, memoryview)):
+            etag = response.get("etag") if isinstance(response, dict) else None
+            if etag:
+                content = data.encode("utf-8") if isinstance(data, str) else data
+                self.cache.put(path_builder(path, file_name), etag, content)
+
+    def read_bytes(self, path: str, file_name: str) -> memoryview:
+        """Download a file into a single pre-sized buffer.
+
+        The buffer is sized from the file properties returned by the first ranged request, and the
+        remaining ranges are downloaded with up to `max_concurrency` requests in flight, each written
+        straight into its slice of the buffer. The stored bytes are returned as they are, even for files
+        with a Content-Encoding: they are decompressed by the readers, after their file extension.
+
+        When a cache is configured, the current etag of the file is fetched first and a cached copy of that
+        version is returned without downloading the content.
+
+        Args:
+            path (str): Directory path where the file is located.
+            file_name (str): Name of the file.
+
+        Returns:
+            memoryview: A view over the downloaded content, which can be handed to parsers without copy.
+        """
+        file_path = path_builder(path, file_name)
+        file_client = self.fs_client.get_file_client(file_path)
+
+        if self.cache is not None:
+            cached = self.cache.get(file_path, file_client.get_file_properties().etag)
+            if cached is not None:
+                return memoryview(cached)
+
+        downloader = file_client.download_file(max_concurrency=self.max_concurrency, decompress=False)
+        buffer = bytearray(downloader.size)
+        downloader.readinto(BufferWriter(memoryview(buffer)))
+
+        if self.cache is not None:
+            self.cache.put(file_path, downloader.properties.etag, buffer)
+        return memoryview(buffer)
+
+    def _open_parquet(self, path: str, file_name: str, partial: bool) -> pa.NativeFile:
+        if not partial:
+            return super()._open_parquet(path, file_name, partial)
+
+        file_path = path_builder(path, file_name)
+        file_client = self.fs_client.get_file_client(file_path)
+        properties = file_client.get_file_properties()
+        if self.cache is not None:
+            cached = self.cache.get(file_path, properties.etag)
+            if cached is not None:
+                return pa.BufferReader(cached)
+        return pa.PythonFile(io.BufferedReader(RangedReader(file_client, properties.size)), mode="r")
+
+    def _source_url(self, file_path: str) -> Tuple[str, Optional[str]]:
+        """Build an URL of a file readable by a server-side copy, with its authorization if needed.
+
+        Returns:
+            Tuple[str, Optional[str]]: The source URL and the value of the source authorization header.
+        """
+        url, token_credential = copy_source(
+            self.BLOB_URL.format(self.storage_name),
+            self.storage_name,
+            self.container_name,
+            file_path,
+            self._storage_account_key,
+            self._credential,
+        )
+        if token_credential is None:
+            return url, None
+        return url, f"Bearer {token_credential.get_token(STORAGE_SCOPE).token}"
+
+    def _copy_file(self, source_fs: FileSystemClient, src_file_path: str, dest_file_path: str) -> None:
+        if not isinstance(source_fs, DataLakeGen2FileSystemClient):
+            super()._copy_file(source_fs, src_file_path, dest_file_path)
+            return
+
+        source_url, source_authorization = source_fs._source_url(src_file_path)
+        blob_client = self.blob_container_client.get_blob_client(dest_file_path)
+        if source_authorization:
+            blob_client.upload_blob_from_url(source_url, overwrite=True, source_authorization=source_authorization)
+        else:
+            blob_client.upload_blob_from_url(source_url, overwrite=True)
+
+    def _move_file(self, source_fs: FileSystemClient, src_file_path: str, dest_file_path: str) -> None:
+        if not isinstance(source_fs, DataLakeGen2FileSystemClient):
+            super()._move_file(source_fs, src_file_path, dest_file_path)
+        elif source_fs.storage_name == self.storage_name:
+            file_client = source_fs.fs_client.get_file_client(src_file_path)
+            new_name = f"{self.container_name}/{dest_file_path}"
+            try:
+                file_client.rename_file(new_name)
+            except ResourceNotFoundError:
+                # A rename does not create the parent directories of its destination.
+                dest_directory = posixpath.dirname(dest_file_path)
+                if not dest_directory:
+                    raise
+                self.fs_client.get_directory_client(dest_directory).create_directory()
+                file_client.rename_file(new_name)
+        else:
+            self._copy_file(source_fs, src_file_path, dest_file_path)
+            source_fs.fs_client.get_file_client(src_file_path).delete_file()
 
     def list_files(
         self, path: str, pattern: Optional[str] = None, min_blob_size: int = 0, descending_sort: bool = False
@@ -93,8 +395,8 @@ class DataLakeGen2FileSystemClient:
             path (str): Directory path to search for files.
             pattern (str, optional): Regular expression pattern to match file names. Defaults to None.
             min_blob_size (int, optional): Minimum size of the blob content in bytes for a
-            descending_sort(bool): If true, sort files in desc order
             file to be included in the list. Defaults to 0.
+            descending_sort(bool): If true, sort files in desc order
 
         Returns:
             List[str]: A list of file names in the directory that match the pattern and minimum blob size criteria.
@@ -108,88 +410,20 @@ class DataLakeGen2FileSystemClient:
             directory_content = [path for path in directory_content if re.match(pattern, path)]
         return sorted(directory_content, reverse=descending_sort)
 
-    def write_csv(self, path: str, file_name: str, separator: str, data: Union[pd.DataFrame, list[list[str]]]) -> None:
-        """Put the contents of a DataFrame or list of lists as a CSV file in the specified directory.
-
-        Args:
-            path (str): Directory path where the CSV file will be created.
-            file_name (str): Name of the CSV file.
-            separator (str): Separator to use for CSV file (e.g., ',' or ';').
-            data (Union[pd.DataFrame, list[list[str]]]): Data to write to the CSV file.
-            Can be either a pandas DataFrame or a list of lists.
-
-        Returns:
-            None
-        """
-        directory_client = self.fs_client.get_directory_client(path)
-        file_client = directory_client.create_file(file_name)
-
-        if isinstance(data, pd.DataFrame):
-            file_contents = data.to_csv(index=False, sep=separator)
-        else:
-            file_contents = ""
-            for line in data:
-                file_contents += separator.join(line) + "\n"
-            file_contents = file_contents.rstrip("\n")
-
-        file_client.append_data(data=file_contents, offset=0, length=len(file_contents))
-        file_client.flush_data(len(file_contents))
-
-    def read_csv(self, path: str, file_name: str, separator: str = ",", **kwargs) -> pd.DataFrame:
-        """Read the contents of a CSV file from the specified directory and return as a DataFrame.
-
-        Args:
-            path (str): Directory path where the CSV file is located.
-            file_name (str): Name of the CSV file.
-            separator (str): Separator used in the CSV file (e.g., ',' or ';').
-            **kwargs: Additional keyword arguments to pass to pandas read_csv function.
-
-        Returns:
-            pd.DataFrame: DataFrame containing the CSV file contents.
-        """
-        file_client = self.fs_client.get_file_client(path_builder(path, file_name))
-        stream = io.BytesIO()
-        file_client.download_file().readinto(stream)
-        stream.seek(0)
-
-        df_result = pd.read_csv(filepath_or_buffer=stream, sep=separator, engine="python", **kwargs)
-
-        return df_result
-
-    def write_parquet(self, path: str, file_name: str, data_frame: pd.DataFrame) -> None:
-        """Write a DataFrame's contents into a Parquet file in the specified directory.
-
-        Args:
-            path (str): Directory path where the Parquet file will be created.
-            file_name (str): Name of the Parquet file.
-            data_frame (pd.DataFrame): DataFrame containing the data to be written.
-
-        Returns:
-            None
-        """
-        directory_client = self.fs_client.get_directory_client(path)
-        file_client = directory_client.create_file(file_name)
-        file_contents = data_frame.to_parquet(use_dictionary=False)
-        file_client.append_data(data=file_contents, offset=0, length=len(file_contents))
-        file_client.flush_data(len(file_contents))
-
-    def read_parquet(self, path: str, file_name: str, **kwargs) -> pd.DataFrame:
-        """Read the contents of a Parquet file as a DataFrame.
-
-        Args:
-            path (str): Directory path where the Parquet file is located.
-            file_name (str): Name of the Parquet file.
-            **kwargs: Additional keyword arguments to pass to pd.read_parquet().
+    def list_file_infos(self, path: str) -> List[FileInfo]:
+        return [
+            FileInfo(p.name.removeprefix(path + "/"), p.content_length, p.last_modified)
+            for p in self.fs_client.get_paths(path=path)
+            if not p.is_directory
+        ]
 
-        Returns:
-            pd.DataFrame: DataFrame containing the data from the Parquet file.
-        """
-        file_client = self.fs_client.get_file_client(path_builder(path, file_name))
-        stream = io.BytesIO()
-        file_client.download_file().readinto(stream)
-        stream.seek(0)
-        df_result = pd.read_parquet(path=stream, **kwargs)
-        return df_result
+    def _list_children(self, path: str, directories: bool) -> List[str]:
+        """List the names of the direct children of a directory, either its sub-directories or its files."""
+        return [
+            p.name.removeprefix(path + "/")
+            for p in self.fs_client.get_paths(path=path, recursive=False)
+            if bool(p.is_directory) == directories
+        ]
 
     def delete_file(self, path: str, file_name: str) -> None:
         """Delete a file from the specified directory in the Data Lake Gen2 file system.
@@ -209,37 +443,3 @@ class DataLakeGen2FileSystemClient:
         """
         directory_client = self.fs_client.get_directory_client(directory)
         directory_client.delete_directory()
-
-    def write_file(self, path: str, file_name: str, content: str) -> None:
-        """Write the contents into a file in the specified directory.
-
-        Args:
-            path (str): Directory path where the file will be created.
-            file_name (str): Name of the file.
-            content (str): The content to be written to the file.
-
-        Returns:
-            None
-        """
-        directory_client = self.fs_client.get_directory_client(path)
-        file_client = directory_client.create_file(file_name)
-        file_client.append_data(data=content, offset=0, length=len(content))
-        file_client.flush_data(len(content))
-
-    def read_json(self, path: str, file_name: str, **kwargs) -> pd.DataFrame:
-        """Read the contents of a JSON file as a DataFrame.
-
-        Args:
-            path (str): Directory path where the JSON file is located.
-            file_name (str): Name of the JSON file.
-            **kwargs: Additional keyword arguments to pass to pd.read_json().
-
-        Returns:
-            pd.DataFrame: DataFrame containing the data from the JSON file.
-        """
-        file_client = self.fs_client.get_file_client(path_builder(path, file_name))
-        stream = io.BytesIO()
-        file_client.download_file().readinto(stream)
-        stream.seek(0)
-        df_result = pd.read_json(path_or_buf=stream, **kwargs)
-        return df_result
@@ -0,0 +1,84 @@
+import functools
+from typing import Dict, Tuple
+
+from azfn_starter_kit.common.fs.base_file_system import FileSystemClient
+from azfn_starter_kit.common.fs.datalake_file_system import DataLakeGen2FileSystemClient
+from azfn_starter_kit.common.fs.file_cache import get_file_cache
+from azfn_starter_kit.common.fs.local_file_system import LocalFileSystemClient
+from azfn_starter_kit.common.fs.memory_file_system import InMemoryFileSystemClient, StoredFile
+from azfn_starter_kit.config.datalake_config import DataLakeConfig
+
+# Shared by every in-memory client of the process, so that each stage sees the files of the previous ones.
+_MEMORY_STORE: Dict[str, StoredFile] = {}
+
+
+def create_file_system_client(dls_settings: DataLakeConfig) -> FileSystemClient:
+    """
+    Build the file system client of the backend selected in the data lake settings.
+
+    Args:
+        dls_settings (DataLakeConfig): The data lake settings.
+
+    Returns:
+        FileSystemClient: An ADLS, local-directory or in-memory client, depending on `BACKEND`.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if dls_settings.BACKEND == "local":
+        return LocalFileSystemClient(
+            dls_settings.LOCAL_ROOT,
+            dls_settings.RAW_PATH,
+            dls_settings.TRANSFORMED_PATH,
+            dls_settings.COMPUTED_PATH,
+            max_concurrency=dls_settings.MAX_CONCURRENCY,
+            block_size=dls_settings.BLOCK_SIZE,
+        )
+    if dls_settings.BACKEND == "memory":
+        return InMemoryFileSystemClient(
+            dls_settings.RAW_PATH,
+            dls_settings.TRANSFORMED_PATH,
+            dls_settings.COMPUTED_PATH,
+            store=_MEMORY_STORE,
+            max_concurrency=dls_settings.MAX_CONCURRENCY,
+            block_size=dls_settings.BLOCK_SIZE,
+        )
+    if dls_settings.BACKEND != "adls":
+        raise ValueError(f"Unknown data lake backend: {dls_settings.BACKEND}")
+
+    cache = None
+    if dls_settings.CACHE_ENABLED:
+        cache = get_file_cache(
+            dls_settings.CACHE_MEMORY_MAX_BYTES, dls_settings.CACHE_DISK_PATH, dls_settings.CACHE_DISK_MAX_BYTES
+        )
+    return DataLakeGen2FileSystemClient(
+        dls_settings.STORAGE_NAME,
+        dls_settings.CONTAINER_NAME,
+        dls_settings.RAW_PATH,
+        dls_settings.TRANSFORMED_PATH,
+        dls_settings.COMPUTED_PATH,
+        dls_settings.ACCOUNT_KEY,
+        max_concurrency=dls_settings.MAX_CONCURRENCY,
+        block_size=dls_settings.BLOCK_SIZE,
+        cache=cache,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_file_system_client(settings_key: Tuple) -> FileSystemClient:
+    return create_file_system_client(DataLakeConfig(**dict(settings_key)))
+
+
+def get_file_system_client(dls_settings: DataLakeConfig) -> FileSystemClient:
+    """
+    Return the process-wide file system client of the given data lake settings, creating it on first use.
+
+    Reusing the client across invocations reuses its HTTP pipeline, connection pool and cached access tokens.
+
+    Args:
+        dls_settings (DataLakeConfig): The data lake settings.
+
+    Returns:
+        FileSystemClient: The client shared by every caller with the same settings.
+    """
+    return _cached_file_system_client(tuple(sorted(dls_settings.dict().items())))
@@ -0,0 +1,140 @@
+import functools
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+
+from azfn_starter_kit.utilities.logger import get_logger
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class FileCache:
+    """
+    Read-through cache for data lake files, with an in-memory LRU tier and a local-disk tier.
+
+    Entries are keyed by file path and etag, so a changed file is never served from the cache: the caller
+    revalidates by fetching the current etag of the file, which only costs a metadata request. Both tiers
+    evict their least recently used entries once their size limit is exceeded. Disk hits are promoted to
+    the memory tier.
+
+    Args:
+        memory_max_bytes (int): Maximum total size of the entries kept in memory. 0 disables the tier.
+        disk_path (Optional[str]): Directory of the disk tier. None disables the tier.
+        disk_max_bytes (int): Maximum total size of the entries kept on disk.
+
+    Attributes:
+        metrics (Dict[str, int]): Counters of memory hits, disk hits, misses and evictions.
+    """
+
+    def __init__(self, memory_max_bytes: int, disk_path: Optional[str] = None, disk_max_bytes: int = 0):
+        self.logger = get_logger(__name__)
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_path = disk_path
+        self.disk_max_bytes = disk_max_bytes
+        self.metrics: Dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        self._memory: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+        if self.disk_path:
+            os.makedirs(self.disk_path, exist_ok=True)
+
+    @staticmethod
+    def _path_key(path: str) -> str:
+        return hashlib.sha256(path.encode("utf-8")).hexdigest()
+
+    def _disk_file(self, path: str, etag: str) -> str:
+        etag_key = hashlib.sha256(etag.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.disk_path, f"{self._path_key(path)}-{etag_key}")
+
+    def get(self, path: str, etag: str) -> Optional[bytes]:
+        """Return the cached content of a file version, or None if it is not cached."""
+        with self._lock:
+            entry = self._memory.get(path)
+            if entry is not None and entry[0] == etag:
+                self._memory.move_to_end(path)
+                self.metrics["memory_hits"] += 1
+                return entry[1]
+
+        if self.disk_path:
+            disk_file = self._disk_file(path, etag)
+            try:
+                with open(disk_file, "rb") as cached_file:
+                    data = cached_file.read()
+                os.utime(disk_file)
+            except FileNotFoundError:
+                pass
+            else:
+                with self._lock:
+                    self.metrics["disk_hits"] += 1
+                self._put_memory(path, etag, data)
+                return data
+
+        with self._lock:
+            self.metrics["misses"] += 1
+        return None
+
+    def put(self, path: str, etag: str, data: BytesLike) -> None:
+        """Store a file version in both tiers, replacing any other version of the same file."""
+        data = bytes(data)
+        self._put_memory(path, etag, data)
+        if self.disk_path and len(data) <= self.disk_max_bytes:
+            self._put_disk(path, etag, data)
+
+    def _put_memory(self, path: str, etag: str, data: bytes) -> None:
+        if len(data) > self.memory_max_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(path, None)
+            if previous is not None:
+                self._memory_size -= len(previous[1])
+            self._memory[path] = (etag, data)
+            self._memory_size += len(data)
+            while self._memory_size > self.memory_max_bytes:
+                _, (_, evicted) = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted)
+                self.metrics["evictions"] += 1
+
+    def _put_disk(self, path: str, etag: str, data: bytes) -> None:
+        path_key = self._path_key(path)
+        for entry in os.scandir(self.disk_path):
+            if entry.name.startswith(path_key):
+                self._remove(entry.path)
+
+        file_descriptor, tmp_file = tempfile.mkstemp(dir=self.disk_path, prefix=".tmp-")
+        with os.fdopen(file_descriptor, "wb") as cached_file:
+            cached_file.write(data)
+        os.replace(tmp_file, self._disk_file(path, etag))
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        entries = [entry for entry in os.scandir(self.disk_path) if not entry.name.startswith(".tmp-")]
+        disk_size = sum(entry.stat().st_size for entry in entries)
+        for entry in sorted(entries, key=lambda entry: entry.stat().st_mtime):
+            if disk_size <= self.disk_max_bytes:
+                break
+            disk_size -= entry.stat().st_size
+            self._remove(entry.path)
+            with self._lock:
+                self.metrics["evictions"] += 1
+
+    @staticmethod
+    def _remove(file_path: str) -> None:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+    def hit_ratio(self) -> float:
+        """Return the share of lookups served by either tier."""
+        hits = self.metrics["memory_hits"] + self.metrics["disk_hits"]
+        lookups = hits + self.metrics["misses"]
+        return hits / lookups if lookups else 0.0
+
+
+@functools.lru_cache(maxsize=None)
+def get_file_cache(memory_max_bytes: int, disk_path: Optional[str], disk_max_bytes: int) -> FileCache:
+    """Return the process-wide cache for the given limits, so that it outlives a single invocation."""
+    return FileCache(memory_max_bytes, disk_path, disk_max_bytes)
@@ -0,0 +1,135 @@
+import datetime
+import mmap
+import os
+import re
+import shutil
+import tempfile
+from typing import List, Optional
+
+import pyarrow as pa
+
+from azfn_starter_kit.common.fs.base_file_system import (
+    DEFAULT_BLOCK_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    FileInfo,
+    FileSystemClient,
+    UploadPayload,
+    iter_blocks,
+)
+from azfn_starter_kit.utilities.logger import get_logger
+
+
+class LocalFileSystemClient(FileSystemClient):
+    """
+    File system client storing the data lake layers in a local directory.
+
+    Files are read through memory maps, so parsers work on the page cache without an intermediate copy,
+    and parquet files are memory-mapped by Arrow directly. Writes go to a temporary file which is then
+    atomically renamed, so readers never see a partial file.
+
+    Args:
+        root_dir (str): The local directory acting as the container.
+        raw_path (str): The raw path to be used.
+        transformed_path (str): The transformed path to be used.
+        computed_path (str): The computed path to be used.
+        max_concurrency (int): Maximum number of operations run in parallel by a batch transfer.
+        block_size (int): Size in bytes of the blocks a payload is written by.
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        raw_path: str,
+        transformed_path: str,
+        computed_path: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ):
+        super().__init__(raw_path, transformed_path, computed_path, max_concurrency, block_size)
+        self.logger = get_logger(__name__)
+        self.root_dir = root_dir
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _local_path(self, *path: str) -> str:
+        return os.path.join(self.root_dir, *path)
+
+    def read_bytes(self, path: str, file_name: str) -> memoryview:
+        with open(self._local_path(path, file_name), "rb") as local_file:
+            if os.fstat(local_file.fileno()).st_size == 0:
+                return memoryview(b"")
+            return memoryview(mmap.mmap(local_file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _write(self, path: str, file_name: str, data: UploadPayload, content_encoding: Optional[str] = None) -> None:
+        local_path = self._local_path(path, file_name)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(local_path), prefix=".tmp-")
+        try:
+            with os.fdopen(file_descriptor, "wb") as local_file:
+                for block in iter_blocks(data, self.block_size):
+                    local_file.write(block)
+            os.replace(tmp_path, local_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _list_children(self, path: str, directories: bool) -> List[str]:
+        local_path = self._local_path(path)
+        if not os.path.isdir(local_path):
+            return []
+        return [
+            entry.name
+            for entry in os.scandir(local_path)
+            if entry.is_dir() == directories and not entry.name.startswith(".tmp-")
+        ]
+
+    def list_files(
+        self, path: str, pattern: Optional[str] = None, min_blob_size: int = 0, descending_sort: bool = False
+    ) -> List[str]:
+        local_path = self._local_path(path)
+        directory_content = []
+        for directory, _, files in os.walk(local_path):
+            for file in files:
+                file_path = os.path.join(directory, file)
+                if not file.startswith(".tmp-") and os.path.getsize(file_path) >= min_blob_size:
+                    directory_content.append(os.path.relpath(file_path, local_path).replace("\\", "/"))
+        if pattern is not None:
+            directory_content = [path for path in directory_content if re.match(pattern, path)]
+        return sorted(directory_content, reverse=descending_sort)
+
+    def list_file_infos(self, path: str) -> List[FileInfo]:
+        local_path = self._local_path(path)
+        file_infos = []
+        for directory, _, files in os.walk(local_path):
+            for file in files:
+                if file.startswith(".tmp-"):
+                    continue
+                stat = os.stat(os.path.join(directory, file))
+                name = os.path.relpath(os.path.join(directory, file), local_path).replace("\\", "/")
+                last_modified = datetime.datetime.fromtimestamp(stat.st_mtime, tz=datetime.timezone.utc)
+                file_infos.append(FileInfo(name, stat.st_size, last_modified))
+        return file_infos
+
+    def delete_file(self, path: str, file_name: str) -> None:
+        os.remove(self._local_path(path, file_name))
+
+    def delete_directory(self, directory: str) -> None:
+        shutil.rmtree(self._local_path(directory))
+
+    def _copy_file(self, source_fs: FileSystemClient, src_file_path: str, dest_file_path: str) -> None:
+        if not isinstance(source_fs, LocalFileSystemClient):
+            super()._copy_file(source_fs, src_file_path, dest_file_path)
+            return
+        local_path = self._local_path(dest_file_path)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        shutil.copyfile(source_fs._local_path(src_file_path), local_path)
+
+    def _move_file(self, source_fs: FileSystemClient, src_file_path: str, dest_file_path: str) -> None:
+        if not isinstance(source_fs, LocalFileSystemClient):
+            super()._move_file(source_fs, src_file_path, dest_file_path)
+            return
+        local_path = self._local_path(dest_file_path)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        shutil.move(source_fs._local_path(src_file_path), local_path)
+
+    def _open_parquet(self, path: str, file_name: str, partial: bool) -> pa.NativeFile:
+        return pa.memory_map(self._local_path(path, file_name))
@@ -0,0 +1,123 @@
+import datetime
+import posixpath
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from azfn_starter_kit.common.fs.base_file_system import (
+    DEFAULT_BLOCK_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    FileInfo,
+    FileSystemClient,
+    UploadPayload,
+    iter_blocks,
+)
+from azfn_starter_kit.utilities.file_system import path_builder
+from azfn_starter_kit.utilities.logger import get_logger
+
+StoredFile = Tuple[bytes, datetime.datetime]
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+class InMemoryFileSystemClient(FileSystemClient):
+    """
+    File system client storing the data lake layers in memory.
+
+    Files are kept with their last modification time in a dictionary keyed by their full path. Clients given
+    the same `store` share their files, which lets every stage of a pipeline run within one process see the
+    output of the previous ones.
+
+    Args:
+        raw_path (str): The raw path to be used.
+        transformed_path (str): The transformed path to be used.
+        computed_path (str): The computed path to be used.
+        store (Optional[Dict[str, StoredFile]]): The dictionary holding the files. Defaults to a new empty one.
+        max_concurrency (int): Maximum number of operations run in parallel by a batch transfer.
+        block_size (int): Size in bytes of the blocks a payload is read by.
+    """
+
+    def __init__(
+        self,
+        raw_path: str,
+        transformed_path: str,
+        computed_path: str,
+        store: Optional[Dict[str, StoredFile]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ):
+        super().__init__(raw_path, transformed_path, computed_path, max_concurrency, block_size)
+        self.logger = get_logger(__name__)
+        self.store: Dict[str, StoredFile] = {} if store is None else store
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(*path: str) -> str:
+        return posixpath.normpath(path_builder(*path)).lstrip("/")
+
+    def _children(self, path: str) -> Dict[str, StoredFile]:
+        prefix = self._key(path) + "/" if path else ""
+        with self._lock:
+            return {key[len(prefix) :]: value for key, value in self.store.items() if key.startswith(prefix)}
+
+    def read_bytes(self, path: str, file_name: str) -> memoryview:
+        try:
+            return memoryview(self.store[self._key(path, file_name)][0])
+        except KeyError as key_error:
+            raise FileNotFoundError(path_builder(path, file_name)) from key_error
+
+    def _write(self, path: str, file_name: str, data: UploadPayload, content_encoding: Optional[str] = None) -> None:
+        content = b"".join(iter_blocks(data, self.block_size))
+        with self._lock:
+            self.store[self._key(path, file_name)] = (content, _now())
+
+    def _list_children(self, path: str, directories: bool) -> List[str]:
+        children = set()
+        for relative_path in self._children(path):
+            name, separator, _ = relative_path.partition("/")
+            if bool(separator) == directories:
+                children.add(name)
+        return list(children)
+
+    def list_files(
+        self, path: str, pattern: Optional[str] = None, min_blob_size: int = 0, descending_sort: bool = False
+    ) -> List[str]:
+        directory_content = [
+            relative_path
+            for relative_path, (content, _) in self._children(path).items()
+            if len(content) >= min_blob_size
+        ]
+        if pattern is not None:
+            directory_content = [path for path in directory_content if re.match(pattern, path)]
+        return sorted(directory_content, reverse=descending_sort)
+
+    def list_file_infos(self, path: str) -> List[FileInfo]:
+        return [
+            FileInfo(relative_path, len(content), last_modified)
+            for relative_path, (content, last_modified) in self._children(path).items()
+        ]
+
+    def delete_file(self, path: str, file_name: str) -> None:
+        with self._lock:
+            del self.store[self._key(path, file_name)]
+
+    def delete_directory(self, directory: str) -> None:
+        prefix = self._key(directory) + "/"
+        with self._lock:
+            for key in [key for key in self.store if key.startswith(prefix)]:
+                del self.store[key]
+
+    def _copy_file(self, source_fs: FileSystemClient, src_file_path: str, dest_file_path: str) -> None:
+        if not isinstance(source_fs, InMemoryFileSystemClient):
+            super()._copy_file(source_fs, src_file_path, dest_file_path)
+            return
+        with source_fs._lock:
+            content, _ = source_fs.store[self._key(src_file_path)]
+        with self._lock:
+            self.store[self._key(dest_file_path)] = (content, _now())
+
+    def _move_file(self, source_fs: FileSystemClient, src_file_path: str, dest_file_path: str) -> None:
+        self._copy_file(source_fs, src_file_path, dest_file_path)
+        source_fs.delete_file(*posixpath.split(src_file_path))
@@ -1,3 +1,7 @@
+import os
+import tempfile
+from typing import Optional
+
 from pydantic import BaseModel
 
 from azfn_starter_kit.utilities.file_system import path_builder
@@ -11,3 +15,15 @@ class DataLakeConfig(BaseModel):
     COMPUTED_PATH: str = path_builder("exec", "exposed", "computed")
     #mettre sa propre clé Azure
     ACCOUNT_KEY: str = "account_key"
+    # "adls", "local" ou "memory"
+    BACKEND: str = os.getenv("DLS_BACKEND", "adls")
+    LOCAL_ROOT: str = os.getenv("DLS_LOCAL_ROOT", os.path.join(tempfile.gettempdir(), "azfn_starter_kit_lake"))
+    PARTITIONED_LAYOUT: bool = False
+    # "gzip" ou "zstd" (package zstandard requis) pour compresser la couche raw, non compressée par défaut
+    RAW_COMPRESSION: Optional[str] = os.getenv("DLS_RAW_COMPRESSION") or None
+    MAX_CONCURRENCY: int = 4
+    BLOCK_SIZE: int = 4 * 1024 * 1024
+    CACHE_ENABLED: bool = False
+    CACHE_MEMORY_MAX_BYTES: int = 256 * 1024 * 1024
+    CACHE_DISK_PATH: Optional[str] = os.path.join(tempfile.gettempdir(), "azfn_starter_kit_cache")
+    CACHE_DISK_MAX_BYTES: int = 1024 * 1024 * 1024
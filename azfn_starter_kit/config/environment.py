@@ -1,16 +1,24 @@
 import os
-from typing import Callable
+from typing import Callable, Dict
 
 from pydantic import BaseSettings
 
 from azfn_starter_kit.config.datalake_config import DataLakeConfig
+from azfn_starter_kit.config.orchestration_config import OrchestrationConfig
+from azfn_starter_kit.config.retention_config import RetentionConfig
 
 
 class Settings(BaseSettings):
     ENV: str = os.getenv("ENV", "local")
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "DEBUG")
+    # Format des logs : "text" ou "json" (un objet par ligne, avec l'exécution, la ville et l'étape)
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")
+    # Part des logs conservés par module (warnings et erreurs toujours conservés), en JSON dans LOG_SAMPLING_RATES
+    LOG_SAMPLING_RATES: Dict[str, float] = {}
     APP_DEBUG: bool = True
     DLS_SETTINGS: DataLakeConfig = DataLakeConfig()
+    RETENTION_SETTINGS: RetentionConfig = RetentionConfig()
+    ORCHESTRATION_SETTINGS: OrchestrationConfig = OrchestrationConfig()
 
 
 def _configure_initial_settings() -> Callable[[], Settings]:
@@ -0,0 +1,53 @@
+import os
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+from azfn_starter_kit.utilities.file_system import path_builder
+
+
+class RetryPolicy(BaseModel):
+    # Délai avant la première nouvelle tentative, en millisecondes
+    FIRST_RETRY_INTERVAL_MS: int = 5000
+    # Nombre maximal de tentatives, première exécution comprise
+    MAX_NUMBER_OF_ATTEMPTS: int = 3
+
+
+class OrchestrationConfig(BaseModel):
+    CITIES: List[str] = ["PARIS", "MARSEILLE", "LYON"]
+    # Source du catalogue de villes : "settings" (CITIES), "lake" (fichier CSV) ou "sql" (table)
+    CATALOG_SOURCE: str = os.getenv("CITY_CATALOG_SOURCE", "settings")
+    CATALOG_PATH: str = path_builder("exec", "internal", "catalog")
+    CATALOG_FILE_NAME: str = "cities.csv"
+    CATALOG_TABLE: str = "city"
+    # Nombre de villes traitées par sous-orchestration de shard
+    SHARD_SIZE: int = 50
+    # Mode d'exécution du pipeline : "staged" (une activité par étape) ou "fused" (ETL en mémoire)
+    PIPELINE_MODE: str = os.getenv("PIPELINE_MODE", "staged")
+    # Nombre de villes traitées par activité ETL en mode "fused"
+    ETL_BATCH_SIZE: int = 10
+    # Nombre maximal d'activités ou de sous-orchestrations en cours par fonction (0 ou absent : pas de limite)
+    MAX_CONCURRENCY: Dict[str, int] = {
+        "weather_data_flow_shard_orchestrator": 4,
+        "weather_data_flow_city_orchestrator": 10,
+        "weather_data_flow_etl_activity": 4,
+        "weather_data_flow_backfill_activity": 8,
+        "lake_retention_activity": 0,
+    }
+    # Politique de relance des activités, par nom d'activité (absente : pas de relance)
+    RETRY_POLICIES: Dict[str, RetryPolicy] = {
+        "weather_data_flow_catalog_activity": RetryPolicy(),
+        "weather_data_flow_extract_activity": RetryPolicy(FIRST_RETRY_INTERVAL_MS=10000, MAX_NUMBER_OF_ATTEMPTS=4),
+        "weather_data_flow_transform_activity": RetryPolicy(),
+        "weather_data_flow_load_activity": RetryPolicy(),
+        "weather_data_flow_etl_activity": RetryPolicy(MAX_NUMBER_OF_ATTEMPTS=2),
+        "weather_data_flow_backfill_activity": RetryPolicy(),
+    }
+    # Rattrapage : nombre maximal de jours par demande et nombre de villes par partition (un upsert chacune)
+    BACKFILL_MAX_DAYS: int = 366
+    BACKFILL_PARTITION_SIZE: int = 100
+    # Surveillance continue : délai entre deux rafraîchissements des villes dont la prévision a expiré
+    MONITOR_INTERVAL_MINUTES: int = int(os.getenv("MONITOR_INTERVAL_MINUTES", "30"))
+    # Métriques des exécutions : dossier parquet du lac et table SQL
+    METRICS_PATH: str = path_builder("exec", "internal", "metrics")
+    METRICS_TABLE: str = "run_metrics"
@@ -0,0 +1,17 @@
+import os
+
+from pydantic import BaseModel
+
+
+class LayerRetentionPolicy(BaseModel):
+    # Age, en jours, au-delà duquel un fichier expire
+    MAX_AGE_DAYS: int
+    # "delete" supprime les fichiers expirés, "compact" les regroupe par mois avant de les supprimer
+    ACTION: str = "delete"
+
+
+class RetentionConfig(BaseModel):
+    RAW: LayerRetentionPolicy = LayerRetentionPolicy(MAX_AGE_DAYS=30)
+    TRANSFORMED: LayerRetentionPolicy = LayerRetentionPolicy(MAX_AGE_DAYS=90)
+    COMPUTED: LayerRetentionPolicy = LayerRetentionPolicy(MAX_AGE_DAYS=365, ACTION="compact")
+    DRY_RUN: bool = os.getenv("RETENTION_DRY_RUN", "true").lower() == "true"
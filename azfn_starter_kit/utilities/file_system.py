@@ -1,5 +1,8 @@
+import datetime
 import os
 
+PARTITION_KEYS = ("year", "month", "day")
+
 
 def path_builder(*args) -> str:
     """
@@ -16,3 +19,19 @@ def path_builder(*args) -> str:
     """
     path: str = os.path.join(*args).replace("\\", "/")
     return path
+
+
+def date_partition(date_: datetime.date) -> str:
+    """
+    Constructs the Hive-style partition path of a given date.
+
+    Values are zero-padded so that partitions sort lexicographically in chronological order.
+
+    Args:
+        date_ (datetime.date): The date of the partition.
+
+    Returns:
+        str: The partition path, e.g. `year=2024/month=07/day=20`.
+    """
+    year, month, day = PARTITION_KEYS
+    return path_builder(f"{year}={date_:%Y}", f"{month}={date_:%m}", f"{day}={date_:%d}")
@@ -0,0 +1,91 @@
+"""
+Import-time profile of a module, from the `-X importtime` report of a fresh interpreter.
+
+Cold starts of the function app are dominated by the imports of `function_app`; this tells which ones, e.g.:
+
+    python -m azfn_starter_kit.utilities.import_profile function_app --top 20
+"""
+import argparse
+import re
+import subprocess
+import sys
+from typing import List, NamedTuple, Optional
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+class ImportTiming(NamedTuple):
+    """Time spent importing a module, in microseconds, alone and with the imports it triggered."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_import_times(report: str) -> List[ImportTiming]:
+    """
+    Parses an `-X importtime` report, ignoring the lines which are not timings.
+
+    Args:
+        report (str): The standard error of an interpreter run with `-X importtime`.
+
+    Returns:
+        List[ImportTiming]: The timing of each imported module, in import completion order.
+    """
+    timings = []
+    for line in report.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(ImportTiming(module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return timings
+
+
+def profile_imports(module: str, cwd: Optional[str] = None) -> List[ImportTiming]:
+    """
+    Imports a module in a fresh interpreter, so that nothing is already imported, and profiles its imports.
+
+    Args:
+        module (str): The module to import, e.g. `function_app`.
+        cwd (Optional[str]): The directory to run the interpreter from. Defaults to the current one.
+
+    Returns:
+        List[ImportTiming]: The timing of each imported module.
+
+    Raises:
+        subprocess.CalledProcessError: If the module cannot be imported.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_import_times(process.stderr)
+
+
+def total_import_time_us(timings: List[ImportTiming]) -> int:
+    """The time spent in all the imports, i.e. the sum of the cumulative times of the top-level ones."""
+    return sum(timing.cumulative_us for timing in timings if timing.depth == 0)
+
+
+def format_report(timings: List[ImportTiming], top: int = 20) -> str:
+    """Formats the total import time and the `top` slowest imports, with the imports they triggered."""
+    lines = [f"Total import time: {total_import_time_us(timings) / 1000:.1f} ms, {len(timings)} modules"]
+    for timing in sorted(timings, key=lambda timing: timing.cumulative_us, reverse=True)[:top]:
+        lines.append(f"{timing.cumulative_us / 1000:>10.1f} ms {timing.self_us / 1000:>10.1f} ms  {timing.module}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("module", nargs="?", default="function_app", help="Module to profile")
+    parser.add_argument("--top", type=int, default=20, help="Number of slowest imports to show")
+    args = parser.parse_args(argv)
+    print(format_report(profile_imports(args.module), args.top))
+
+
+if __name__ == "__main__":
+    main()
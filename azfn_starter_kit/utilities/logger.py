@@ -1,32 +1,137 @@
+import atexit
+import contextlib
+import contextvars
+import copy
+import datetime
+import json
 import logging
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterator, Optional
 
 from azfn_starter_kit.config.environment import get_settings
 
 _SETTINGS = get_settings()
 _LOG_FORMAT = "%(asctime)s - [%(levelname)s] - %(name)s - (%(filename)s).%(funcName)s(%(lineno)d) - %(message)s"
 
+# Fields describing what is being processed, e.g. the run id, city and stage, added to the records logged meanwhile
+_LOG_CONTEXT: contextvars.ContextVar[Dict[str, str]] = contextvars.ContextVar("log_context", default={})
 
-def __get_stream_handler() -> logging.StreamHandler:
+
+@contextlib.contextmanager
+def log_context(**fields: Optional[str]) -> Iterator[None]:
+    """
+    Add the given fields, e.g. `city="PARIS", stage="extract"`, to the records logged within the block, on top of
+    those of the enclosing blocks. Fields set to None are ignored.
     """
-    This method create a log stream handler to be able to display logs in stdout
+    token = _LOG_CONTEXT.set({**_LOG_CONTEXT.get(), **{key: value for key, value in fields.items() if value}})
+    try:
+        yield
+    finally:
+        _LOG_CONTEXT.reset(token)
 
-    Returns
-    -------
-    log_stream_handler (logging.StreamHandler): A stream handler to display
-    messages to the stdout
+
+class JsonFormatter(logging.Formatter):
+    """Format a record as a JSON object, with its context fields and, if any, its traceback."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        # The context fields come first, so that they cannot override the fields of the record itself.
+        entry = {
+            **getattr(record, "context", {}),
+            "time": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "function": f"{record.filename}.{record.funcName}({record.lineno})",
+        }
+        if getattr(record, "run_id", None):
+            entry["run_id"] = record.run_id
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a share of the records of the given modules, e.g. {"azfn_starter_kit.common.fs": 0.1} for one record
+    out of ten from the file systems, to tame logs in hot loops. Warnings and errors are always kept.
+    """
+
+    def __init__(self, rates: Dict[str, float]) -> None:
+        super().__init__()
+        # The most specific module first, so that it takes precedence over its packages
+        self.rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        for module, rate in self.rates:
+            if record.name == module or record.name.startswith(f"{module}."):
+                return random.random() < rate
+        return True
+
+
+class _ContextQueueHandler(QueueHandler):
     """
+    Enqueue a copy of the records with their message rendered and the log context of the calling thread, so that
+    later changes to the arguments do not alter what is logged. Unlike `QueueHandler`, the traceback is not
+    formatted here but by the listener thread, which keeps the cost of logging an error low for the caller.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.context = _LOG_CONTEXT.get()
+        return record
+
+
+def _stream_handler() -> logging.StreamHandler:
     log_stream_handler = logging.StreamHandler()
-    log_stream_handler.setLevel(_SETTINGS.LOG_LEVEL)
-    log_stream_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    if _SETTINGS.LOG_FORMAT == "json":
+        log_stream_handler.setFormatter(JsonFormatter())
+    else:
+        log_stream_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
     return log_stream_handler
 
 
+_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_QUEUE_HANDLER = _ContextQueueHandler(_QUEUE)
+_QUEUE_HANDLER.addFilter(SamplingFilter(_SETTINGS.LOG_SAMPLING_RATES))
+_LISTENER: Optional[QueueListener] = None
+
+
+def start_logging() -> None:
+    """
+    Start the thread writing the queued records, once per process, and flush it at exit. It is started by the
+    entry point of the application rather than on import, and the records logged until then wait in the queue.
+    """
+    global _LISTENER  # pylint: disable=global-statement
+    if _LISTENER is None:
+        _LISTENER = QueueListener(_QUEUE, _stream_handler(), respect_handler_level=True)
+        _LISTENER.start()
+        atexit.register(flush_logs)
+
+
+def flush_logs() -> None:
+    """Write the records still queued, and stop the listener; `start_logging` starts it again."""
+    global _LISTENER  # pylint: disable=global-statement
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _LISTENER = None
+        atexit.unregister(flush_logs)
+
+
 def get_logger(name: str, log_level: str = _SETTINGS.LOG_LEVEL) -> logging.Logger:
     """
     This method create a logger with a level based on the environment variable
     Example of message to be shown:
     2021-11-17 17:31:48,648 - [INFO] - main - (main.py).process_data(36) - something
 
+    The records of every logger go through a single queue, written to stderr by the thread of `start_logging`, as
+    text or, with the `LOG_FORMAT=json` setting, as JSON objects holding the fields of `log_context`.
+
     Parameters
     ----------
     @param: name (str): Name of the class to be used in the log
@@ -38,6 +143,6 @@ def get_logger(name: str, log_level: str = _SETTINGS.LOG_LEVEL) -> logging.Logge
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
     if not logger.handlers:
-        logger.addHandler(__get_stream_handler())
+        logger.addHandler(_QUEUE_HANDLER)
         logger.propagate = False
     return logger
@@ -0,0 +1,78 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+
+class ActivityMetrics:
+    """
+    Performance figures of an activity run for a city.
+
+    Attributes:
+        phases (Dict[str, float]): Duration, in seconds, of each phase of the activity, e.g. "fetch" or "upsert".
+        bytes_read (int): Size of the payloads read from the weather API or the lake.
+        bytes_written (int): Size of the payloads handed to the lake, before compression.
+        rows (int): Number of rows produced or loaded.
+        retries (int): Number of retried calls within the activity, and of runs retried by the durable retry
+            policy, added by the orchestrator.
+    """
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, float] = {}
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.rows = 0
+        self.retries = 0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as the phase `name`, adding up to a previous timing of the same phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def to_dict(self) -> dict:
+        return {
+            "duration_s": round(sum(self.phases.values()), 6),
+            "phases": {name: round(duration, 6) for name, duration in self.phases.items()},
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "rows": self.rows,
+            "retries": self.retries,
+        }
+
+
+_COUNTERS = ("duration_s", "bytes_read", "bytes_written", "rows", "retries")
+
+
+def summarize_metrics(records: List[dict]) -> dict:
+    """
+    Aggregates the metric records of a run by stage.
+
+    Args:
+        records (List[dict]): One record per city and stage, holding its "stage", "status" and the
+            `ActivityMetrics.to_dict` fields.
+
+    Returns:
+        dict: For each stage, the number of runs and failures, the totals of the counters, the longest
+        duration and the total duration of each phase.
+    """
+    stages: Dict[str, dict] = {}
+    for record in records:
+        summary = stages.setdefault(
+            record["stage"],
+            {"count": 0, "failures": 0, "max_duration_s": 0.0, "phases": {}, **{key: 0 for key in _COUNTERS}},
+        )
+        summary["count"] += 1
+        summary["failures"] += record["status"] not in ("SUCCESS", "SKIPPED")
+        summary["max_duration_s"] = max(summary["max_duration_s"], record.get("duration_s", 0.0))
+        for key in _COUNTERS:
+            summary[key] += record.get(key, 0)
+        for name, duration in record.get("phases", {}).items():
+            summary["phases"][name] = summary["phases"].get(name, 0.0) + duration
+
+    for summary in stages.values():
+        summary["duration_s"] = round(summary["duration_s"], 6)
+        summary["phases"] = {name: round(duration, 6) for name, duration in summary["phases"].items()}
+    return stages
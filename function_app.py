@@ -1,20 +1,23 @@
 import importlib
+import importlib.util
 
 import azure.functions as func
 
 from azfn_starter_kit.azfn import shared_bp
-from azfn_starter_kit.utilities.logger import get_logger
+from azfn_starter_kit.utilities.logger import get_logger, start_logging
 
+start_logging()
 _LOGGER = get_logger(__name__)
 BASE_MODULE = "azfn_starter_kit.azfn"
 
-USECASES_MODULES = ["basic_data_flow_example"]
-BLUEPRINT_MODULES = ["activities", "orchestrators", "triggers"]
+USECASES_MODULES = ["basic_data_flow_example", "lake_retention"]
+BLUEPRINT_MODULES = ["activities", "entities", "orchestrators", "triggers"]
 
-# Import blueprints
+# Import blueprints, skipping the kinds of functions a use case does not define
 for directory in USECASES_MODULES:
     for module in BLUEPRINT_MODULES:
-        importlib.import_module(f"{BASE_MODULE}.{directory}.{module}.blueprint")
+        if importlib.util.find_spec(f"{BASE_MODULE}.{directory}.{module}") is not None:
+            importlib.import_module(f"{BASE_MODULE}.{directory}.{module}.blueprint")
 
 app = func.FunctionApp()
 app.register_functions(shared_bp)
@@ -0,0 +1,79 @@
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from azfn_starter_kit.azfn.basic_data_flow_example.activities.backfill_activity import BackfillActivity
+
+_MODULE = "azfn_starter_kit.azfn.basic_data_flow_example.activities.backfill_activity"
+
+
+@pytest.fixture
+def backfill_activity():
+    activity = BackfillActivity()
+    activity.logger = MagicMock()
+    activity.fs_ = MagicMock()
+    return activity
+
+
+def _city_input(city):
+    return {"city": city, "raw_path": f"raw/{city}", "archive_path": f"computed/{city}"}
+
+
+def _backfill_city(city, fs_, raw_path, archive_path, date_, metrics):
+    if city == "NICE":
+        raise ValueError("Corrupted file")
+    if city == "LYON":
+        return pd.DataFrame()
+    metrics.rows += 1
+    return pd.DataFrame({"city": [city]})
+
+
+def test_process(backfill_activity):
+    input_ = {"partition_date": "2024-10-04", "cities": [_city_input(city) for city in ("PARIS", "LYON", "NICE")]}
+
+    with (
+        patch(f"{_MODULE}.weather_backfill_city", side_effect=_backfill_city) as backfill_mock,
+        patch(f"{_MODULE}.bulk_upsert_weather_data", return_value=1) as upsert_mock,
+    ):
+        output = backfill_activity.process(input_)
+
+    assert [(result["city"], result["status"]) for result in output] == [
+        ("PARIS", "SUCCESS"),
+        ("LYON", "SKIPPED"),
+        ("NICE", "FAILURE"),
+    ]
+    assert output[0]["metrics"]["rows"] == 1
+    assert backfill_mock.call_args.args[4].isoformat() == "2024-10-04"
+    upsert_mock.assert_called_once()
+    assert [frame["city"].tolist() for frame in upsert_mock.call_args.args[0]] == [["PARIS"]]
+
+
+def test_process_upsert_failure(backfill_activity):
+    input_ = {"partition_date": "2024-10-04", "cities": [_city_input("PARIS"), _city_input("LYON")]}
+
+    with (
+        patch(f"{_MODULE}.weather_backfill_city", side_effect=_backfill_city),
+        patch(f"{_MODULE}.bulk_upsert_weather_data", side_effect=ValueError("Invalid data")),
+    ):
+        output = backfill_activity.process(input_)
+
+    assert [(result["city"], result["status"]) for result in output] == [("PARIS", "FAILURE"), ("LYON", "SKIPPED")]
+    assert output[0]["error"] == "Invalid data"
+
+
+def test_process_raises_retryable_errors(backfill_activity):
+    input_ = {"partition_date": "2024-10-04", "cities": [_city_input("PARIS")]}
+
+    with (
+        patch(f"{_MODULE}.weather_backfill_city", side_effect=_backfill_city),
+        patch(f"{_MODULE}.bulk_upsert_weather_data", side_effect=TimeoutError("Database timeout")),
+    ):
+        with pytest.raises(TimeoutError):
+            backfill_activity.process(input_)
+
+
+def test_process_missing_key(backfill_activity):
+    output = backfill_activity.process({"cities": []})
+
+    assert output == [{"city": None, "stage": "backfill", "status": "MISSING_KEY", "error": "'partition_date'"}]
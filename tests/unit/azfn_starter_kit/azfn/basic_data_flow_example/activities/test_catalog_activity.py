@@ -0,0 +1,35 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from azfn_starter_kit.azfn.basic_data_flow_example.activities.catalog_activity import CatalogActivity
+
+
+@pytest.fixture
+def catalog_activity():
+    activity = CatalogActivity()
+    activity.logger = MagicMock()
+    activity.fs_ = MagicMock()
+    return activity
+
+
+def test_process(catalog_activity):
+    with patch(
+        "azfn_starter_kit.azfn.basic_data_flow_example.activities.catalog_activity.load_city_catalog"
+    ) as mock_load_city_catalog:
+        mock_load_city_catalog.return_value = ["PARIS", "LYON"]
+        assert catalog_activity.process({}) == ["PARIS", "LYON"]
+
+
+@pytest.mark.parametrize(
+    "exception, log_method",
+    [(ConnectionError("Transient error"), "warning"), (ValueError("Invalid catalog"), "error")],
+)
+def test_process_raises(catalog_activity, exception, log_method):
+    with patch(
+        "azfn_starter_kit.azfn.basic_data_flow_example.activities.catalog_activity.load_city_catalog",
+        side_effect=exception,
+    ):
+        with pytest.raises(type(exception)):
+            catalog_activity.process({})
+    getattr(catalog_activity.logger, log_method).assert_called_once()
@@ -0,0 +1,70 @@
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from azfn_starter_kit.azfn.basic_data_flow_example.activities.etl_activity import EtlActivity
+
+
+@pytest.fixture
+def etl_activity():
+    activity = EtlActivity()
+    activity.logger = MagicMock()
+    activity.fs_ = MagicMock()
+    activity.fs_.max_concurrency = 2
+    return activity
+
+
+def _done_write(exception=None, size=100) -> Future:
+    write = Future()
+    if exception:
+        write.set_exception(exception)
+    else:
+        write.set_result(size)
+    return write
+
+
+def test_process(etl_activity):
+    city_inputs = [
+        {"city": "PARIS", "raw_path": "raw", "archive_path": "computed"},
+        {"city": "LYON"},
+        {"city": "NICE", "raw_path": "raw", "archive_path": "computed"},
+        {"city": "LILLE", "raw_path": "raw", "archive_path": "computed"},
+    ]
+    with patch(
+        "azfn_starter_kit.azfn.basic_data_flow_example.activities.etl_activity.weather_etl_process"
+    ) as etl_mock:
+        etl_mock.side_effect = [
+            [_done_write(size=300), _done_write(size=200)],
+            Exception("API error"),
+            [_done_write(), _done_write(OSError("Upload failed"))],
+        ]
+        results = etl_activity.process({"cities": city_inputs})
+
+        assert results[0]["metrics"]["bytes_written"] == 500
+        assert "persist" in results[0]["metrics"]["phases"]
+        assert [{key: value for key, value in result.items() if key != "metrics"} for result in results] == [
+            {"city": "PARIS", "stage": "etl", "status": "SUCCESS"},
+            {"city": "LYON", "stage": "etl", "status": "MISSING_KEY", "error": "'raw_path'"},
+            {"city": "NICE", "stage": "etl", "status": "FAILURE", "error": "API error"},
+            {"city": "LILLE", "stage": "etl", "status": "FAILURE", "error": "Upload failed"},
+        ]
+
+
+def test_process_missing_cities(etl_activity):
+    assert etl_activity.process({}) == [{"city": None, "stage": "etl", "status": "MISSING_KEY", "error": "'cities'"}]
+
+
+def test_process_raises_retryable_error(etl_activity):
+    city_inputs = [
+        {"city": "PARIS", "raw_path": "raw", "archive_path": "computed"},
+        {"city": "NICE", "raw_path": "raw", "archive_path": "computed"},
+    ]
+    with patch(
+        "azfn_starter_kit.azfn.basic_data_flow_example.activities.etl_activity.weather_etl_process"
+    ) as etl_mock:
+        etl_mock.side_effect = [[_done_write()], [_done_write(ConnectionError("Connection reset"))]]
+        with pytest.raises(ConnectionError):
+            etl_activity.process({"cities": city_inputs})
+
+    etl_activity.logger.warning.assert_called_once()
@@ -1,3 +1,4 @@
+import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,9 +17,21 @@ def extract_activity():
 @pytest.mark.parametrize(
     "input_, expected_output, exception",
     [
-        ({"city": "TestCity", "dest_path": "TestPath"}, "EXTRACTION WEATHER TestCity SUCCESS", None),
-        ({}, "EXTRACTION MISSING_KEY", KeyError("Missing key in input data: 'city'")),
-        ({"city": "TestCity", "dest_path": "TestPath"}, "EXTRACTION FAILURE", Exception("Global exception")),
+        (
+            {"city": "TestCity", "dest_path": "TestPath"},
+            {"city": "TestCity", "stage": "extract", "status": "SUCCESS"},
+            None,
+        ),
+        (
+            {},
+            {"city": None, "stage": "extract", "status": "MISSING_KEY", "error": "'city'"},
+            KeyError("Missing key in input data: 'city'"),
+        ),
+        (
+            {"city": "TestCity", "dest_path": "TestPath"},
+            {"city": "TestCity", "stage": "extract", "status": "FAILURE", "error": "Global exception"},
+            Exception("Global exception"),
+        ),
     ],
 )
 def test_process(extract_activity, input_, expected_output, exception):
@@ -28,5 +41,38 @@ def test_process(extract_activity, input_, expected_output, exception):
         if exception:
             mock_extract_weather_data.side_effect = exception
         else:
-            mock_extract_weather_data.return_value = None
-        assert extract_activity.process(input_) == expected_output
+            mock_extract_weather_data.return_value = "WEATHER_TestCity_20241004.json.gz"
+        output = extract_activity.process(input_)
+        assert {key: value for key, value in output.items() if key != "metrics"} == expected_output
+        assert ("metrics" in output) == (expected_output["status"] != "MISSING_KEY")
+
+
+def test_process_raises_retryable_errors(extract_activity):
+    with patch(
+        "azfn_starter_kit.azfn.basic_data_flow_example.activities.extract_activity.extract_weather_data",
+        side_effect=ConnectionError("Connection reset"),
+    ):
+        with pytest.raises(ConnectionError):
+            extract_activity.process({"city": "TestCity", "dest_path": "TestPath"})
+
+
+def test_process_not_modified(extract_activity):
+    def extract(city, fs_, dest_path, compression, metrics, state, file_date):
+        assert file_date == datetime.date(2024, 10, 4)
+        state["expires"] = "Fri, 04 Oct 2024 08:00:00 GMT"
+
+    input_ = {
+        "city": "TestCity",
+        "dest_path": "TestPath",
+        "file_date": "2024-10-04",
+        "state": {"latitude": 48.8, "longitude": 2.3},
+    }
+    with patch(
+        "azfn_starter_kit.azfn.basic_data_flow_example.activities.extract_activity.extract_weather_data",
+        side_effect=extract,
+    ):
+        output = extract_activity.process(input_)
+
+    assert output["status"] == "SKIPPED"
+    assert output["state"] == {"latitude": 48.8, "longitude": 2.3, "expires": "Fri, 04 Oct 2024 08:00:00 GMT"}
+    assert input_["state"] == {"latitude": 48.8, "longitude": 2.3}
@@ -18,13 +18,17 @@ def load_activity():
     [
         (
             {"city": "TestCity", "src_path": "TestPath", "archive_path": "TestPath"},
-            "LOADING WEATHER TestCity SUCCESS",
+            {"city": "TestCity", "stage": "load", "status": "SUCCESS", "state": {"loaded_checksum": "checksum"}},
             None,
         ),
-        ({}, "LOADING MISSING_KEY", KeyError("Missing key in input data: 'city'")),
+        (
+            {},
+            {"city": None, "stage": "load", "status": "MISSING_KEY", "error": "'city'"},
+            KeyError("Missing key in input data: 'city'"),
+        ),
         (
             {"city": "TestCity", "src_path": "TestPath", "archive_path": "TestPath"},
-            "LOADING FAILURE",
+            {"city": "TestCity", "stage": "load", "status": "FAILURE", "error": "Global exception"},
             Exception("Global exception"),
         ),
     ],
@@ -36,5 +40,20 @@ def test_process(load_activity, input_, expected_output, exception):
         if exception:
             load_activity_mock.side_effect = exception
         else:
-            load_activity_mock.return_value = None
-        assert load_activity.process(input_) == expected_output
+            load_activity_mock.return_value = "checksum"
+        output = load_activity.process(input_)
+        assert {key: value for key, value in output.items() if key != "metrics"} == expected_output
+        assert ("metrics" in output) == (expected_output["status"] != "MISSING_KEY")
+
+
+def test_process_unchanged_data(load_activity):
+    input_ = {"city": "TestCity", "src_path": "TestPath", "archive_path": "TestPath", "loaded_checksum": "checksum"}
+    with patch(
+        "azfn_starter_kit.azfn.basic_data_flow_example.activities.load_activity.weather_loading_process",
+        return_value=None,
+    ) as load_activity_mock:
+        output = load_activity.process(input_)
+
+    assert output["status"] == "SKIPPED"
+    assert "state" not in output
+    assert load_activity_mock.call_args.kwargs["loaded_checksum"] == "checksum"
@@ -17,13 +17,17 @@ def transform_activity():
     [
         (
             {"city": "TestCity", "src_path": "TestPath", "dest_path": "TestPath"},
-            "TRANSFORMATION WEATHER TestCity SUCCESS",
+            {"city": "TestCity", "stage": "transform", "status": "SUCCESS"},
             None,
         ),
-        ({}, "TRANSFORMATION MISSING_KEY", KeyError("Missing key in input data: 'city'")),
+        (
+            {},
+            {"city": None, "stage": "transform", "status": "MISSING_KEY", "error": "'city'"},
+            KeyError("Missing key in input data: 'city'"),
+        ),
         (
             {"city": "TestCity", "src_path": "TestPath", "dest_path": "TestPath"},
-            "TRANSFORMATION FAILURE",
+            {"city": "TestCity", "stage": "transform", "status": "FAILURE", "error": "Global exception"},
             Exception("Global exception"),
         ),
     ],
@@ -36,4 +40,6 @@ def test_process(transform_activity, input_, expected_output, exception):
             transform_activity_mock.side_effect = exception
         else:
             transform_activity_mock.return_value = None
-        assert transform_activity.process(input_) == expected_output
+        output = transform_activity.process(input_)
+        assert {key: value for key, value in output.items() if key != "metrics"} == expected_output
+        assert ("metrics" in output) == (expected_output["status"] != "MISSING_KEY")
@@ -0,0 +1,88 @@
+import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from azfn_starter_kit.azfn.basic_data_flow_example.entities.city_state_entity import (
+    CityStateEntity,
+    is_stale,
+    save_city_state,
+)
+
+
+def _entity_context(operation, state=None, input_=None):
+    context = MagicMock()
+    context.operation_name = operation
+    context.get_state.return_value = state if state is not None else {}
+    context.get_input.return_value = input_
+    return context
+
+
+@pytest.mark.parametrize(
+    "operation, input_, expected_state",
+    [
+        ("get", None, {"latitude": 48.85, "expires": "e"}),
+        ("update", {"expires": "f", "raw_file": "r"}, {"latitude": 48.85, "expires": "f", "raw_file": "r"}),
+        ("reset", None, {}),
+    ],
+)
+def test_operate(operation, input_, expected_state):
+    context = _entity_context(operation, {"latitude": 48.85, "expires": "e"}, input_)
+
+    CityStateEntity().operate(context)
+
+    context.set_state.assert_called_once_with(expected_state)
+    context.set_result.assert_called_once_with(expected_state)
+
+
+def test_operate_unknown_operation():
+    with pytest.raises(ValueError, match="Unknown operation"):
+        CityStateEntity().operate(_entity_context("delete"))
+
+
+@pytest.mark.parametrize(
+    "state, expected",
+    [
+        (None, True),
+        ({"latitude": 48.85}, True),
+        ({"expires": "Fri, 04 Oct 2024 07:00:00 GMT"}, True),
+        ({"expires": "Fri, 04 Oct 2024 09:00:00 GMT"}, False),
+    ],
+)
+def test_is_stale(state, expected):
+    assert is_stale(state, datetime.datetime(2024, 10, 4, 8, 0)) is expected
+
+
+def test_save_city_state():
+    context = MagicMock()
+    results = [
+        {"city": "PARIS", "stage": "extract", "status": "SUCCESS", "state": {"expires": "e", "raw_file": "r"}},
+        {"city": "PARIS", "stage": "transform", "status": "SUCCESS"},
+        {"city": "PARIS", "stage": "load", "status": "SKIPPED"},
+    ]
+
+    save_city_state(context, "PARIS", results)
+
+    entity_id, operation, state = context.signal_entity.call_args.args
+    assert (entity_id.name, entity_id.key, operation) == ("weather_city_state", "PARIS", "update")
+    assert state == {"expires": "e", "raw_file": "r"}
+
+
+def test_save_city_state_drops_freshness_on_failure():
+    context = MagicMock()
+    results = [
+        {"city": "PARIS", "stage": "extract", "status": "SUCCESS", "state": {"expires": "e", "latitude": 48.85}},
+        {"city": "PARIS", "stage": "transform", "status": "FAILURE", "error": "error"},
+    ]
+
+    save_city_state(context, "PARIS", results)
+
+    assert context.signal_entity.call_args.args[2] == {"latitude": 48.85}
+
+
+def test_save_city_state_nothing_to_save():
+    context = MagicMock()
+
+    save_city_state(context, "PARIS", [{"city": "PARIS", "stage": "extract", "status": "FAILURE"}])
+
+    context.signal_entity.assert_not_called()
@@ -0,0 +1,44 @@
+import datetime
+from typing import Callable, Generator, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+# Default current time of the orchestrations, against which the test states expire
+NOW = datetime.datetime(2024, 7, 20, 8, 0, tzinfo=datetime.timezone.utc)
+
+
+@pytest.fixture
+def orchestration_context() -> Callable[..., MagicMock]:
+    """Build a mock orchestration context, with an instance id, a fixed current time and an input."""
+
+    def _context(input_: Optional[dict] = None, instance_id: str = "run", now: datetime.datetime = NOW) -> MagicMock:
+        mock_context = MagicMock()
+        mock_context.instance_id = instance_id
+        mock_context.current_utc_datetime = now
+        mock_context.get_input.return_value = input_
+        return mock_context
+
+    return _context
+
+
+@pytest.fixture
+def run_orchestration() -> Callable[..., object]:
+    """
+    Drive an orchestrator generator to its end, sending it the given task results in turn, or throwing them when
+    they are exceptions, and return its output.
+    """
+
+    def _run(generator: Generator, *values) -> object:
+        next(generator)
+        try:
+            for value in values:
+                if isinstance(value, Exception):
+                    generator.throw(value)
+                else:
+                    generator.send(value)
+        except StopIteration as stop:
+            return stop.value
+        raise AssertionError("The orchestrator did not return")
+
+    return _run
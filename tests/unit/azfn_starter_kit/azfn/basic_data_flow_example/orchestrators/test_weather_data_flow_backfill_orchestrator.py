@@ -0,0 +1,84 @@
+import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_backfill_orchestrator import (
+    WeatherBackfillDataflowOrchestrator,
+)
+
+
+def _result(city, date_, status="SUCCESS"):
+    return {"city": city, "stage": "backfill", "status": status, "date": date_, "metrics": {"rows": 24}}
+
+
+def test_call_activities():
+    mock_context = MagicMock()
+    mock_context.instance_id = "backfill"
+    mock_context.current_utc_datetime = datetime.datetime(2024, 10, 10)
+    mock_context.get_input.return_value = {
+        "start_date": "2024-10-04",
+        "end_date": "2024-10-05",
+        "cities": ["PARIS", "LYON"],
+    }
+    tasks = [MagicMock(result=[_result("PARIS", day), _result("LYON", day, "SKIPPED")]) for day in (4, 5)]
+    mock_context.call_activity_with_retry.side_effect = tasks
+    orchestrator = WeatherBackfillDataflowOrchestrator()
+    orchestrator.settings = orchestrator.settings.copy(deep=True)
+    orchestrator.settings.ORCHESTRATION_SETTINGS.MAX_CONCURRENCY = {"weather_data_flow_backfill_activity": 1}
+
+    generator = orchestrator.call_activities(mock_context)
+    next(generator)
+    assert mock_context.set_custom_status.call_args.args[0] == {
+        "start_date": "2024-10-04",
+        "end_date": "2024-10-05",
+        "partitions": 2,
+        "completed": 0,
+    }
+    generator.send(tasks[0])
+    assert mock_context.set_custom_status.call_args.args[0]["completed"] == 1
+    generator.send(tasks[1])
+    assert mock_context.set_custom_status.call_args.args[0]["completed"] == 2
+    try:
+        generator.send("SUCCESS")
+    except StopIteration as stop:
+        output = stop.value
+
+    partitions = [call_.args[2] for call_ in mock_context.call_activity_with_retry.call_args_list]
+    assert [partition["partition_date"] for partition in partitions] == ["2024-10-04", "2024-10-05"]
+    assert partitions[0]["cities"][0] == {
+        "city": "PARIS",
+        "raw_path": "exec/internal/raw/PARIS",
+        "archive_path": "exec/exposed/computed/PARIS",
+    }
+    assert output == [
+        {"city": "PARIS", "results": [_result("PARIS", 4), _result("PARIS", 5)]},
+        {"city": "LYON", "results": [_result("LYON", 4, "SKIPPED"), _result("LYON", 5, "SKIPPED")]},
+    ]
+    assert mock_context.call_activity.call_args.args[0] == "weather_data_flow_metrics_activity"
+
+
+def test_build_partitions_partitioned_layout():
+    orchestrator = WeatherBackfillDataflowOrchestrator()
+    orchestrator.settings = orchestrator.settings.copy(deep=True)
+    orchestrator.settings.DLS_SETTINGS.PARTITIONED_LAYOUT = True
+    orchestrator.settings.ORCHESTRATION_SETTINGS.BACKFILL_PARTITION_SIZE = 2
+
+    partitions = orchestrator._build_partitions(["PARIS", "LYON", "NICE"], [datetime.date(2024, 10, 4)])
+
+    assert [[city["city"] for city in partition["cities"]] for partition in partitions] == [["PARIS", "LYON"], ["NICE"]]
+    assert partitions[1]["cities"][0]["raw_path"] == "exec/internal/raw/NICE/year=2024/month=10/day=04"
+
+
+@pytest.mark.parametrize(
+    ("end_date", "max_days"), [(datetime.date(2024, 10, 3), 10), (datetime.date(2024, 10, 20), 10)]
+)
+def test_date_range_invalid(end_date, max_days):
+    with pytest.raises(ValueError):
+        WeatherBackfillDataflowOrchestrator._date_range(datetime.date(2024, 10, 4), end_date, max_days)
+
+
+def test_date_range():
+    dates = WeatherBackfillDataflowOrchestrator._date_range(datetime.date(2024, 2, 28), datetime.date(2024, 3, 1), 3)
+
+    assert dates == [datetime.date(2024, 2, 28), datetime.date(2024, 2, 29), datetime.date(2024, 3, 1)]
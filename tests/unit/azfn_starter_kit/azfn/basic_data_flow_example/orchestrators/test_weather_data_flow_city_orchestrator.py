@@ -0,0 +1,48 @@
+from unittest.mock import ANY, MagicMock
+
+import pytest
+
+from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_city_orchestrator import (
+    WeatherCityDataflowOrchestrator,
+)
+
+CITY_INPUT = {"city": "PARIS", "extract": {"e": 1}, "transform": {"t": 1}, "load": {"l": 1}}
+
+
+def _result(stage, status="SUCCESS"):
+    return {"city": "PARIS", "stage": stage, "status": status}
+
+
+@pytest.mark.parametrize(
+    ("results", "expected_calls"),
+    [
+        ([_result("extract"), _result("transform"), _result("load")], 3),
+        ([_result("extract", "FAILURE")], 1),
+    ],
+)
+def test_call_activities_chains_stages(results, expected_calls, orchestration_context, run_orchestration):
+    context = orchestration_context(CITY_INPUT)
+    orchestrator = WeatherCityDataflowOrchestrator()
+    orchestrator.conditional_log = MagicMock()
+
+    output = run_orchestration(orchestrator.call_activities(context), *results)
+
+    assert output == {"city": "PARIS", "results": results}
+    assert context.call_activity_with_retry.call_count == expected_calls
+    context.call_activity_with_retry.assert_any_call(
+        "weather_data_flow_extract_activity", ANY, {"e": 1, "run_id": "run"}
+    )
+
+
+def test_call_activities_stops_after_exhausted_retries(orchestration_context, run_orchestration):
+    context = orchestration_context(CITY_INPUT)
+    orchestrator = WeatherCityDataflowOrchestrator()
+    orchestrator.conditional_log = MagicMock()
+
+    output = run_orchestration(orchestrator.call_activities(context), _result("extract"), Exception("Activity failed"))
+
+    assert output == {
+        "city": "PARIS",
+        "results": [_result("extract"), {**_result("transform", "FAILURE"), "error": "Activity failed"}],
+    }
+    assert context.call_activity_with_retry.call_count == 2
@@ -0,0 +1,55 @@
+import datetime
+
+from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_monitor_orchestrator import (
+    WeatherMonitorDataflowOrchestrator,
+)
+
+_NOW = datetime.datetime(2024, 10, 4, 8, 0, tzinfo=datetime.timezone.utc)
+_FRESH_STATE = {"expires": "Fri, 04 Oct 2024 09:00:00 GMT"}
+
+
+def test_call_activities(orchestration_context, run_orchestration):
+    monitor_input = {"cities": ["PARIS", "NICE"], "mode": "fused", "interval_minutes": 15}
+    mock_context = orchestration_context(monitor_input, "monitor", _NOW)
+
+    run_orchestration(WeatherMonitorDataflowOrchestrator().call_activities(mock_context), [{}, _FRESH_STATE], [], None)
+
+    mock_context.call_sub_orchestrator.assert_called_once_with(
+        "weather_data_flow_orchestrator", {"cities": ["PARIS"], "mode": "fused"}, "monitor:20241004T080000"
+    )
+    mock_context.create_timer.assert_called_once_with(_NOW + datetime.timedelta(minutes=15))
+    mock_context.set_custom_status.assert_called_once_with(
+        {
+            "last_refresh": "2024-10-04T08:00:00+00:00",
+            "cities": 2,
+            "stale_cities": 1,
+            "run_id": "monitor:20241004T080000",
+            "next_refresh": "2024-10-04T08:15:00+00:00",
+        }
+    )
+    mock_context.continue_as_new.assert_called_once_with(monitor_input)
+
+
+def test_call_activities_nothing_stale(orchestration_context, run_orchestration):
+    mock_context = orchestration_context(None, "monitor", _NOW)
+    orchestrator = WeatherMonitorDataflowOrchestrator()
+    orchestrator.settings = orchestrator.settings.copy(deep=True)
+    orchestrator.settings.ORCHESTRATION_SETTINGS.MONITOR_INTERVAL_MINUTES = 30
+
+    run_orchestration(orchestrator.call_activities(mock_context), ["NICE"], [_FRESH_STATE], None)
+
+    assert mock_context.call_activity_with_retry.call_args.args[0] == "weather_data_flow_catalog_activity"
+    mock_context.call_sub_orchestrator.assert_not_called()
+    mock_context.create_timer.assert_called_once_with(_NOW + datetime.timedelta(minutes=30))
+    mock_context.continue_as_new.assert_called_once_with({})
+
+
+def test_call_activities_keeps_monitoring_after_an_error(orchestration_context, run_orchestration):
+    mock_context = orchestration_context({"cities": ["PARIS"]}, "monitor", _NOW)
+    mock_context.call_entity.side_effect = ValueError("Entity unavailable")
+
+    run_orchestration(WeatherMonitorDataflowOrchestrator().call_activities(mock_context), None)
+
+    assert mock_context.set_custom_status.call_args.args[0]["error"] == "Entity unavailable"
+    mock_context.create_timer.assert_called_once()
+    mock_context.continue_as_new.assert_called_once_with({"cities": ["PARIS"]})
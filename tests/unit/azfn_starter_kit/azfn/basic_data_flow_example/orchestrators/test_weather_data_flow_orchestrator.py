@@ -1,5 +1,7 @@
+import datetime
+import itertools
 import logging
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, MagicMock, PropertyMock, call, patch
 
 from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_orchestrator import (
     WeatherDataflowOrchestrator,
@@ -26,48 +28,103 @@ def test_build_inputs():
     assert inputs_load == expected_load
 
 
-def test_call_activities():
+def test_build_inputs_partitioned():
+    orchestrator = WeatherDataflowOrchestrator()
+    partition = "year=2024/month=07/day=20"
+
+    inputs_extract, inputs_transform, inputs_load = orchestrator._build_inputs(["CITY_A"], datetime.date(2024, 7, 20))
+
+    assert inputs_extract == [
+        {"city": "CITY_A", "dest_path": f"exec/internal/raw/CITY_A/{partition}", "file_date": "2024-07-20"}
+    ]
+    assert inputs_transform == [
+        {
+            "city": "CITY_A",
+            "src_path": f"exec/internal/raw/CITY_A/{partition}",
+            "dest_path": f"exec/internal/transformed/CITY_A/{partition}",
+        }
+    ]
+    assert inputs_load == [
+        {
+            "city": "CITY_A",
+            "src_path": f"exec/internal/transformed/CITY_A/{partition}",
+            "archive_path": f"exec/exposed/computed/CITY_A/{partition}",
+        }
+    ]
+
+
+def _city_output(city):
+    metrics = {"duration_s": 1.5, "phases": {"fetch": 1.0, "upsert": 0.5}, "bytes_read": 10, "rows": 24}
+    return {"city": city, "results": [{"city": city, "stage": "etl", "status": "SUCCESS", "metrics": metrics}]}
+
+
+def test_call_activities(run_orchestration):
     mock_context = MagicMock()
+    mock_context.instance_id = "run"
+    mock_context.get_input.return_value = None
+    mock_context.task_all.return_value = "shards"
+    start, end = datetime.datetime(2024, 7, 20, 6, 0), datetime.datetime(2024, 7, 20, 6, 30)
+    type(mock_context).current_utc_datetime = PropertyMock(side_effect=itertools.chain([start], itertools.repeat(end)))
     orchestrator = WeatherDataflowOrchestrator()
-    with patch.object(orchestrator, "run_activities") as mock_run_activities:
-        list(orchestrator.call_activities(mock_context))
-        test_inputs_extract = [
-            {"city": "PARIS", "dest_path": "exec/internal/raw/PARIS"},
-            {"city": "MARSEILLE", "dest_path": "exec/internal/raw/MARSEILLE"},
-            {"city": "LYON", "dest_path": "exec/internal/raw/LYON"},
-        ]
-        test_inputs_transform = [
-            {"city": "PARIS", "src_path": "exec/internal/raw/PARIS", "dest_path": "exec/internal/transformed/PARIS"},
-            {
-                "city": "MARSEILLE",
-                "src_path": "exec/internal/raw/MARSEILLE",
-                "dest_path": "exec/internal/transformed/MARSEILLE",
-            },
-            {"city": "LYON", "src_path": "exec/internal/raw/LYON", "dest_path": "exec/internal/transformed/LYON"},
-        ]
-        test_inputs_load = [
-            {
-                "city": "PARIS",
-                "src_path": "exec/internal/transformed/PARIS",
-                "archive_path": "exec/exposed/computed/PARIS",
-            },
-            {
-                "city": "MARSEILLE",
-                "src_path": "exec/internal/transformed/MARSEILLE",
-                "archive_path": "exec/exposed/computed/MARSEILLE",
-            },
-            {
-                "city": "LYON",
-                "src_path": "exec/internal/transformed/LYON",
-                "archive_path": "exec/exposed/computed/LYON",
-            },
+    orchestrator.settings = orchestrator.settings.copy(deep=True)
+    orchestrator.settings.ORCHESTRATION_SETTINGS.SHARD_SIZE = 2
+
+    city_outputs = [_city_output("PARIS"), _city_output("MARSEILLE"), _city_output("LYON")]
+
+    output = run_orchestration(
+        orchestrator.call_activities(mock_context),
+        ["PARIS", "MARSEILLE", "LYON"],
+        [city_outputs[:2], city_outputs[2:]],
+        "SUCCESS",
+    )
+
+    assert mock_context.call_activity_with_retry.call_args_list[0].args[0] == "weather_data_flow_catalog_activity"
+    mock_context.call_sub_orchestrator.assert_has_calls(
+        [
+            call(
+                "weather_data_flow_shard_orchestrator",
+                {"cities": ["PARIS", "MARSEILLE"], "partition_date": None, "mode": "staged", "force": False},
+                "run:shard-0",
+            ),
+            call(
+                "weather_data_flow_shard_orchestrator",
+                {"cities": ["LYON"], "partition_date": None, "mode": "staged", "force": False},
+                "run:shard-1",
+            ),
         ]
+    )
+    assert output == city_outputs
+    metrics_input = mock_context.call_activity.call_args_list[-1].args[1]
+    assert mock_context.call_activity.call_args_list[-1].args[0] == "weather_data_flow_metrics_activity"
+    assert metrics_input["run_id"] == "run"
+    assert metrics_input["run_time"] == start.isoformat()
+    assert [(record["city"], record["stage"], record["rows"]) for record in metrics_input["records"]] == [
+        ("PARIS", "etl", 24),
+        ("MARSEILLE", "etl", 24),
+        ("LYON", "etl", 24),
+    ]
+
+
+def test_call_activities_with_input_cities():
+    mock_context = MagicMock()
+    mock_context.get_input.return_value = {"cities": ["NICE"], "mode": "fused"}
+    orchestrator = WeatherDataflowOrchestrator()
+
+    with patch.object(orchestrator, "run_sub_orchestrators") as mock_run_sub_orchestrators:
+        list(orchestrator.call_activities(mock_context))
+
+    mock_context.call_activity.assert_not_called()
+    assert mock_run_sub_orchestrators.call_args[0][2] == [
+        {"cities": ["NICE"], "partition_date": None, "mode": "fused", "force": False}
+    ]
 
-        assert mock_run_activities.call_count == 3
 
-        mock_run_activities.assert_any_call(mock_context, "weather_data_flow_extract_activity", test_inputs_extract)
-        mock_run_activities.assert_any_call(mock_context, "weather_data_flow_transform_activity", test_inputs_transform)
-        mock_run_activities.assert_any_call(mock_context, "weather_data_flow_load_activity", test_inputs_load)
+def test_build_etl_inputs():
+    orchestrator = WeatherDataflowOrchestrator()
+
+    assert orchestrator._build_etl_inputs(["CITY_A"]) == [
+        {"city": "CITY_A", "raw_path": "exec/internal/raw/CITY_A", "archive_path": "exec/exposed/computed/CITY_A"}
+    ]
 
 
 def test_call_activities_failure():
@@ -75,7 +132,7 @@ def test_call_activities_failure():
     orchestrator = WeatherDataflowOrchestrator()
 
     with (
-        patch.object(orchestrator, "run_activities", side_effect=Exception("Error!")),
+        patch.object(orchestrator, "run_sub_orchestrators", side_effect=Exception("Error!")),
         patch.object(orchestrator, "conditional_log") as mock_log,
     ):
         list(orchestrator.call_activities(mock_context))
@@ -0,0 +1,152 @@
+from unittest import mock
+from unittest.mock import patch
+
+from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_shard_orchestrator import (
+    WeatherShardDataflowOrchestrator,
+)
+
+_FRESH_STATE = {"expires": "Sat, 20 Jul 2024 09:00:00 GMT", "loaded_checksum": "abc", "latitude": 43.7}
+_EXPIRED_STATE = {"expires": "Sat, 20 Jul 2024 07:00:00 GMT", "loaded_checksum": "def", "last_modified": "x"}
+
+
+def _no_sub_orchestrators(*_):
+    return []
+    yield  # pylint: disable=unreachable
+
+
+def test_call_activities(orchestration_context, run_orchestration):
+    mock_context = orchestration_context({"cities": ["PARIS", "LYON"], "partition_date": "2024-07-20"}, "run:shard-0")
+    orchestrator = WeatherShardDataflowOrchestrator()
+
+    with patch.object(orchestrator, "run_sub_orchestrators") as mock_run_sub_orchestrators:
+        mock_run_sub_orchestrators.side_effect = _no_sub_orchestrators
+        run_orchestration(orchestrator.call_activities(mock_context), [None, _EXPIRED_STATE])
+
+    _, orchestrator_name, inputs, instance_ids = mock_run_sub_orchestrators.call_args[0]
+    assert orchestrator_name == "weather_data_flow_city_orchestrator"
+    assert [input_["city"] for input_ in inputs] == ["PARIS", "LYON"]
+    assert inputs[0]["extract"] == {
+        "city": "PARIS",
+        "dest_path": "exec/internal/raw/PARIS/year=2024/month=07/day=20",
+        "file_date": "2024-07-20",
+        "state": {},
+    }
+    assert inputs[1]["extract"]["state"] == _EXPIRED_STATE
+    assert inputs[0]["load"]["loaded_checksum"] is None
+    assert inputs[1]["load"]["loaded_checksum"] == "def"
+    assert instance_ids == ["run:shard-0:PARIS", "run:shard-0:LYON"]
+    assert [call_.args[1] for call_ in mock_context.call_entity.call_args_list] == ["get", "get"]
+
+
+def test_call_activities_skips_fresh_cities(orchestration_context, run_orchestration):
+    mock_context = orchestration_context({"cities": ["PARIS", "NICE"], "partition_date": None}, "run:shard-0")
+    orchestrator = WeatherShardDataflowOrchestrator()
+
+    with patch.object(orchestrator, "run_sub_orchestrators") as mock_run_sub_orchestrators:
+        mock_run_sub_orchestrators.side_effect = _no_sub_orchestrators
+        output = run_orchestration(orchestrator.call_activities(mock_context), [{}, _FRESH_STATE])
+
+    assert [input_["city"] for input_ in mock_run_sub_orchestrators.call_args[0][2]] == ["PARIS"]
+    assert output == [{"city": "NICE", "results": [{"city": "NICE", "stage": "freshness", "status": "SKIPPED"}]}]
+
+
+def test_call_activities_all_fresh(orchestration_context, run_orchestration):
+    mock_context = orchestration_context({"cities": ["NICE"], "partition_date": None}, "run:shard-0")
+    orchestrator = WeatherShardDataflowOrchestrator()
+
+    with patch.object(orchestrator, "run_sub_orchestrators") as mock_run_sub_orchestrators:
+        output = run_orchestration(orchestrator.call_activities(mock_context), [_FRESH_STATE])
+
+    mock_run_sub_orchestrators.assert_not_called()
+    assert output[0]["results"][0]["status"] == "SKIPPED"
+
+
+def test_call_activities_force(orchestration_context, run_orchestration):
+    mock_context = orchestration_context({"cities": ["NICE"], "partition_date": None, "force": True}, "run:shard-0")
+    orchestrator = WeatherShardDataflowOrchestrator()
+
+    with patch.object(orchestrator, "run_sub_orchestrators") as mock_run_sub_orchestrators:
+        mock_run_sub_orchestrators.side_effect = _no_sub_orchestrators
+        run_orchestration(orchestrator.call_activities(mock_context), [_FRESH_STATE])
+
+    assert [input_["city"] for input_ in mock_run_sub_orchestrators.call_args[0][2]] == ["NICE"]
+
+
+def _succeeded(city):
+    return {"city": city, "stage": "etl", "status": "SUCCESS", "state": {"expires": "e", "loaded_checksum": city}}
+
+
+def _failed(city):
+    return {"city": city, "stage": "etl", "status": "FAILURE", "error": "API error", "state": {"latitude": 45.7}}
+
+
+def test_call_activities_fused(orchestration_context, run_orchestration):
+    mock_context = orchestration_context(
+        {"cities": ["PARIS", "LYON", "NICE"], "partition_date": None, "mode": "fused"}, "run:shard-0"
+    )
+    mock_context.task_all.return_value = "batches"
+    orchestrator = WeatherShardDataflowOrchestrator()
+    orchestrator.settings = orchestrator.settings.copy(deep=True)
+    orchestrator.settings.ORCHESTRATION_SETTINGS.ETL_BATCH_SIZE = 2
+
+    output = run_orchestration(
+        orchestrator.call_activities(mock_context),
+        [{}, {}, {"latitude": 43.7}],
+        [[_succeeded("PARIS"), _failed("LYON")], [_succeeded("NICE")]],
+    )
+
+    batches = [call_.args[2]["cities"] for call_ in mock_context.call_activity_with_retry.call_args_list]
+    assert [[input_["city"] for input_ in batch] for batch in batches] == [["PARIS", "LYON"], ["NICE"]]
+    assert batches[0][0] == {
+        "city": "PARIS",
+        "raw_path": "exec/internal/raw/PARIS",
+        "archive_path": "exec/exposed/computed/PARIS",
+        "state": {},
+    }
+    assert batches[1][0]["state"] == {"latitude": 43.7}
+    mock_context.call_sub_orchestrator.assert_not_called()
+    assert output == [
+        {"city": "PARIS", "results": [_succeeded("PARIS")]},
+        {"city": "LYON", "results": [_failed("LYON")]},
+        {"city": "NICE", "results": [_succeeded("NICE")]},
+    ]
+    signals = [(call_.args[0].key, call_.args[2]) for call_ in mock_context.signal_entity.call_args_list]
+    assert signals == [
+        ("PARIS", {"expires": "e", "loaded_checksum": "PARIS"}),
+        ("LYON", {"latitude": 45.7}),
+        ("NICE", {"expires": "e", "loaded_checksum": "NICE"}),
+    ]
+
+
+def test_call_activities_reports_failed_cities(orchestration_context, run_orchestration):
+    mock_context = orchestration_context({"cities": ["PARIS", "NICE"], "partition_date": None}, "run:shard-0")
+    orchestrator = WeatherShardDataflowOrchestrator()
+
+    with patch.object(orchestrator, "run_sub_orchestrators", side_effect=RuntimeError("boom")):
+        output = run_orchestration(orchestrator.call_activities(mock_context), [{}, _FRESH_STATE])
+
+    assert output == [
+        {"city": "NICE", "results": [{"city": "NICE", "stage": "freshness", "status": "SKIPPED"}]},
+        {"city": "PARIS", "results": [{"city": "PARIS", "stage": "shard", "status": "FAILURE", "error": "boom"}]},
+    ]
+
+
+def test_call_activities_fused_missing_results(orchestration_context, run_orchestration):
+    mock_context = orchestration_context(
+        {"cities": ["PARIS", "LYON", "NICE"], "partition_date": None, "mode": "fused"}, "run:shard-0"
+    )
+    mock_context.task_all.return_value = "batches"
+    orchestrator = WeatherShardDataflowOrchestrator()
+    orchestrator.settings = orchestrator.settings.copy(deep=True)
+    orchestrator.settings.ORCHESTRATION_SETTINGS.ETL_BATCH_SIZE = 2
+    missing_key = {"city": None, "stage": "etl", "status": "MISSING_KEY", "error": "'cities'"}
+
+    output = run_orchestration(
+        orchestrator.call_activities(mock_context), [{}, {}, {}], [[missing_key], [_succeeded("NICE")]]
+    )
+
+    assert output == [
+        {"city": "PARIS", "results": [{"city": "PARIS", "stage": "etl", "status": "FAILURE", "error": mock.ANY}]},
+        {"city": "LYON", "results": [{"city": "LYON", "stage": "etl", "status": "FAILURE", "error": mock.ANY}]},
+        {"city": "NICE", "results": [_succeeded("NICE")]},
+    ]
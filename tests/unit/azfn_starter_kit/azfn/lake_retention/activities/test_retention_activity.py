@@ -0,0 +1,33 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from azfn_starter_kit.azfn.lake_retention.activities.retention_activity import RetentionActivity
+
+INPUT = {"layer_path": "raw", "max_age_days": 30, "reference_time": "2024-07-20T00:00:00+00:00", "dry_run": False}
+
+
+@pytest.fixture
+def retention_activity():
+    activity = RetentionActivity()
+    activity.logger = MagicMock()
+    activity.fs_ = MagicMock()
+    return activity
+
+
+@pytest.mark.parametrize(
+    "input_, expected_status, exception",
+    [
+        (INPUT, "RETENTION SUCCESS", None),
+        ({}, "RETENTION MISSING_KEY", None),
+        (INPUT, "RETENTION FAILURE", Exception("Global exception")),
+    ],
+)
+def test_process(retention_activity, input_, expected_status, exception):
+    with patch(
+        "azfn_starter_kit.azfn.lake_retention.activities.retention_activity.apply_retention"
+    ) as mock_apply_retention:
+        mock_apply_retention.return_value = {"layer_path": "raw"}
+        if exception:
+            mock_apply_retention.side_effect = exception
+        assert retention_activity.process(input_)["status"] == expected_status
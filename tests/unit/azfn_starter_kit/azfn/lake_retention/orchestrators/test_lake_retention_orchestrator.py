@@ -0,0 +1,35 @@
+import datetime
+from unittest.mock import MagicMock, patch
+
+from azfn_starter_kit.azfn.lake_retention.orchestrators.lake_retention_orchestrator import (
+    LakeRetentionOrchestrator,
+)
+
+
+def test_build_inputs():
+    orchestrator = LakeRetentionOrchestrator()
+
+    inputs = orchestrator._build_inputs(datetime.datetime(2024, 7, 20, tzinfo=datetime.timezone.utc), dry_run=False)
+
+    assert [input_["layer_path"] for input_ in inputs] == [
+        "exec/internal/raw",
+        "exec/internal/transformed",
+        "exec/exposed/computed",
+    ]
+    assert inputs[2]["action"] == "compact"
+    assert all(input_["reference_time"] == "2024-07-20T00:00:00+00:00" for input_ in inputs)
+    assert not any(input_["dry_run"] for input_ in inputs)
+
+
+def test_call_activities_uses_client_dry_run():
+    mock_context = MagicMock()
+    mock_context.get_input.return_value = {"dry_run": False}
+    mock_context.current_utc_datetime = datetime.datetime(2024, 7, 20, tzinfo=datetime.timezone.utc)
+    orchestrator = LakeRetentionOrchestrator()
+
+    with patch.object(orchestrator, "run_activities") as mock_run_activities:
+        list(orchestrator.call_activities(mock_context))
+
+    inputs = mock_run_activities.call_args[0][2]
+    mock_run_activities.assert_called_once_with(mock_context, "lake_retention_activity", inputs)
+    assert not any(input_["dry_run"] for input_ in inputs)
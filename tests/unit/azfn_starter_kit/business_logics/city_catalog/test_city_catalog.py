@@ -0,0 +1,39 @@
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from azfn_starter_kit.business_logics.weather.city_catalog.city_catalog import load_city_catalog
+from azfn_starter_kit.config.orchestration_config import OrchestrationConfig
+
+
+def test_load_city_catalog_from_settings():
+    settings = OrchestrationConfig(CATALOG_SOURCE="settings", CITIES=["PARIS", " LYON ", "PARIS", ""])
+
+    assert load_city_catalog(settings, mock.Mock()) == ["PARIS", "LYON"]
+
+
+def test_load_city_catalog_from_lake():
+    fs_ = mock.Mock()
+    fs_.read_csv.return_value = pd.DataFrame({"city": ["NICE", "LILLE"]})
+    settings = OrchestrationConfig(CATALOG_SOURCE="lake")
+
+    assert load_city_catalog(settings, fs_) == ["NICE", "LILLE"]
+    fs_.read_csv.assert_called_once_with(settings.CATALOG_PATH, settings.CATALOG_FILE_NAME, usecols=["city"])
+
+
+def test_load_city_catalog_from_sql():
+    settings = OrchestrationConfig(CATALOG_SOURCE="sql")
+    with (
+        mock.patch("azfn_starter_kit.business_logics.weather.city_catalog.city_catalog.AzureSQLConfig"),
+        mock.patch("azfn_starter_kit.business_logics.weather.city_catalog.city_catalog.DatabaseEngine") as db_mock,
+    ):
+        db_mock.return_value.sql_to_df.return_value = pd.DataFrame({"city": ["BREST"]})
+
+        assert load_city_catalog(settings, mock.Mock()) == ["BREST"]
+        db_mock.return_value.sql_to_df.assert_called_once_with("city", columns=["city"])
+
+
+def test_load_city_catalog_unknown_source():
+    with pytest.raises(ValueError):
+        load_city_catalog(OrchestrationConfig(CATALOG_SOURCE="ftp"), mock.Mock())
@@ -0,0 +1,98 @@
+import datetime
+import json
+from unittest import mock
+
+import pandas as pd
+
+from azfn_starter_kit.business_logics.weather.data_backfill.weather_backfill import (
+    bulk_upsert_weather_data,
+    find_raw_files,
+    weather_backfill_city,
+)
+from azfn_starter_kit.common.fs.memory_file_system import InMemoryFileSystemClient
+
+_MODULE = "azfn_starter_kit.business_logics.weather.data_backfill.weather_backfill"
+
+
+def _weather_data(temperature):
+    return json.dumps(
+        {
+            "properties": {
+                "timeseries": [
+                    {
+                        "time": "2024-10-04T07:00:00.000Z",
+                        "data": {
+                            "instant": {"details": {"air_temperature": temperature, "relative_humidity": 50.0}},
+                            "next_1_hours": {"summary": {"symbol_code": "cloudy"}},
+                        },
+                    }
+                ]
+            }
+        }
+    )
+
+
+def _weather_frame(city, temperature):
+    return pd.DataFrame(
+        {
+            "city": [city],
+            "date": ["2024-10-04T07:00:00.000Z"],
+            "temperature": [temperature],
+            "humidity_level": [50.0],
+            "weather_description": ["cloudy"],
+        }
+    )
+
+
+def test_weather_backfill_city():
+    fs_ = InMemoryFileSystemClient("raw", "transformed", "computed")
+    fs_.write_file("raw/paris", "WEATHER_paris_20241004.json", _weather_data(22.5), compression="gzip")
+    fs_.write_file("raw/paris", "WEATHER_paris_20241005.json", _weather_data(18.0))
+
+    data = weather_backfill_city("paris", fs_, "raw/paris", "computed/paris", datetime.date(2024, 10, 4))
+
+    pd.testing.assert_frame_equal(data, _weather_frame("paris", 22.5))
+    assert fs_.list_files("computed/paris") == ["WEATHER_paris_20241004.parquet"]
+
+
+def test_weather_backfill_city_without_raw_file():
+    fs_ = InMemoryFileSystemClient("raw", "transformed", "computed")
+
+    data = weather_backfill_city("paris", fs_, "raw/paris", "computed/paris", datetime.date(2024, 10, 4))
+
+    assert data.empty
+    assert list(data.columns) == ["city", "date", "temperature", "humidity_level", "weather_description"]
+    assert fs_.list_files("computed") == []
+
+
+def test_find_raw_files_missing_path():
+    fs_ = mock.Mock()
+    fs_.list_files.side_effect = FileNotFoundError("raw/paris")
+
+    assert find_raw_files("paris", fs_, "raw/paris", datetime.date(2024, 10, 4)) == []
+    fs_.list_files.assert_called_once_with("raw/paris", pattern="WEATHER_paris_20241004")
+
+
+def test_bulk_upsert_weather_data():
+    frames = [
+        _weather_frame("paris", 22.5),
+        pd.DataFrame(),
+        _weather_frame("lyon", 20.0),
+        _weather_frame("paris", 23.0),
+    ]
+
+    with mock.patch(f"{_MODULE}.upsert_weather_data") as upsert_mock:
+        rows = bulk_upsert_weather_data(frames)
+
+    assert rows == 2
+    upsert_mock.assert_called_once()
+    loaded = upsert_mock.call_args[0][0].sort_values("city").reset_index(drop=True)
+    assert loaded["city"].tolist() == ["lyon", "paris"]
+    assert loaded["temperature"].tolist() == [20.0, 23.0]
+
+
+def test_bulk_upsert_weather_data_nothing_to_load():
+    with mock.patch(f"{_MODULE}.upsert_weather_data") as upsert_mock:
+        assert bulk_upsert_weather_data([pd.DataFrame()]) == 0
+
+    upsert_mock.assert_not_called()
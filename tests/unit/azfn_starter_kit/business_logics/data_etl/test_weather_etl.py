@@ -0,0 +1,96 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pandas as pd
+
+from azfn_starter_kit.business_logics.weather.data_etl.weather_etl import weather_etl_process
+from azfn_starter_kit.common.fs.memory_file_system import InMemoryFileSystemClient
+
+_WEATHER_DATA = json.dumps(
+    {
+        "properties": {
+            "timeseries": [
+                {
+                    "time": "2024-10-04T07:00:00.000Z",
+                    "data": {
+                        "instant": {"details": {"air_temperature": 22.5, "relative_humidity": 50.0}},
+                        "next_1_hours": {"summary": {"symbol_code": "cloudy"}},
+                    },
+                }
+            ]
+        }
+    }
+)
+
+_MODULE = "azfn_starter_kit.business_logics.weather.data_etl.weather_etl"
+
+
+def _fetch(city, state, metrics):
+    state["expires"] = "Fri, 04 Oct 2024 08:00:00 GMT"
+    return _WEATHER_DATA
+
+
+def test_weather_etl_process():
+    fs_ = InMemoryFileSystemClient("raw", "transformed", "computed")
+    state = {}
+
+    with (
+        mock.patch(f"{_MODULE}.fetch_weather_forecast", side_effect=_fetch),
+        mock.patch(f"{_MODULE}.weather_file_name", return_value="WEATHER_paris_20241004.json"),
+        mock.patch(f"{_MODULE}.upsert_weather_data") as upsert_mock,
+        ThreadPoolExecutor() as executor,
+    ):
+        writes = weather_etl_process(
+            "paris", fs_, "raw/paris", "computed/paris", executor, compression="gzip", state=state
+        )
+        for write in writes:
+            write.result()
+
+    expected = pd.DataFrame(
+        {
+            "date": ["2024-10-04T07:00:00.000Z"],
+            "temperature": [22.5],
+            "humidity_level": [50.0],
+            "weather_description": ["cloudy"],
+            "city": ["paris"],
+        }
+    )
+    pd.testing.assert_frame_equal(upsert_mock.call_args[0][0].reset_index(drop=True), expected)
+    assert fs_.list_files("raw/paris") == ["WEATHER_paris_20241004.json.gz"]
+    pd.testing.assert_frame_equal(fs_.read_parquet("computed/paris", "WEATHER_paris_20241004.parquet"), expected)
+    assert fs_.list_files("transformed") == []
+    assert state["expires"] == "Fri, 04 Oct 2024 08:00:00 GMT"
+    assert state["raw_file"]
+    assert len(state["loaded_checksum"]) == 64
+
+
+def test_weather_etl_process_unchanged_data():
+    fs_ = InMemoryFileSystemClient("raw", "transformed", "computed")
+    state = {}
+
+    with (
+        mock.patch(f"{_MODULE}.fetch_weather_forecast", side_effect=_fetch),
+        mock.patch(f"{_MODULE}.upsert_weather_data") as upsert_mock,
+        ThreadPoolExecutor() as executor,
+    ):
+        for _ in range(2):
+            for write in weather_etl_process("paris", fs_, "raw/paris", "computed/paris", executor, state=state):
+                write.result()
+
+    upsert_mock.assert_called_once()
+
+
+def test_weather_etl_process_not_modified():
+    fs_ = mock.Mock()
+
+    with (
+        mock.patch(f"{_MODULE}.fetch_weather_forecast", return_value=None),
+        mock.patch(f"{_MODULE}.upsert_weather_data") as upsert_mock,
+        ThreadPoolExecutor() as executor,
+    ):
+        writes = weather_etl_process("paris", fs_, "raw/paris", "computed/paris", executor)
+
+    assert writes == []
+    upsert_mock.assert_not_called()
+    fs_.write_file.assert_not_called()
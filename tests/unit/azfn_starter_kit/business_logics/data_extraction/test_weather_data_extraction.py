@@ -8,6 +8,8 @@ from requests import RequestException
 from azfn_starter_kit.business_logics.weather.data_extraction.weather_data_extraction import (
     WeatherAPIError,
     extract_weather_data,
+    fetch_weather_forecast,
+    weather_file_name,
 )
 
 
@@ -28,9 +30,9 @@ def test_extract_weather_data_success():
 
         extract_weather_data("Paris", mock_fs, "/path/to/file")
 
-        current_date = datetime.datetime.now().strftime("%Y%m%d")
+        current_date = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%d")
         expected_file_name = f"WEATHER_Paris_{current_date}.json"
-        mock_fs.write_file.assert_called_with("/path/to/file", expected_file_name, expected_data)
+        mock_fs.write_file.assert_called_with("/path/to/file", expected_file_name, expected_data, compression=None)
 
 
 @patch("azfn_starter_kit.business_logics.weather.data_extraction.weather_data_extraction.time.sleep")
@@ -39,3 +41,36 @@ def test_extract_weather_data_failure(mock_sleep):
         mock_fs = mock.Mock()
         with pytest.raises(WeatherAPIError, match="Maximum retries reached. API call failed."):
             extract_weather_data("Paris", mock_fs, "/path/to/file")
+
+
+def test_fetch_weather_forecast_not_modified():
+    state = {"latitude": 48.85, "longitude": 2.35, "last_modified": "Fri, 04 Oct 2024 06:00:00 GMT"}
+    with (
+        mock.patch("requests.get") as mocked_get,
+        mock.patch(
+            "azfn_starter_kit.business_logics.weather.data_extraction.weather_data_extraction.Nominatim"
+        ) as mocked_geocoder,
+    ):
+        mocked_get.return_value = mock.Mock(status_code=304, headers={"Expires": "Fri, 04 Oct 2024 08:00:00 GMT"})
+
+        assert fetch_weather_forecast("Paris", state) is None
+
+    mocked_geocoder.assert_not_called()
+    assert "lat=48.85&lon=2.35" in mocked_get.call_args.args[0]
+    assert mocked_get.call_args.kwargs["headers"]["If-Modified-Since"] == "Fri, 04 Oct 2024 06:00:00 GMT"
+    assert state["expires"] == "Fri, 04 Oct 2024 08:00:00 GMT"
+
+
+def test_extract_weather_data_not_modified():
+    mock_fs = mock.Mock()
+    with mock.patch(
+        "azfn_starter_kit.business_logics.weather.data_extraction.weather_data_extraction.fetch_weather_forecast",
+        return_value=None,
+    ):
+        assert extract_weather_data("Paris", mock_fs, "/path/to/file", state={}) is None
+
+    mock_fs.write_file.assert_not_called()
+
+
+def test_weather_file_name_uses_the_given_date():
+    assert weather_file_name("Paris", date_=datetime.date(2024, 7, 20)) == "WEATHER_Paris_20240720.json"
@@ -5,7 +5,10 @@ import pandas as pd
 import pytest
 from azure.identity import DefaultAzureCredential
 
-from azfn_starter_kit.business_logics.weather.data_loading.weather_data_loading import weather_loading_process
+from azfn_starter_kit.business_logics.weather.data_loading.weather_data_loading import (
+    weather_data_checksum,
+    weather_loading_process,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -36,7 +39,7 @@ def test_weather_loading_process_with_data():
     ) as db_:
         db_.return_value = True
         fs_ = mock.Mock()
-        fs_.list_files.return_value = ["element1"]
+        fs_.latest_file.return_value = "element1"
         fs_.read_parquet.return_value = df_weather
         fs_.write_parquet.return_value = True
         os.environ["DB_SERVER"] = "tata"
@@ -44,6 +47,11 @@ def test_weather_loading_process_with_data():
 
         weather_loading_process("Paris", fs_, "/mnt/source", "/mnt/destination")
 
+        fs_.copy_files.assert_called_once_with(
+            "/mnt/source", "/mnt/destination", ["element1"], dest_files_name=["element1.parquet"]
+        )
+        fs_.write_parquet.assert_not_called()
+        fs_.read_parquet.assert_called_once_with("/mnt/source", "element1")
         db_.assert_called_once_with(
             df_weather,
             "weather",
@@ -51,3 +59,29 @@ def test_weather_loading_process_with_data():
             "upsert",
             columns=["city", "date", "temperature", "humidity_level", "weather_description"],
         )
+
+
+def test_weather_loading_process_unchanged_data():
+    df_weather = pd.DataFrame(
+        {
+            "city": ["Paris"],
+            "date": ["2024-10-04T07:00:00.000Z"],
+            "temperature": [22.5],
+            "humidity_level": [50.0],
+            "weather_description": ["10d"],
+        }
+    )
+    fs_ = mock.Mock()
+    fs_.latest_file.return_value = "element1"
+    fs_.read_parquet.return_value = df_weather
+
+    with mock.patch(
+        "azfn_starter_kit.business_logics.weather.data_loading.weather_data_loading.upsert_weather_data"
+    ) as upsert_mock:
+        checksum = weather_loading_process("Paris", fs_, "/mnt/source", "/mnt/destination")
+        assert checksum == weather_data_checksum(df_weather.set_index(pd.Index([3])))
+        unchanged = weather_loading_process("Paris", fs_, "/mnt/source", "/mnt/destination", loaded_checksum=checksum)
+        assert unchanged is None
+
+    upsert_mock.assert_called_once()
+    assert fs_.copy_files.call_count == 2
@@ -5,11 +5,12 @@ import pandas as pd
 from azfn_starter_kit.business_logics.weather.data_transformation.weather_data_transform import (
     weather_transform_process,
 )
+from azfn_starter_kit.utilities.metrics import ActivityMetrics
 
 
 def test_weather_transform_process():
     mock_fs = mock.Mock()
-    mock_fs.list_files.return_value = ["element1"]
+    mock_fs.latest_file.return_value = "element1"
     mock_fs.read_json.return_value = pd.DataFrame(
         {
             "properties": [
@@ -42,4 +43,35 @@ def test_weather_transform_process():
     assert args[0] == "/dest/path"
     assert args[1] == "element1"
     assert args[2].equals(excepted_result)
+    assert mock_fs.write_parquet.call_args[1] == {"sort_by": ["city", "date"]}
     mock_fs.write_parquet.assert_called_once()
+
+
+def test_weather_transform_process_compressed_raw_file():
+    mock_fs = mock.Mock()
+    mock_fs.latest_file.return_value = "WEATHER_paris_20241004.json.gz"
+    mock_fs.read_json.return_value = pd.DataFrame(
+        {
+            "properties": [
+                {
+                    "timeseries": [
+                        {
+                            "time": "2024-10-04T07:00:00.000Z",
+                            "data_instant_details_air_temperature": 22.5,
+                            "data_instant_details_relative_humidity": 50.0,
+                            "data_next_1_hours_summary_symbol_code": "cloudy",
+                        }
+                    ]
+                }
+            ]
+        }
+    )
+    mock_fs.write_parquet.return_value = 2048
+    metrics = ActivityMetrics()
+
+    weather_transform_process("paris", mock_fs, "/src/path", "/dest/path", metrics=metrics)
+
+    mock_fs.read_json.assert_called_once_with("/src/path", "WEATHER_paris_20241004.json.gz", lines=True)
+    assert (metrics.rows, metrics.bytes_written) == (1, 2048)
+    assert set(metrics.phases) == {"download", "parse", "upload"}
+    assert mock_fs.write_parquet.call_args[0][1] == "WEATHER_paris_20241004.json"
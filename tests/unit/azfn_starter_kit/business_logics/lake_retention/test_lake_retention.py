@@ -0,0 +1,66 @@
+import datetime
+
+import pandas as pd
+import pytest
+
+from azfn_starter_kit.business_logics.lake_retention.lake_retention import apply_retention
+from azfn_starter_kit.common.fs.memory_file_system import InMemoryFileSystemClient
+
+NOW = datetime.datetime(2024, 7, 20, tzinfo=datetime.timezone.utc)
+OLD = datetime.datetime(2024, 5, 10, tzinfo=datetime.timezone.utc)
+
+
+@pytest.fixture
+def fs_client() -> InMemoryFileSystemClient:
+    fs_client = InMemoryFileSystemClient("raw", "transformed", "computed")
+    for city, day in (("PARIS", "19"), ("PARIS", "20"), ("LYON", "20")):
+        data = pd.DataFrame({"city": [city], "date": [f"2024-05-{day}"], "temperature": [20.0]})
+        fs_client.write_parquet(f"computed/{city}/year=2024/month=05/day={day}", f"WEATHER_{city}.parquet", data)
+    fs_client.write_file("computed/PARIS/year=2024/month=07/day=20", "WEATHER_PARIS.parquet", "recent")
+    for key, (content, _) in fs_client.store.items():
+        if "month=05" in key:
+            fs_client.store[key] = (content, OLD)
+    return fs_client
+
+
+def test_dry_run_only_reports(fs_client):
+    files_before = dict(fs_client.store)
+
+    report = apply_retention(fs_client, "computed", 30, NOW, action="compact")
+
+    assert report["expired_files"] == [
+        "LYON/year=2024/month=05/day=20/WEATHER_LYON.parquet",
+        "PARIS/year=2024/month=05/day=19/WEATHER_PARIS.parquet",
+        "PARIS/year=2024/month=05/day=20/WEATHER_PARIS.parquet",
+    ]
+    assert report["deleted_directories"] == ["LYON/year=2024", "PARIS/year=2024/month=05"]
+    assert fs_client.store == files_before
+
+
+def test_delete(fs_client):
+    apply_retention(fs_client, "computed", 30, NOW, dry_run=False)
+
+    assert fs_client.list_files("computed") == ["PARIS/year=2024/month=07/day=20/WEATHER_PARIS.parquet"]
+
+
+def test_compact(fs_client):
+    report = apply_retention(fs_client, "computed", 30, NOW, action="compact", dry_run=False)
+
+    assert report["compacted_files"] == ["LYON/COMPACTED_202405.parquet", "PARIS/COMPACTED_202405.parquet"]
+    assert fs_client.list_files("computed/PARIS") == [
+        "COMPACTED_202405.parquet",
+        "year=2024/month=07/day=20/WEATHER_PARIS.parquet",
+    ]
+    compacted = fs_client.read_parquet("computed/PARIS", "COMPACTED_202405.parquet")
+    assert compacted["date"].tolist() == ["2024-05-19", "2024-05-20"]
+
+    fs_client.store["computed/PARIS/COMPACTED_202405.parquet"] = (
+        fs_client.store["computed/PARIS/COMPACTED_202405.parquet"][0],
+        OLD,
+    )
+    assert apply_retention(fs_client, "computed", 30, NOW, action="compact")["expired_files"] == []
+
+
+def test_unknown_action(fs_client):
+    with pytest.raises(ValueError):
+        apply_retention(fs_client, "computed", 30, NOW, action="archive")
@@ -0,0 +1,54 @@
+import datetime
+from unittest import mock
+
+from azfn_starter_kit.business_logics.run_metrics.run_metrics import RUN_METRICS_COLUMNS, persist_run_metrics
+from azfn_starter_kit.common.fs.memory_file_system import InMemoryFileSystemClient
+
+RUN_TIME = datetime.datetime(2024, 7, 20, 6, 30, tzinfo=datetime.timezone.utc)
+RECORDS = [
+    {
+        "city": "PARIS",
+        "stage": "extract",
+        "status": "SUCCESS",
+        "duration_s": 1.5,
+        "phases": {"geocode": 0.5, "fetch": 1.0},
+        "bytes_read": 2048,
+        "bytes_written": 2048,
+        "rows": 0,
+        "retries": 1,
+    }
+]
+
+
+def test_persist_run_metrics():
+    fs_ = InMemoryFileSystemClient("raw", "transformed", "computed")
+
+    with mock.patch("azfn_starter_kit.business_logics.run_metrics.run_metrics.DatabaseEngine") as db_mock:
+        persist_run_metrics(fs_, "metrics", "run_metrics", "run:1", RUN_TIME, RECORDS)
+
+    metrics = fs_.read_parquet("metrics/year=2024/month=07/day=20", "RUN_METRICS_run_1_20240720T063000.parquet")
+    assert list(metrics.columns) == RUN_METRICS_COLUMNS
+    assert metrics.loc[0, "run_id"] == "run:1"
+    assert metrics.loc[0, "phases"] == '{"fetch": 1.0, "geocode": 0.5}'
+    assert metrics.loc[0, "retries"] == 1
+
+    sql_metrics, table, keys, action = db_mock.return_value.df_to_sql.call_args[0]
+    assert (table, keys, action) == ("run_metrics", ["run_id", "run_time", "city", "stage"], "insert")
+    assert len(sql_metrics) == 1
+
+
+def test_persist_run_metrics_of_runs_on_the_same_day():
+    fs_ = InMemoryFileSystemClient("raw", "transformed", "computed")
+    later_records = [{**RECORDS[0], "city": "LYON"}]
+
+    with mock.patch("azfn_starter_kit.business_logics.run_metrics.run_metrics.DatabaseEngine"):
+        persist_run_metrics(fs_, "metrics", "run_metrics", "run", RUN_TIME, RECORDS)
+        persist_run_metrics(fs_, "metrics", "run_metrics", "run", RUN_TIME + datetime.timedelta(hours=6), later_records)
+
+    partition = "metrics/year=2024/month=07/day=20"
+    assert sorted(fs_.list_files(partition)) == [
+        "RUN_METRICS_run_20240720T063000.parquet",
+        "RUN_METRICS_run_20240720T123000.parquet",
+    ]
+    assert fs_.read_parquet(partition, "RUN_METRICS_run_20240720T063000.parquet").loc[0, "city"] == "PARIS"
+    assert fs_.read_parquet(partition, "RUN_METRICS_run_20240720T123000.parquet").loc[0, "city"] == "LYON"
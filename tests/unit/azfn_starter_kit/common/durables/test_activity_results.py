@@ -0,0 +1,78 @@
+import pytest
+import requests
+from azure.core.exceptions import HttpResponseError
+
+from azfn_starter_kit.common.durables.activity_results import (
+    FAILURE,
+    SUCCESS,
+    activity_result,
+    add_retries,
+    failed_cities,
+    is_retryable,
+    is_success,
+    metric_records,
+)
+from azfn_starter_kit.utilities.metrics import ActivityMetrics
+
+
+def test_activity_result():
+    assert activity_result("load", "PARIS", SUCCESS) == {"city": "PARIS", "stage": "load", "status": "SUCCESS"}
+    assert not is_success(activity_result("load", "PARIS", FAILURE, "Error!"))
+
+
+def _http_error(status_code):
+    error = HttpResponseError("Error!")
+    error.status_code = status_code
+    return error
+
+
+@pytest.mark.parametrize(
+    ("exception", "expected"),
+    [
+        (ConnectionError(), True),
+        (requests.exceptions.Timeout(), True),
+        (_http_error(503), True),
+        (_http_error(404), False),
+        (ValueError(), False),
+        (KeyError("city"), False),
+    ],
+)
+def test_is_retryable(exception, expected):
+    assert is_retryable(exception) is expected
+
+
+def test_failed_cities():
+    outputs = [
+        {"city": "PARIS", "results": [activity_result("extract", "PARIS", SUCCESS)]},
+        {
+            "city": "LYON",
+            "results": [activity_result("extract", "LYON", SUCCESS), activity_result("load", "LYON", FAILURE)],
+        },
+        {"city": "NICE", "results": []},
+    ]
+
+    assert failed_cities(outputs) == ["LYON", "NICE"]
+
+
+def test_metric_records():
+    metrics = ActivityMetrics()
+    metrics.rows = 24
+    outputs = [
+        {"city": "PARIS", "results": [activity_result("load", "PARIS", SUCCESS, metrics=metrics)]},
+        {"city": "LYON", "results": [activity_result("load", "LYON", FAILURE, "Activity failed")]},
+    ]
+
+    assert metric_records(outputs) == [{"city": "PARIS", "stage": "load", "status": "SUCCESS", **metrics.to_dict()}]
+
+
+def test_add_retries():
+    metrics = ActivityMetrics()
+    metrics.retries = 2
+    batch = [activity_result("etl", "PARIS", SUCCESS, metrics=metrics), activity_result("etl", "LYON", FAILURE)]
+    result = activity_result("load", "NICE", SUCCESS, metrics=ActivityMetrics())
+
+    add_retries(batch, 1)
+    add_retries(result, 0)
+
+    assert [result_["metrics"]["retries"] for result_ in batch] == [3, 1]
+    assert result["metrics"]["retries"] == 0
@@ -0,0 +1,144 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from azure.durable_functions.models.Task import RetryAbleTask
+
+from azfn_starter_kit.azfn.basic_data_flow_example.orchestrators.weather_data_flow_orchestrator import (
+    WeatherDataflowOrchestrator,
+)
+from azfn_starter_kit.common.durables.base_entity import BaseEntity
+from azfn_starter_kit.config.environment import get_settings
+from azfn_starter_kit.config.orchestration_config import RetryPolicy
+
+
+class TestBaseEntity:
+    def test_init_should_set_variables(self):
+        settings = get_settings()
+        entity = BaseEntity()
+
+        assert entity.settings == settings
+        assert entity.logger.name == "BaseEntity"
+        assert entity.raw_path == settings.DLS_SETTINGS.RAW_PATH
+        assert entity.transformed_path == settings.DLS_SETTINGS.TRANSFORMED_PATH
+        assert entity.computed_path == settings.DLS_SETTINGS.COMPUTED_PATH
+
+    def test_orchestrator_does_not_create_clients(self):
+        with patch("azfn_starter_kit.common.durables.core_entity.get_file_system_client") as factory_mock:
+            orchestrator = WeatherDataflowOrchestrator()
+            orchestrator._build_inputs(["PARIS"])
+
+        factory_mock.assert_not_called()
+        assert not hasattr(orchestrator, "fs_")
+
+    def test_run_sub_orchestrators(self):
+        context = MagicMock()
+        context.task_all.return_value = "task"
+        entity = BaseEntity()
+
+        generator = entity.run_sub_orchestrators(context, "sub", [{"a": 1}, {"a": 2}], ["id1", "id2"])
+        assert next(generator) == "task"
+        try:
+            generator.send(["out1", "out2"])
+        except StopIteration as stop:
+            assert stop.value == ["out1", "out2"]
+
+        context.call_sub_orchestrator.assert_any_call("sub", {"a": 2}, "id2")
+
+    def test_run_activities_windowed(self):
+        context = MagicMock()
+        tasks = [MagicMock(result=f"out{index}") for index in range(4)]
+        context.call_activity.side_effect = tasks
+        entity = BaseEntity()
+
+        generator = entity.run_activities(context, "activity", [{"a": index} for index in range(4)], max_concurrency=2)
+        next(generator)
+        assert context.call_activity.call_count == 2
+        generator.send(tasks[1])
+        assert context.call_activity.call_count == 3
+        assert context.task_any.call_args[0][0] == [tasks[0], tasks[2]]
+        generator.send(tasks[0])
+        generator.send(tasks[3])
+        try:
+            generator.send(tasks[2])
+        except StopIteration as stop:
+            assert stop.value == ["out0", "out1", "out2", "out3"]
+
+        context.task_all.assert_not_called()
+        assert context.call_activity.call_count == 4
+
+    def test_run_activities_progress(self):
+        context = MagicMock()
+        tasks = [MagicMock(result=f"out{index}") for index in range(3)]
+        context.call_activity.side_effect = tasks
+        progress = []
+        entity = BaseEntity()
+
+        generator = entity.run_activities(
+            context, "activity", [{}, {}, {}], max_concurrency=2, on_progress=progress.append
+        )
+        next(generator)
+        generator.send(tasks[1])
+        generator.send(tasks[0])
+        try:
+            generator.send(tasks[2])
+        except StopIteration:
+            pass
+
+        assert progress == [1, 2, 3]
+
+    def test_run_activities_windowed_failure(self):
+        context = MagicMock()
+        tasks = [MagicMock(result=ValueError("failed")), MagicMock(result="out1"), MagicMock()]
+        context.call_activity.side_effect = tasks
+        entity = BaseEntity()
+
+        generator = entity.run_activities(context, "activity", [{}, {}, {}], max_concurrency=2)
+        next(generator)
+        with pytest.raises(ValueError, match="failed"):
+            generator.send(tasks[0])
+
+    def test_run_sub_orchestrators_limit_from_settings(self):
+        context = MagicMock()
+        entity = BaseEntity()
+        entity.settings = entity.settings.copy(deep=True)
+        entity.settings.ORCHESTRATION_SETTINGS.MAX_CONCURRENCY = {"sub": 1}
+
+        generator = entity.run_sub_orchestrators(context, "sub", [{"a": 1}, {"a": 2}], ["id1", "id2"])
+        next(generator)
+
+        context.call_sub_orchestrator.assert_called_once_with("sub", {"a": 1}, "id1")
+        context.task_all.assert_not_called()
+
+    def test_call_activity_with_retry_policy(self):
+        context = MagicMock()
+        context.instance_id = "run"
+        entity = BaseEntity()
+        entity.settings = entity.settings.copy(deep=True)
+        entity.settings.ORCHESTRATION_SETTINGS.RETRY_POLICIES = {
+            "activity": RetryPolicy(FIRST_RETRY_INTERVAL_MS=1000, MAX_NUMBER_OF_ATTEMPTS=5)
+        }
+
+        entity.call_activity(context, "activity", {"a": 1})
+        entity.call_activity(context, "other_activity", {"a": 2})
+
+        name, retry_options, input_ = context.call_activity_with_retry.call_args[0]
+        assert (name, input_) == ("activity", {"a": 1, "run_id": "run"})
+        assert retry_options.first_retry_interval_in_milliseconds == 1000
+        assert retry_options.max_number_of_attempts == 5
+        context.call_activity.assert_called_once_with("other_activity", {"a": 2, "run_id": "run"})
+
+    def test_run_activities_counts_durable_retries(self):
+        context = MagicMock()
+        context.task_all.return_value = "tasks"
+        context.call_activity_with_retry.side_effect = [MagicMock(RetryAbleTask, num_attempts=3), MagicMock()]
+        entity = BaseEntity()
+        entity.settings = entity.settings.copy(deep=True)
+        entity.settings.ORCHESTRATION_SETTINGS.RETRY_POLICIES = {"activity": RetryPolicy()}
+        outputs = [{"city": "PARIS", "stage": "etl", "metrics": {"retries": 1}}, {"city": "LYON", "stage": "etl"}]
+
+        generator = entity.run_activities(context, "activity", [{}, {}])
+        next(generator)
+        try:
+            generator.send(outputs)
+        except StopIteration as stop:
+            assert [output.get("metrics") for output in stop.value] == [{"retries": 3}, None]
@@ -24,6 +24,16 @@ class TestCoreEntity:
         assert entity.fs_.transformed_path == settings.DLS_SETTINGS.TRANSFORMED_PATH
         assert entity.fs_.computed_path == settings.DLS_SETTINGS.COMPUTED_PATH
 
+    def test_fs_is_lazy_and_shared(self):
+        entity = CoreEntity()
+        assert entity._fs is None
+
+        assert entity.fs_ is CoreEntity().fs_
+
+        fs_mock = Mock()
+        entity.fs_ = fs_mock
+        assert entity.fs_ is fs_mock
+
     @pytest.mark.parametrize(
         ("is_replaying", "log_msg", "log_level"),
         [(False, "message", logging.INFO), (False, "message", None), (True, "message", None)],
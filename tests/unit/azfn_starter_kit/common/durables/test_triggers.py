@@ -1,10 +1,15 @@
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
-from azure.durable_functions import DurableOrchestrationClient
+from azure.durable_functions import DurableOrchestrationClient, OrchestrationRuntimeStatus
 from azure.functions import HttpRequest, HttpResponse, TimerRequest
 
-from azfn_starter_kit.common.durables.triggers import HttpTrigger, InvalidBodyException, TimerTrigger
+from azfn_starter_kit.common.durables.triggers import (
+    HttpTrigger,
+    InvalidBodyException,
+    RerunFailuresTrigger,
+    TimerTrigger,
+)
 
 
 @pytest.fixture
@@ -107,6 +112,14 @@ def test_http_trigger_validate_request_empty(http_request_mock):
     assert http_trigger._validate_request() == {}
 
 
+def test_http_trigger_validate_request_optional_params(http_request_mock):
+    http_trigger = HttpTrigger(client_mock, "OrchestratorFunction", http_request_mock, optional_params=["key"])
+    assert http_trigger._validate_request() == {"key": "value"}
+
+    http_request_mock.get_json.side_effect = ValueError()
+    assert http_trigger._validate_request() == {}
+
+
 def test_http_trigger_validate_request_missing_key(http_request_mock):
     http_trigger = HttpTrigger(client_mock, "OrchestratorFunction", http_request_mock, ["missing_key"])
     with pytest.raises(InvalidBodyException) as exc_info:
@@ -143,3 +156,138 @@ async def test_http_trigger_start_exception(client_mock, http_request_mock):
         assert response.status_code == 400
         assert "Test Exception" in response.get_body().decode()
         assert "Traceback" in response.get_body().decode()
+
+
+def _orchestration_status(runtime_status, output, input_):
+    status = MagicMock()
+    status.runtime_status = runtime_status
+    status.output = output
+    status.input_ = input_
+    return status
+
+
+@pytest.mark.asyncio
+async def test_rerun_failures_trigger_start(client_mock, http_request_mock):
+    http_request_mock.get_json.return_value = {"instance_id": "run"}
+    output = [
+        {"city": "PARIS", "results": [{"city": "PARIS", "stage": "etl", "status": "SUCCESS"}]},
+        {"city": "LYON", "results": [{"city": "LYON", "stage": "etl", "status": "FAILURE"}]},
+    ]
+    client_mock.get_status = AsyncMock(
+        return_value=_orchestration_status(OrchestrationRuntimeStatus.Completed, output, '{"mode": "fused"}')
+    )
+    client_mock.start_new = AsyncMock(return_value="rerun")
+    client_mock.create_check_status_response.return_value = HttpResponse("OK", status_code=202)
+
+    response = await RerunFailuresTrigger(client_mock, "OrchestratorFunction", http_request_mock).start()
+
+    assert response.status_code == 202
+    client_mock.get_status.assert_awaited_once_with("run")
+    client_mock.start_new.assert_awaited_once_with(
+        "OrchestratorFunction", instance_id=None, client_input={"mode": "fused", "cities": ["LYON"]}
+    )
+
+
+@pytest.mark.parametrize(
+    ("runtime_status", "output"),
+    [
+        (OrchestrationRuntimeStatus.Running, None),
+        (OrchestrationRuntimeStatus.Completed, [{"city": "PARIS", "results": [{"status": "SUCCESS"}]}]),
+    ],
+)
+@pytest.mark.asyncio
+async def test_rerun_failures_trigger_nothing_to_rerun(client_mock, http_request_mock, runtime_status, output):
+    http_request_mock.get_json.return_value = {"instance_id": "run"}
+    client_mock.get_status = AsyncMock(return_value=_orchestration_status(runtime_status, output, None))
+    client_mock.start_new = AsyncMock()
+
+    response = await RerunFailuresTrigger(client_mock, "OrchestratorFunction", http_request_mock).start()
+
+    assert response.status_code == 400
+    client_mock.start_new.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    ("client_input", "expected_instance_id"),
+    [
+        (None, "OrchestratorFunction"),
+        ({"mode": "fused"}, "OrchestratorFunction"),
+        ({"cities": ["PARIS", "LYON"]}, "OrchestratorFunction:"),
+    ],
+)
+def test_singleton_instance_id(client_mock, http_request_mock, client_input, expected_instance_id):
+    http_trigger = HttpTrigger(client_mock, "OrchestratorFunction", http_request_mock, singleton=True)
+
+    instance_id = http_trigger._singleton_instance_id(client_input)
+
+    assert instance_id.startswith(expected_instance_id)
+    assert instance_id == http_trigger._singleton_instance_id(client_input)
+
+
+def test_singleton_instance_id_per_city_set(client_mock, http_request_mock):
+    http_trigger = HttpTrigger(client_mock, "OrchestratorFunction", http_request_mock, singleton=True)
+
+    instance_id = http_trigger._singleton_instance_id({"cities": ["PARIS", "LYON"], "mode": "fused"})
+
+    assert instance_id == http_trigger._singleton_instance_id({"cities": ["LYON", "PARIS", "LYON"]})
+    assert instance_id != http_trigger._singleton_instance_id({"cities": ["PARIS"]})
+
+
+@pytest.mark.parametrize(
+    ("runtime_status", "started"),
+    [
+        (OrchestrationRuntimeStatus.Running, False),
+        (OrchestrationRuntimeStatus.Pending, False),
+        (OrchestrationRuntimeStatus.Completed, True),
+        (OrchestrationRuntimeStatus.Failed, True),
+        (None, True),
+    ],
+)
+@pytest.mark.asyncio
+async def test_http_trigger_start_singleton(client_mock, http_request_mock, runtime_status, started):
+    http_request_mock.get_json.return_value = {}
+    client_mock.get_status = AsyncMock(return_value=_orchestration_status(runtime_status, None, None))
+    client_mock.start_new = AsyncMock(return_value="OrchestratorFunction")
+    client_mock.create_check_status_response.return_value = HttpResponse("OK", status_code=202)
+    http_trigger = HttpTrigger(
+        client_mock, "OrchestratorFunction", http_request_mock, optional_params=["cities"], singleton=True
+    )
+
+    response = await http_trigger.start()
+
+    assert response.status_code == 202
+    client_mock.get_status.assert_awaited_once_with("OrchestratorFunction")
+    client_mock.create_check_status_response.assert_called_once_with(http_request_mock, "OrchestratorFunction")
+    if started:
+        client_mock.start_new.assert_awaited_once_with(
+            "OrchestratorFunction", instance_id="OrchestratorFunction", client_input={}
+        )
+    else:
+        client_mock.start_new.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    ("runtime_status", "started"),
+    [(OrchestrationRuntimeStatus.ContinuedAsNew, False), (OrchestrationRuntimeStatus.Terminated, True)],
+)
+@pytest.mark.asyncio
+async def test_timer_trigger_start_singleton(client_mock, timer_request_mock, runtime_status, started):
+    client_mock.get_status = AsyncMock(return_value=_orchestration_status(runtime_status, None, None))
+    client_mock.start_new = AsyncMock(return_value="OrchestratorFunction")
+    timer_trigger = TimerTrigger(client_mock, "OrchestratorFunction", timer_request_mock, singleton=True)
+
+    await timer_trigger.start()
+
+    client_mock.get_status.assert_awaited_once_with("OrchestratorFunction")
+    assert client_mock.start_new.await_count == int(started)
+
+
+@pytest.mark.asyncio
+async def test_timer_trigger_start_without_singleton(client_mock, timer_request_mock):
+    client_mock.get_status = AsyncMock()
+    client_mock.start_new = AsyncMock(return_value="instance_id")
+
+    await TimerTrigger(client_mock, "OrchestratorFunction", timer_request_mock).start()
+
+    client_mock.get_status.assert_not_awaited()
+    client_mock.start_new.assert_awaited_once_with("OrchestratorFunction", instance_id=None, client_input=None)
@@ -0,0 +1,256 @@
+import gzip
+from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
+
+import pandas as pd
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+
+from azfn_starter_kit.common.fs.async_datalake_file_system import (
+    AsyncDataLakeGen2FileSystemClient,
+    get_async_credential,
+)
+from azfn_starter_kit.common.fs.base_file_system import FileInfo
+
+
+def _path(name: str, is_directory: bool = False, content_length: int = 10) -> Mock:
+    path = Mock(is_directory=is_directory, content_length=content_length)
+    path.name = name
+    return path
+
+
+class _AsyncPaths:
+    def __init__(self, paths):
+        self._paths = iter(paths)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._paths)
+        except StopIteration as stop:
+            raise StopAsyncIteration from stop
+
+
+@pytest.fixture
+def fs_client() -> AsyncDataLakeGen2FileSystemClient:
+    service_client = MagicMock()
+    service_client.close = AsyncMock()
+    client = AsyncDataLakeGen2FileSystemClient(
+        "mystorage",
+        "mycontainer",
+        "myrawpath",
+        "mytransformedpath",
+        "mycomputedpath",
+        "myaccesskey",
+        service_client=service_client,
+        block_size=3,
+    )
+    directory_client = client.fs_client.get_directory_client.return_value
+    directory_client.create_file = AsyncMock()
+    file_client = directory_client.create_file.return_value
+    file_client.append_data = AsyncMock()
+    file_client.flush_data = AsyncMock(return_value={"etag": "etag"})
+    return client
+
+
+@pytest.mark.asyncio
+async def test_write_file_chunked(fs_client):
+    file_client = fs_client.fs_client.get_directory_client.return_value.create_file.return_value
+
+    await fs_client.write_file("mycomputedpath", "myfile.txt", "abcdefgh")
+
+    file_client.append_data.assert_has_awaits(
+        [
+            call(data=b"abc", offset=0, length=3),
+            call(data=b"def", offset=3, length=3),
+            call(data=b"gh", offset=6, length=2),
+        ],
+        any_order=True,
+    )
+    file_client.flush_data.assert_awaited_once_with(8)
+
+
+@pytest.mark.asyncio
+async def test_write_file_from_async_iterator(fs_client):
+    file_client = fs_client.fs_client.get_directory_client.return_value.create_file.return_value
+
+    await fs_client.write_file("mycomputedpath", "myfile.txt", _AsyncPaths([b"ab", "cd"]))
+
+    assert file_client.append_data.await_count == 2
+    file_client.flush_data.assert_awaited_once_with(4)
+
+
+@pytest.mark.asyncio
+async def test_read_parquet(fs_client):
+    data = pd.DataFrame({"data1": [1, 2, 3]})
+    content = data.to_parquet()
+    downloader = Mock(size=len(content))
+
+    async def readinto(stream):
+        stream.write(content)
+
+    downloader.readinto = readinto
+    fs_client.fs_client.get_file_client.return_value.download_file = AsyncMock(return_value=downloader)
+
+    assert (await fs_client.read_parquet("mycomputedpath", "myfile.parquet")).equals(data)
+    fs_client.fs_client.get_file_client.return_value.download_file.assert_awaited_once_with(
+        max_concurrency=fs_client.max_concurrency, decompress=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_write_file_compressed(fs_client):
+    directory_client = fs_client.fs_client.get_directory_client.return_value
+    file_client = directory_client.create_file.return_value
+
+    file_name = await fs_client.write_file("mypath", "myfile.json", _AsyncPaths([b"con", "tent"]), compression="gzip")
+
+    assert file_name == "myfile.json.gz"
+    assert directory_client.create_file.call_args.args == (file_name,)
+    assert directory_client.create_file.call_args.kwargs["content_settings"].content_encoding == "gzip"
+    uploaded = b"".join(call_.kwargs["data"] for call_ in file_client.append_data.await_args_list)
+    assert gzip.decompress(uploaded) == b"content"
+
+
+@pytest.mark.asyncio
+async def test_list_files(fs_client):
+    fs_client.fs_client.get_paths = Mock(
+        return_value=_AsyncPaths([_path("dir/file2.txt"), _path("dir/file1.txt"), _path("dir/empty", content_length=0)])
+    )
+
+    assert await fs_client.list_files("dir", min_blob_size=1) == ["file1.txt", "file2.txt"]
+
+
+@pytest.mark.asyncio
+async def test_latest_file_partitioned(fs_client):
+    listings = {
+        "city": [_path("city/year=2024", True)],
+        "city/year=2024": [_path("city/year=2024/month=07", True)],
+        "city/year=2024/month=07": [_path("city/year=2024/month=07/day=20", True)],
+        "city/year=2024/month=07/day=20": [_path("city/year=2024/month=07/day=20/WEATHER_A.json")],
+    }
+    fs_client.fs_client.get_paths = Mock(side_effect=lambda path, recursive: _AsyncPaths(listings[path]))
+
+    assert await fs_client.latest_file("city", pattern="WEATHER_A") == "year=2024/month=07/day=20/WEATHER_A.json"
+
+
+@pytest.mark.asyncio
+async def test_copy_files(fs_client):
+    fs_client._blob_container_client = MagicMock()
+    blob_client = fs_client._blob_container_client.get_blob_client.return_value
+    blob_client.upload_blob_from_url = AsyncMock()
+
+    with patch(
+        "azfn_starter_kit.common.fs.datalake_file_system.generate_blob_sas", return_value="sas_token"
+    ):
+        await fs_client.copy_files("myrawpath", "mycomputedpath", ["file1", "file2"])
+
+    assert blob_client.upload_blob_from_url.await_count == 2
+    blob_client.upload_blob_from_url.assert_any_await(
+        "https://mystorage.blob.core.windows.net/mycontainer/myrawpath/file1?sas_token", overwrite=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_move_files_same_account(fs_client):
+    file_client = fs_client.fs_client.get_file_client.return_value
+    file_client.rename_file = AsyncMock()
+
+    await fs_client.move_files("myrawpath", "mycomputedpath", ["file1"])
+
+    file_client.rename_file.assert_awaited_once_with("mycontainer/mycomputedpath/file1")
+
+
+@pytest.mark.asyncio
+async def test_move_files_creates_missing_directory(fs_client):
+    file_client = fs_client.fs_client.get_file_client.return_value
+    file_client.rename_file = AsyncMock(side_effect=[ResourceNotFoundError("parent not found"), None])
+    directory_client = fs_client.fs_client.get_directory_client.return_value
+    directory_client.create_directory = AsyncMock()
+
+    await fs_client.move_files("myrawpath", "mycomputedpath", ["file1"])
+
+    directory_client.create_directory.assert_awaited_once_with()
+    assert file_client.rename_file.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_close(fs_client):
+    async with fs_client:
+        pass
+
+    fs_client.service_client.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_write_csv_from_dataframe(fs_client):
+    file_client = fs_client.fs_client.get_directory_client.return_value.create_file.return_value
+    data = pd.DataFrame({"Name": ["name1", "name2", "name3"], "Age": [1, 2, 3]})
+
+    await fs_client.write_csv("mycomputedpath", "myfile.csv", ",", data, chunk_rows=2)
+
+    appended = sorted(file_client.append_data.call_args_list, key=lambda append: append.kwargs["offset"])
+    assert b"".join(append.kwargs["data"] for append in appended) == b"Name,Age\nname1,1\nname2,2\nname3,3\n"
+
+
+def _downloads(fs_client, content: bytes) -> None:
+    downloader = Mock(size=len(content))
+
+    async def readinto(stream):
+        stream.write(content)
+
+    downloader.readinto = readinto
+    fs_client.fs_client.get_file_client.return_value.download_file = AsyncMock(return_value=downloader)
+
+
+@pytest.mark.asyncio
+async def test_read_csv_compressed(fs_client):
+    _downloads(fs_client, gzip.compress(b"a,b\n1,2\n"))
+
+    data = await fs_client.read_csv("mypath", "file.csv.gz")
+
+    assert data.to_dict("records") == [{"a": 1, "b": 2}]
+
+
+@pytest.mark.asyncio
+async def test_write_parquet_returns_size(fs_client):
+    file_client = fs_client.fs_client.get_directory_client.return_value.create_file.return_value
+
+    size = await fs_client.write_parquet("mypath", "file.parquet", pd.DataFrame({"a": [1, 2]}))
+
+    assert size == sum(call_.kwargs["length"] for call_ in file_client.append_data.await_args_list)
+
+
+@pytest.mark.asyncio
+async def test_list_file_infos(fs_client):
+    fs_client.fs_client.get_paths = Mock(
+        return_value=_AsyncPaths([_path("dir/sub", True), _path("dir/sub/file.txt", content_length=3)])
+    )
+
+    infos = await fs_client.list_file_infos("dir")
+
+    assert infos == [FileInfo("sub/file.txt", 3, infos[0].last_modified)]
+
+
+@pytest.mark.asyncio
+async def test_delete_files(fs_client):
+    fs_client.fs_client.get_file_client.return_value.delete_file = AsyncMock()
+
+    await fs_client.delete_files("dir", ["a.txt", "sub/b.txt"])
+
+    fs_client.fs_client.get_file_client.assert_has_calls([call("dir/a.txt"), call("dir/sub/b.txt")], any_order=True)
+    assert fs_client.fs_client.get_file_client.return_value.delete_file.await_count == 2
+
+
+def test_credential_is_shared():
+    with patch("azfn_starter_kit.common.fs.async_datalake_file_system.DefaultAzureCredential") as credential_mock:
+        get_async_credential.cache_clear()
+        clients = [
+            AsyncDataLakeGen2FileSystemClient("mystorage", "mycontainer", "raw", "transformed", "computed")
+            for _ in range(2)
+        ]
+        get_async_credential.cache_clear()
+
+    credential_mock.assert_called_once_with()
+    assert clients[0]._credential is clients[1]._credential
@@ -0,0 +1,26 @@
+import pytest
+
+from azfn_starter_kit.common.fs.base_file_system import latest_matching_file, newest_partitions, transfer_arguments
+
+
+def test_newest_partitions():
+    children = ["day=09", "month=07", "day=20", "other"]
+
+    assert newest_partitions(children, 2) == ["day=20", "day=09"]
+    assert newest_partitions(children, 0) == []
+    assert newest_partitions(children, 3) == []
+
+
+def test_latest_matching_file():
+    files = ["WEATHER_A_1.json", "WEATHER_A_2.json", "OTHER_A_3.json"]
+
+    assert latest_matching_file(files, "WEATHER_A", "year=2024") == "year=2024/WEATHER_A_2.json"
+    assert latest_matching_file(files, None) == "WEATHER_A_2.json"
+    assert latest_matching_file(files, "MISSING") is None
+
+
+def test_transfer_arguments():
+    assert transfer_arguments("src", "dest", ["a", "b"], ["c", "d"]) == [("src/a", "dest/c"), ("src/b", "dest/d")]
+    assert transfer_arguments("src", "dest", ["a"], None) == [("src/a", "dest/a")]
+    with pytest.raises(ValueError):
+        transfer_arguments("src", "dest", ["a"], ["b", "c"])
@@ -0,0 +1,44 @@
+import gzip
+import io
+
+import pytest
+
+from azfn_starter_kit.common.fs.compression import (
+    compress_blocks,
+    compressed_file_name,
+    compression_from_name,
+    decompressing_reader,
+    strip_compression_suffix,
+)
+
+
+@pytest.mark.parametrize(
+    ("file_name", "expected"), [("file.json.gz", "gzip"), ("file.json.zst", "zstd"), ("file.json", None)]
+)
+def test_compression_from_name(file_name, expected):
+    assert compression_from_name(file_name) == expected
+
+
+def test_file_names():
+    assert compressed_file_name("file.json", "gzip") == "file.json.gz"
+    assert strip_compression_suffix("file.json.zst") == "file.json"
+    assert strip_compression_suffix("file.json") == "file.json"
+
+
+def test_unsupported_compression():
+    with pytest.raises(ValueError):
+        compressed_file_name("file.json", "lz4")
+
+
+def test_gzip_round_trip():
+    compressed = b"".join(compress_blocks([b"some ", b"content"], "gzip"))
+
+    assert gzip.decompress(compressed) == b"some content"
+    assert decompressing_reader(io.BytesIO(compressed), "gzip").read() == b"some content"
+
+
+def test_zstd_round_trip():
+    pytest.importorskip("zstandard")
+    compressed = b"".join(compress_blocks([b"some ", b"content"], "zstd"))
+
+    assert decompressing_reader(io.BytesIO(compressed), "zstd").read() == b"some content"
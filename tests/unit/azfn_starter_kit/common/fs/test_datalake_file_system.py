@@ -1,11 +1,16 @@
+import datetime
+import io
 from unittest import mock
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import pandas as pd
 import pytest
+from azure.core.exceptions import ResourceNotFoundError
 from azure.storage.filedatalake import DataLakeServiceClient
 
-from azfn_starter_kit.common.fs.datalake_file_system import DataLakeGen2FileSystemClient
+from azfn_starter_kit.common.fs.base_file_system import FileInfo
+from azfn_starter_kit.common.fs.datalake_file_system import DataLakeGen2FileSystemClient, get_credential
+from azfn_starter_kit.common.fs.file_cache import FileCache
 from azfn_starter_kit.utilities.file_system import path_builder
 
 
@@ -18,8 +23,15 @@ class TestDataLakeGen2FileSystemClient:
     def fs_client(self) -> DataLakeGen2FileSystemClient:
         return self._get_fs_client()
 
+    @pytest.fixture(autouse=True)
+    def sas_mock(self):
+        with mock.patch(
+            "azfn_starter_kit.common.fs.datalake_file_system.generate_blob_sas", return_value="sas_token"
+        ) as generate_blob_sas:
+            yield generate_blob_sas
+
     def _get_fs_client(self):
-        return DataLakeGen2FileSystemClient(
+        fs_client = DataLakeGen2FileSystemClient(
             "mystorage",
             "mycontainer",
             "myrawpath",
@@ -28,23 +40,81 @@ class TestDataLakeGen2FileSystemClient:
             "myaccesskey",
             service_client=Mock(DataLakeServiceClient),
         )
+        fs_client.fs_client.get_file_client.return_value.download_file.return_value.size = 0
+        return fs_client
 
     def test_copy_files(self, fs_client):
-        fs_client.fs_client.get_file_client.return_value.download_file.return_value.readall.return_value = (
-            "file content"
+        fs_client._blob_container_client = Mock()
+        blob_client = fs_client._blob_container_client.get_blob_client.return_value
+
+        fs_client.copy_files("myrawpath", "mycomputedpath", ["sourcefile1", "sourcefile2"])
+
+        fs_client._blob_container_client.get_blob_client.assert_has_calls(
+            [mock.call("mycomputedpath/sourcefile1"), mock.call("mycomputedpath/sourcefile2")], any_order=True
+        )
+        assert blob_client.upload_blob_from_url.call_count == 2
+        source_url = blob_client.upload_blob_from_url.call_args_list[0].args[0]
+        assert source_url.startswith("https://mystorage.blob.core.windows.net/mycontainer/myrawpath/sourcefile")
+        fs_client.fs_client.get_file_client.return_value.download_file.assert_not_called()
+
+    def test_copy_files_from_other_account(self, fs_client):
+        fs_client._blob_container_client = Mock()
+        blob_client = fs_client._blob_container_client.get_blob_client.return_value
+        fs_other = self._get_fs_client()
+        fs_other.storage_name = "otherstorage"
+
+        fs_client.copy_files("myrawpath", "mycomputedpath", ["sourcefile1"], source_fs=fs_other, dest_files_name=["d"])
+
+        fs_client._blob_container_client.get_blob_client.assert_called_once_with("mycomputedpath/d")
+        source_url = blob_client.upload_blob_from_url.call_args.args[0]
+        assert source_url == "https://otherstorage.blob.core.windows.net/mycontainer/myrawpath/sourcefile1?sas_token"
+
+    def test_copy_files_names_mismatch(self, fs_client):
+        with pytest.raises(ValueError):
+            fs_client.copy_files("myrawpath", "mycomputedpath", ["sourcefile1"], dest_files_name=["a", "b"])
+
+    def test_move_files_same_account(self, fs_client):
+        fs_client.move_files("myrawpath", "mycomputedpath", ["sourcefile1"])
+
+        fs_client.fs_client.get_file_client.assert_called_once_with("myrawpath/sourcefile1")
+        fs_client.fs_client.get_file_client.return_value.rename_file.assert_called_once_with(
+            "mycontainer/mycomputedpath/sourcefile1"
         )
-        expected_src_path = path_builder("myrawpath", "sourcefile1")
-        expected_dest_path = "mycomputedpath"
-        fs_client.copy_files("myrawpath", "mycomputedpath", ["sourcefile1"])
 
-        fs_client.fs_client.get_directory_client.assert_called_once_with(expected_dest_path)
-        fs_client.fs_client.get_file_client.assert_called_once_with(expected_src_path)
+    def test_move_files_creates_missing_directory(self, fs_client):
+        file_client = fs_client.fs_client.get_file_client.return_value
+        file_client.rename_file.side_effect = [ResourceNotFoundError("parent not found"), None]
+
+        fs_client.move_files("myrawpath", "mycomputedpath/year=2024", ["sourcefile1"])
+
+        fs_client.fs_client.get_directory_client.assert_called_once_with("mycomputedpath/year=2024")
+        fs_client.fs_client.get_directory_client.return_value.create_directory.assert_called_once_with()
+        assert file_client.rename_file.call_count == 2
+
+    def test_blob_client_uses_injected_credential(self):
+        service_client = DataLakeServiceClient(
+            "https://mystorage.dfs.core.windows.net", credential={"account_name": "mystorage", "account_key": "a2V5"}
+        )
+        fs_client = DataLakeGen2FileSystemClient(
+            "mystorage", "mycontainer", "raw", "transformed", "computed", service_client=service_client
+        )
+
+        assert fs_client.blob_container_client.credential.account_key == "a2V5"
+        assert fs_client._source_url("raw/file.json") == (
+            "https://mystorage.blob.core.windows.net/mycontainer/raw/file.json?sas_token",
+            None,
+        )
 
+    def test_move_files_from_other_account(self, fs_client):
+        fs_client._blob_container_client = Mock()
         fs_other = self._get_fs_client()
-        fs_other.fs_client.get_file_client.return_value.download_file.return_value.readall.return_value = "file content"
-        fs_client.copy_files("myrawpath", "mycomputedpath", ["sourcefile1"], source_fs=fs_other)
+        fs_other.storage_name = "otherstorage"
 
-        fs_other.fs_client.get_file_client.assert_called()
+        fs_client.move_files("myrawpath", "mycomputedpath", ["sourcefile1"], source_fs=fs_other)
+
+        fs_client._blob_container_client.get_blob_client.return_value.upload_blob_from_url.assert_called_once()
+        fs_other.fs_client.get_file_client.return_value.delete_file.assert_called_once()
+        fs_other.fs_client.get_file_client.return_value.rename_file.assert_not_called()
 
     def test_list_files(self, fs_client):
         list_of_files = [
@@ -64,6 +134,90 @@ class TestDataLakeGen2FileSystemClient:
         assert fs_client.list_files("mycomputedpath", pattern=r"file\d+\.txt") == list_of_files
         assert fs_client.list_files("mycomputedpath", pattern=r"file_xyz\.txt") == []
 
+    @staticmethod
+    def _path(name: str, is_directory: bool) -> Mock:
+        path = mock.Mock(is_directory=is_directory)
+        path.name = name
+        return path
+
+    def test_latest_file_partitioned(self, fs_client):
+        listings = {
+            "city": [
+                self._path("city/year=2023", True),
+                self._path("city/year=2024", True),
+                self._path("city/legacy.json", False),
+            ],
+            "city/year=2024": [
+                self._path("city/year=2024/month=06", True),
+                self._path("city/year=2024/month=07", True),
+            ],
+            "city/year=2024/month=07": [
+                self._path("city/year=2024/month=07/day=09", True),
+                self._path("city/year=2024/month=07/day=20", True),
+            ],
+            "city/year=2024/month=07/day=20": [
+                self._path("city/year=2024/month=07/day=20/WEATHER_A_20240720.json", False),
+                self._path("city/year=2024/month=07/day=20/OTHER_A_20240720.json", False),
+            ],
+        }
+        fs_client.fs_client.get_paths.side_effect = lambda path, recursive: listings[path]
+
+        latest = fs_client.latest_file("city", pattern="WEATHER_A")
+
+        assert latest == "year=2024/month=07/day=20/WEATHER_A_20240720.json"
+        assert all(not kwargs["recursive"] for _, kwargs in fs_client.fs_client.get_paths.call_args_list)
+
+    def test_latest_file_falls_back_to_older_partition(self, fs_client):
+        listings = {
+            "city": [self._path("city/year=2024", True)],
+            "city/year=2024": [self._path("city/year=2024/month=07", True)],
+            "city/year=2024/month=07": [
+                self._path("city/year=2024/month=07/day=19", True),
+                self._path("city/year=2024/month=07/day=20", True),
+            ],
+            "city/year=2024/month=07/day=20": [self._path("city/year=2024/month=07/day=20/OTHER_A.json", False)],
+            "city/year=2024/month=07/day=19": [self._path("city/year=2024/month=07/day=19/WEATHER_A.json", False)],
+        }
+        fs_client.fs_client.get_paths.side_effect = lambda path, recursive: listings[path]
+
+        assert fs_client.latest_file("city", pattern="WEATHER_A") == "year=2024/month=07/day=19/WEATHER_A.json"
+
+    def test_latest_file_flat(self, fs_client):
+        fs_client.fs_client.get_paths.return_value = [
+            self._path("city/WEATHER_A_20240719.json", False),
+            self._path("city/WEATHER_A_20240720.json", False),
+        ]
+
+        assert fs_client.latest_file("city", pattern="WEATHER_A") == "WEATHER_A_20240720.json"
+
+    def test_latest_file_not_found(self, fs_client):
+        fs_client.fs_client.get_paths.return_value = [self._path("city/OTHER.json", False)]
+
+        with pytest.raises(FileNotFoundError):
+            fs_client.latest_file("city", pattern="WEATHER_A")
+
+    def test_credential_is_shared(self):
+        with mock.patch("azfn_starter_kit.common.fs.datalake_file_system.DefaultAzureCredential") as credential_mock:
+            get_credential.cache_clear()
+            clients = [
+                DataLakeGen2FileSystemClient("mystorage", "mycontainer", "raw", "transformed", "computed")
+                for _ in range(2)
+            ]
+            get_credential.cache_clear()
+
+        credential_mock.assert_called_once_with()
+        assert clients[0]._credential is clients[1]._credential
+
+    def test_list_file_infos(self, fs_client):
+        modified = datetime.datetime(2024, 7, 20, tzinfo=datetime.timezone.utc)
+        fs_client.fs_client.get_paths.return_value = [
+            Mock(is_directory=True, content_length=0, last_modified=modified),
+            Mock(is_directory=False, content_length=12, last_modified=modified),
+        ]
+        fs_client.fs_client.get_paths.return_value[1].name = "raw/PARIS/file.json"
+
+        assert fs_client.list_file_infos("raw") == [FileInfo("PARIS/file.json", 12, modified)]
+
     def test_write_csv_from_list(self, fs_client):
         file_name = "myfile.csv"
         path = path_builder("mycomputedpath", file_name)
@@ -84,6 +238,17 @@ class TestDataLakeGen2FileSystemClient:
         fs_client.fs_client.get_directory_client.return_value.create_file.assert_called_once_with(file_name)
         fs_client.fs_client.get_directory_client.return_value.create_file.return_value.append_data.assert_called_once()
 
+    def test_write_csv_streams_chunks(self, fs_client):
+        fs_client.block_size = 16
+        file_client = fs_client.fs_client.get_directory_client.return_value.create_file.return_value
+        data = pd.DataFrame({"Name": [f"name{index}" for index in range(10)], "Age": range(10)})
+
+        fs_client.write_csv("mycomputedpath", "myfile.csv", ";", data, chunk_rows=3)
+
+        appended = sorted(file_client.append_data.call_args_list, key=lambda append: append.kwargs["offset"])
+        assert b"".join(append.kwargs["data"] for append in appended) == data.to_csv(index=False, sep=";").encode()
+        assert file_client.append_data.call_count > 1
+
     def test_write_parquet(self, fs_client):
         file_name = "myfile.parquet"
         path = path_builder("mycomputedpath", file_name)
@@ -104,6 +269,131 @@ class TestDataLakeGen2FileSystemClient:
         fs_client.fs_client.get_directory_client.return_value.create_file.assert_called_once_with(file_name)
         fs_client.fs_client.get_directory_client.return_value.create_file.return_value.append_data.assert_called_once()
 
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "abcdefgh",
+            b"abcdefgh",
+            io.BytesIO(b"abcdefgh"),
+            io.StringIO("abcdefgh"),
+            iter([b"ab", "cde", b"fgh"]),
+        ],
+    )
+    def test_write_file_chunked(self, fs_client, content):
+        fs_client.block_size = 3
+        file_client = fs_client.fs_client.get_directory_client.return_value.create_file.return_value
+
+        fs_client.write_file("mycomputedpath", "myfile.txt", content)
+
+        file_client.append_data.assert_has_calls(
+            [
+                call(data=b"abc", offset=0, length=3),
+                call(data=b"def", offset=3, length=3),
+                call(data=b"gh", offset=6, length=2),
+            ],
+            any_order=True,
+        )
+        assert file_client.append_data.call_count == 3
+        file_client.flush_data.assert_called_once_with(8)
+
+    def test_write_file_compressed(self, fs_client):
+        directory_client = fs_client.fs_client.get_directory_client.return_value
+
+        file_name = fs_client.write_file("mypath", "myfile.json", "content", compression="gzip")
+
+        assert file_name == "myfile.json.gz"
+        directory_client.create_file.assert_called_once_with(file_name, content_settings=mock.ANY)
+        assert directory_client.create_file.call_args[1]["content_settings"].content_encoding == "gzip"
+
+    def test_write_file_empty(self, fs_client):
+        file_client = fs_client.fs_client.get_directory_client.return_value.create_file.return_value
+
+        fs_client.write_file("mycomputedpath", "myfile.txt", "")
+
+        file_client.append_data.assert_not_called()
+        file_client.flush_data.assert_called_once_with(0)
+
+    def test_read_bytes(self, fs_client):
+        content = b"0123456789"
+
+        def parallel_readinto(stream):
+            # Ranges may land in any order, each one at its own offset.
+            for start in (5, 0):
+                stream.seek(start)
+                stream.write(content[start : start + 5])
+
+        downloader = fs_client.fs_client.get_file_client.return_value.download_file.return_value
+        downloader.size = len(content)
+        downloader.readinto.side_effect = parallel_readinto
+
+        buffer = fs_client.read_bytes("mycomputedpath", "myfile.bin")
+
+        assert isinstance(buffer, memoryview)
+        assert buffer.tobytes() == content
+        fs_client.fs_client.get_file_client.return_value.download_file.assert_called_once_with(
+            max_concurrency=fs_client.max_concurrency, decompress=False
+        )
+
+    def test_read_bytes_with_cache(self, fs_client):
+        fs_client.cache = FileCache(memory_max_bytes=100)
+        file_client = fs_client.fs_client.get_file_client.return_value
+        file_client.get_file_properties.return_value.etag = "etag1"
+        downloader = file_client.download_file.return_value
+        downloader.size = 7
+        downloader.properties.etag = "etag1"
+        downloader.readinto.side_effect = lambda stream: stream.write(b"content")
+
+        assert fs_client.read_bytes("mycomputedpath", "myfile.bin").tobytes() == b"content"
+        assert fs_client.read_bytes("mycomputedpath", "myfile.bin").tobytes() == b"content"
+
+        file_client.download_file.assert_called_once()
+        assert fs_client.cache.metrics["memory_hits"] == 1
+        assert fs_client.cache.metrics["misses"] == 1
+
+    def test_write_file_populates_cache(self, fs_client):
+        fs_client.cache = FileCache(memory_max_bytes=100)
+        file_client = fs_client.fs_client.get_directory_client.return_value.create_file.return_value
+        file_client.flush_data.return_value = {"etag": "etag1"}
+
+        fs_client.write_file("mycomputedpath", "myfile.txt", "content")
+
+        assert fs_client.cache.get("mycomputedpath/myfile.txt", "etag1") == b"content"
+
+    def test_read_parquet_from_buffer(self, fs_client):
+        data = pd.DataFrame({"data1": [1, 2, 3], "data2": [4, 5, 6]})
+        content = data.to_parquet()
+        downloader = fs_client.fs_client.get_file_client.return_value.download_file.return_value
+        downloader.size = len(content)
+        downloader.readinto.side_effect = lambda stream: stream.write(content)
+
+        assert fs_client.read_parquet("mycomputedpath", "myfile.parquet").equals(data)
+
+    def test_read_parquet_with_ranged_reads(self, fs_client):
+        rows = 50_000
+        data = pd.DataFrame(
+            {"city": ["Lyon"] * rows + ["Paris"] * rows, "temperature": range(2 * rows), "humidity": range(2 * rows)}
+        )
+        content = data.to_parquet(row_group_size=rows)
+        file_client = fs_client.fs_client.get_file_client.return_value
+        file_client.get_file_properties.return_value.size = len(content)
+        ranges = []
+
+        def download_file(offset, length, decompress):
+            assert decompress is False
+            ranges.append((offset, length))
+            downloader = Mock()
+            downloader.readinto.side_effect = lambda stream: stream.write(content[offset : offset + length])
+            return downloader
+
+        file_client.download_file.side_effect = download_file
+
+        result = fs_client.read_parquet(
+            "mycomputedpath", "myfile.parquet", columns=["temperature"], filters=[("city", "==", "Paris")]
+        )
+
+        assert result["temperature"].tolist() == list(range(rows, 2 * rows))
+        assert sum(length for _, length in ranges) < len(content) / 2
+
     def test_read_csv(self, fs_client):
         path = path_builder("mycomputedpath", "myfile.csv")
         data = pd.DataFrame({"data1": [1, 2, 3], "data2": [4, 5, 6]})
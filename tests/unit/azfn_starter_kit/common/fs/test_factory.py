@@ -0,0 +1,42 @@
+import pytest
+
+from azfn_starter_kit.common.fs.datalake_file_system import DataLakeGen2FileSystemClient
+from azfn_starter_kit.common.fs.factory import create_file_system_client, get_file_system_client
+from azfn_starter_kit.common.fs.local_file_system import LocalFileSystemClient
+from azfn_starter_kit.common.fs.memory_file_system import InMemoryFileSystemClient
+from azfn_starter_kit.config.datalake_config import DataLakeConfig
+
+
+def test_create_adls_client():
+    fs_client = create_file_system_client(DataLakeConfig(BACKEND="adls"))
+
+    assert isinstance(fs_client, DataLakeGen2FileSystemClient)
+    assert fs_client.cache is None
+
+
+def test_create_local_client(tmp_path):
+    fs_client = create_file_system_client(DataLakeConfig(BACKEND="local", LOCAL_ROOT=str(tmp_path)))
+
+    assert isinstance(fs_client, LocalFileSystemClient)
+    assert fs_client.root_dir == str(tmp_path)
+
+
+def test_memory_clients_share_their_files():
+    create_file_system_client(DataLakeConfig(BACKEND="memory")).write_file("dir", "file.txt", "content")
+
+    fs_client = create_file_system_client(DataLakeConfig(BACKEND="memory"))
+    assert isinstance(fs_client, InMemoryFileSystemClient)
+    assert bytes(fs_client.read_bytes("dir", "file.txt")) == b"content"
+    fs_client.delete_file("dir", "file.txt")
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        create_file_system_client(DataLakeConfig(BACKEND="ftp"))
+
+
+def test_get_file_system_client_is_shared_per_settings():
+    fs_client = get_file_system_client(DataLakeConfig(BACKEND="memory"))
+
+    assert get_file_system_client(DataLakeConfig(BACKEND="memory")) is fs_client
+    assert get_file_system_client(DataLakeConfig(BACKEND="memory", RAW_PATH="other")) is not fs_client
@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from azfn_starter_kit.common.fs.file_cache import FileCache
+
+
+@pytest.fixture
+def file_cache(tmp_path):
+    return FileCache(memory_max_bytes=10, disk_path=str(tmp_path), disk_max_bytes=20)
+
+
+def test_get_miss(file_cache):
+    assert file_cache.get("dir/file", "etag1") is None
+    assert file_cache.metrics["misses"] == 1
+
+
+def test_memory_hit(file_cache):
+    file_cache.put("dir/file", "etag1", b"content")
+
+    assert file_cache.get("dir/file", "etag1") == b"content"
+    assert file_cache.metrics["memory_hits"] == 1
+    assert file_cache.hit_ratio() == 1.0
+
+
+def test_get_other_etag_is_a_miss(file_cache):
+    file_cache.put("dir/file", "etag1", b"content")
+
+    assert file_cache.get("dir/file", "etag2") is None
+    assert file_cache.metrics["misses"] == 1
+
+
+def test_disk_hit_is_promoted_to_memory(tmp_path):
+    file_cache = FileCache(memory_max_bytes=10, disk_path=str(tmp_path), disk_max_bytes=20)
+    file_cache.put("dir/file", "etag1", b"content")
+
+    warm_cache = FileCache(memory_max_bytes=10, disk_path=str(tmp_path), disk_max_bytes=20)
+    assert warm_cache.get("dir/file", "etag1") == b"content"
+    assert warm_cache.get("dir/file", "etag1") == b"content"
+    assert warm_cache.metrics == {"memory_hits": 1, "disk_hits": 1, "misses": 0, "evictions": 0}
+
+
+def test_memory_lru_eviction(tmp_path):
+    file_cache = FileCache(memory_max_bytes=10, disk_path=None)
+    file_cache.put("file_a", "etag", b"aaaa")
+    file_cache.put("file_b", "etag", b"bbbb")
+    file_cache.get("file_a", "etag")
+    file_cache.put("file_c", "etag", b"cccc")
+
+    assert file_cache.get("file_b", "etag") is None
+    assert file_cache.get("file_a", "etag") == b"aaaa"
+    assert file_cache.metrics["evictions"] == 1
+
+
+def test_disk_replaces_previous_version_and_evicts(file_cache, tmp_path):
+    file_cache.put("file_a", "etag1", b"a" * 8)
+    file_cache.put("file_a", "etag2", b"a" * 8)
+    assert len(os.listdir(tmp_path)) == 1
+
+    file_cache.put("file_b", "etag1", b"b" * 8)
+    file_cache.put("file_c", "etag1", b"c" * 8)
+
+    assert len(os.listdir(tmp_path)) == 2
+    assert file_cache.metrics["evictions"] >= 1
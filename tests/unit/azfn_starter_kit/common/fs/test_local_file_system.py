@@ -0,0 +1,89 @@
+import os
+
+import pandas as pd
+import pytest
+
+from azfn_starter_kit.common.fs.local_file_system import LocalFileSystemClient
+from azfn_starter_kit.common.fs.memory_file_system import InMemoryFileSystemClient
+
+
+@pytest.fixture
+def fs_client(tmp_path) -> LocalFileSystemClient:
+    return LocalFileSystemClient(str(tmp_path), "raw", "transformed", "computed", block_size=4)
+
+
+def test_write_and_read_bytes(fs_client, tmp_path):
+    fs_client.write_file("dir", "file.txt", "some content")
+
+    assert bytes(fs_client.read_bytes("dir", "file.txt")) == b"some content"
+    assert os.listdir(tmp_path / "dir") == ["file.txt"]
+
+
+def test_read_empty_file(fs_client):
+    fs_client.write_file("dir", "empty.txt", b"")
+
+    assert bytes(fs_client.read_bytes("dir", "empty.txt")) == b""
+
+
+def test_parquet_round_trip(fs_client):
+    data_frame = pd.DataFrame({"city": ["Paris", "Lyon"], "temperature": [20.5, 22.0]})
+    fs_client.write_parquet("dir", "file.parquet", data_frame)
+
+    pd.testing.assert_frame_equal(fs_client.read_parquet("dir", "file.parquet"), data_frame)
+
+
+def test_list_files_and_latest_file(fs_client):
+    fs_client.write_file("raw/year=2024/month=07/day=19", "WEATHER_Paris_1.json", "{}")
+    fs_client.write_file("raw/year=2024/month=07/day=20", "WEATHER_Paris_2.json", "{}")
+
+    assert fs_client.list_files("raw") == [
+        "year=2024/month=07/day=19/WEATHER_Paris_1.json",
+        "year=2024/month=07/day=20/WEATHER_Paris_2.json",
+    ]
+    assert fs_client.latest_file("raw", pattern="WEATHER_Paris") == "year=2024/month=07/day=20/WEATHER_Paris_2.json"
+
+
+def test_copy_and_move_files(fs_client):
+    fs_client.write_file("src", "file.txt", "content")
+
+    fs_client.copy_files("src", "copy", ["file.txt"])
+    fs_client.move_files("src", "moved", ["file.txt"], dest_files_name=["renamed.txt"])
+
+    assert bytes(fs_client.read_bytes("copy", "file.txt")) == b"content"
+    assert bytes(fs_client.read_bytes("moved", "renamed.txt")) == b"content"
+    assert fs_client.list_files("src") == []
+
+
+def test_copy_files_from_other_backend(fs_client):
+    source_fs = InMemoryFileSystemClient("raw", "transformed", "computed")
+    source_fs.write_file("src", "file.txt", "content")
+
+    fs_client.copy_files("src", "dest", ["file.txt"], source_fs=source_fs)
+
+    assert bytes(fs_client.read_bytes("dest", "file.txt")) == b"content"
+
+
+def test_delete(fs_client):
+    fs_client.write_file("dir", "file_1.txt", "content")
+    fs_client.write_file("dir", "file_2.txt", "content")
+
+    fs_client.delete_file("dir", "file_1.txt")
+    assert fs_client.list_files("dir") == ["file_2.txt"]
+
+    fs_client.delete_directory("dir")
+    assert fs_client.list_files("dir") == []
+
+
+def test_list_file_infos_and_delete_files(fs_client):
+    fs_client.write_file("dir/sub", "file_1.txt", "content")
+    fs_client.write_file("dir", "file_2.txt", "data")
+
+    file_infos = sorted(fs_client.list_file_infos("dir"))
+    assert [(file_info.name, file_info.size) for file_info in file_infos] == [
+        ("file_2.txt", 4),
+        ("sub/file_1.txt", 7),
+    ]
+    assert file_infos[0].last_modified.tzinfo is not None
+
+    fs_client.delete_files("dir", ["file_2.txt", "sub/file_1.txt"])
+    assert fs_client.list_files("dir") == []
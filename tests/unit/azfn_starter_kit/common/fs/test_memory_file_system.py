@@ -0,0 +1,107 @@
+import pandas as pd
+import pytest
+
+from azfn_starter_kit.common.fs.memory_file_system import InMemoryFileSystemClient
+
+
+@pytest.fixture
+def fs_client() -> InMemoryFileSystemClient:
+    return InMemoryFileSystemClient("raw", "transformed", "computed", block_size=4)
+
+
+def test_write_and_read_bytes(fs_client):
+    fs_client.write_file("dir", "file.txt", iter(["some ", "content"]))
+
+    assert bytes(fs_client.read_bytes("dir", "file.txt")) == b"some content"
+
+
+def test_read_missing_file(fs_client):
+    with pytest.raises(FileNotFoundError):
+        fs_client.read_bytes("dir", "missing.txt")
+
+
+def test_shared_store():
+    store = {}
+    InMemoryFileSystemClient("raw", "transformed", "computed", store=store).write_file("dir", "file.txt", "content")
+
+    other_client = InMemoryFileSystemClient("raw", "transformed", "computed", store=store)
+    assert bytes(other_client.read_bytes("dir", "file.txt")) == b"content"
+
+
+def test_json_round_trip(fs_client):
+    fs_client.write_file("dir", "file.json", '[{"city": "Paris", "temperature": 20.5}]')
+
+    pd.testing.assert_frame_equal(
+        fs_client.read_json("dir", "file.json"), pd.DataFrame({"city": ["Paris"], "temperature": [20.5]})
+    )
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 2, 10])
+def test_write_csv_from_list(fs_client, chunk_rows):
+    fs_client.write_csv("dir", "file.csv", ";", [["a", "b"], ["c", "d"], ["e", "f"]], chunk_rows=chunk_rows)
+
+    assert bytes(fs_client.read_bytes("dir", "file.csv")) == b"a;b\nc;d\ne;f"
+
+
+def test_write_csv_from_dataframe(fs_client):
+    data_frame = pd.DataFrame({"city": ["Paris", "Lyon", "Nice"], "temperature": [20.5, 22.0, 25.0]})
+
+    fs_client.write_csv("dir", "file.csv", ",", data_frame, chunk_rows=2)
+
+    pd.testing.assert_frame_equal(fs_client.read_csv("dir", "file.csv"), data_frame)
+
+
+def test_compressed_json_round_trip(fs_client):
+    file_name = fs_client.write_file("dir", "file.json", '{"city": "Paris"}\n{"city": "Lyon"}', compression="gzip")
+
+    assert file_name == "file.json.gz"
+    assert bytes(fs_client.read_bytes("dir", file_name))[:2] == b"\x1f\x8b"
+    pd.testing.assert_frame_equal(
+        fs_client.read_json("dir", file_name, lines=True), pd.DataFrame({"city": ["Paris", "Lyon"]})
+    )
+
+
+def test_read_parquet_projection_and_filters(fs_client):
+    data_frame = pd.DataFrame(
+        {"city": ["Paris", "Lyon", "Paris", "Lyon"], "date": ["2024-07-20", "2024-07-20", "2024-07-19", "2024-07-19"]}
+    )
+    fs_client.write_parquet("dir", "file.parquet", data_frame, sort_by=["city", "date"], row_group_size=2)
+
+    result = fs_client.read_parquet("dir", "file.parquet", columns=["date"], filters=[("city", "==", "Paris")])
+
+    assert result["date"].tolist() == ["2024-07-19", "2024-07-20"]
+
+
+def test_list_files(fs_client):
+    fs_client.write_file("dir/sub", "file_1.txt", "content")
+    fs_client.write_file("dir", "file_2.txt", "")
+
+    assert fs_client.list_files("dir") == ["file_2.txt", "sub/file_1.txt"]
+    assert fs_client.list_files("dir", min_blob_size=1) == ["sub/file_1.txt"]
+    assert fs_client.list_files("dir", pattern="sub") == ["sub/file_1.txt"]
+
+
+def test_latest_file_flat(fs_client):
+    fs_client.write_file("raw", "WEATHER_Paris_1.json", "{}")
+    fs_client.write_file("raw", "WEATHER_Paris_2.json", "{}")
+    fs_client.write_file("raw", "WEATHER_Lyon_3.json", "{}")
+
+    assert fs_client.latest_file("raw", pattern="WEATHER_Paris") == "WEATHER_Paris_2.json"
+
+
+def test_move_files(fs_client):
+    fs_client.write_file("src", "file.txt", "content")
+
+    fs_client.move_files("src", "dest", ["file.txt"])
+
+    assert fs_client.list_files("src") == []
+    assert bytes(fs_client.read_bytes("dest", "file.txt")) == b"content"
+
+
+def test_delete_directory(fs_client):
+    fs_client.write_file("dir/sub", "file.txt", "content")
+    fs_client.write_file("other", "file.txt", "content")
+
+    fs_client.delete_directory("dir")
+
+    assert list(fs_client.store) == ["other/file.txt"]
@@ -1,6 +1,8 @@
+import datetime
+
 import pytest
 
-from azfn_starter_kit.utilities.file_system import path_builder
+from azfn_starter_kit.utilities.file_system import date_partition, path_builder
 
 
 @pytest.mark.parametrize(
@@ -15,3 +17,7 @@ from azfn_starter_kit.utilities.file_system import path_builder
 def test_path_builder(components, expected_path):
     result = path_builder(*components)
     assert result == expected_path
+
+
+def test_date_partition():
+    assert date_partition(datetime.date(2024, 7, 2)) == "year=2024/month=07/day=02"
@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from azfn_starter_kit.utilities.import_profile import (
+    ImportTiming,
+    format_report,
+    parse_import_times,
+    profile_imports,
+    total_import_time_us,
+)
+
+_ROOT = Path(__file__).resolve().parents[4]
+
+# Start-up budget of the function app: generous, since it is measured on shared CI machines; the imports of
+# the Azure Functions runtime alone take about half of it.
+_IMPORT_BUDGET_US = 1_500_000
+# Libraries only the activities need, which must not be imported at start-up
+_DEFERRED_MODULES = ("pandas", "numpy", "pyarrow", "sqlalchemy", "pyodbc", "geopy", "requests", "azure.storage")
+
+_REPORT = """import time: self [us] | cumulative | imported package
+import time:       150 |        150 |   _json
+import time:       700 |        850 | json
+Some other output
+import time:      1200 |       1200 | function_app
+"""
+
+
+def test_parse_import_times():
+    assert parse_import_times(_REPORT) == [
+        ImportTiming("_json", 150, 150, 1),
+        ImportTiming("json", 700, 850, 0),
+        ImportTiming("function_app", 1200, 1200, 0),
+    ]
+
+
+def test_format_report():
+    report = format_report(parse_import_times(_REPORT), top=1)
+
+    assert report.splitlines() == ["Total import time: 2.0 ms, 3 modules", "       1.2 ms        1.2 ms  function_app"]
+
+
+def test_function_app_import_budget():
+    timings = profile_imports("function_app", cwd=str(_ROOT))
+
+    modules = {timing.module for timing in timings}
+    assert [module for module in _DEFERRED_MODULES if module in modules] == []
+    assert total_import_time_us(timings) < _IMPORT_BUDGET_US, format_report(timings)
@@ -1,8 +1,21 @@
+import json
 import logging
+import queue
+import sys
+from logging.handlers import QueueHandler
 
 import pytest
 
-from azfn_starter_kit.utilities.logger import get_logger
+from azfn_starter_kit.utilities import logger as logger_module
+from azfn_starter_kit.utilities.logger import (
+    JsonFormatter,
+    SamplingFilter,
+    _ContextQueueHandler,
+    flush_logs,
+    get_logger,
+    log_context,
+    start_logging,
+)
 
 
 def test_get_logger_with_valid_name():
@@ -29,3 +42,83 @@ def test_get_logger_with_existing_logger_name():
 def test_get_logger_with_level(log_level, expected_level):
     logger = get_logger("test_logger", log_level=log_level)
     assert logger.level == expected_level
+
+
+def _record(name="azfn_starter_kit.common.fs.local_file_system", level=logging.INFO, exc_info=None):
+    return logging.LogRecord(name, level, "module.py", 12, "Read %s", ("file.json",), exc_info, func="read")
+
+
+def test_get_logger_shares_the_queue_handler():
+    logger = get_logger("test_queue_logger")
+    other_logger = get_logger("test_other_queue_logger")
+
+    assert len(logger.handlers) == 1
+    assert isinstance(logger.handlers[0], QueueHandler)
+    assert logger.handlers[0] is other_logger.handlers[0]
+    assert not logger.propagate
+
+
+def test_start_logging():
+    flush_logs()
+    get_logger("test_logger")
+    assert logger_module._LISTENER is None
+
+    start_logging()
+    listener = logger_module._LISTENER
+    start_logging()
+    assert listener is not None and logger_module._LISTENER is listener
+
+    flush_logs()
+    assert logger_module._LISTENER is None
+
+
+def test_queue_handler_renders_message_and_defers_traceback():
+    log_queue = queue.SimpleQueue()
+    handler = _ContextQueueHandler(log_queue)
+
+    with log_context(run_id="run", city="PARIS"):
+        with log_context(stage="extract", city="LYON"):
+            handler.handle(_record())
+        handler.handle(_record())
+    handler.handle(_record())
+
+    records = [log_queue.get_nowait() for _ in range(3)]
+    assert [record.context for record in records] == [
+        {"run_id": "run", "city": "LYON", "stage": "extract"},
+        {"run_id": "run", "city": "PARIS"},
+        {},
+    ]
+    assert (records[0].msg, records[0].args) == ("Read file.json", None)
+
+    try:
+        raise ValueError("Invalid file")
+    except ValueError:
+        handler.handle(_record(level=logging.ERROR, exc_info=sys.exc_info()))
+    record = log_queue.get_nowait()
+    assert record.exc_info is not None and record.exc_text is None
+
+
+def test_json_formatter():
+    try:
+        raise ValueError("Invalid file")
+    except ValueError:
+        record = _record(level=logging.ERROR, exc_info=sys.exc_info())
+    record.context = {"city": "PARIS", "stage": "extract", "message": "overridden", "level": "DEBUG"}
+    record.run_id = "run"
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "Read file.json"
+    assert entry["level"] == "ERROR"
+    assert entry["logger"] == "azfn_starter_kit.common.fs.local_file_system"
+    assert (entry["city"], entry["stage"], entry["run_id"]) == ("PARIS", "extract", "run")
+    assert "ValueError: Invalid file" in entry["exception"]
+
+
+def test_sampling_filter():
+    sampling_filter = SamplingFilter({"azfn_starter_kit.common": 1.0, "azfn_starter_kit.common.fs": 0.0})
+
+    assert not sampling_filter.filter(_record())
+    assert sampling_filter.filter(_record(level=logging.WARNING))
+    assert sampling_filter.filter(_record(name="azfn_starter_kit.common.db.database"))
+    assert SamplingFilter({"azfn_starter_kit.common.fs": 0.0}).filter(_record(name="azfn_starter_kit.common.fsx"))
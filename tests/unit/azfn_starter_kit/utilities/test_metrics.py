@@ -0,0 +1,47 @@
+from unittest.mock import patch
+
+from azfn_starter_kit.utilities.metrics import ActivityMetrics, summarize_metrics
+
+
+def test_activity_metrics_phases():
+    metrics = ActivityMetrics()
+    with patch("azfn_starter_kit.utilities.metrics.time.perf_counter", side_effect=[0.0, 1.5, 2.0, 2.5, 3.0, 3.25]):
+        with metrics.phase("fetch"):
+            pass
+        with metrics.phase("upsert"):
+            pass
+        with metrics.phase("fetch"):
+            pass
+    metrics.rows += 24
+
+    assert metrics.to_dict() == {
+        "duration_s": 2.25,
+        "phases": {"fetch": 1.75, "upsert": 0.5},
+        "bytes_read": 0,
+        "bytes_written": 0,
+        "rows": 24,
+        "retries": 0,
+    }
+
+
+def test_summarize_metrics():
+    records = [
+        {"stage": "extract", "status": "SUCCESS", "duration_s": 2.0, "phases": {"fetch": 2.0}, "bytes_read": 100},
+        {"stage": "extract", "status": "FAILURE", "duration_s": 3.0, "phases": {"fetch": 3.0}, "retries": 2},
+        {"stage": "load", "status": "SUCCESS", "duration_s": 1.0, "phases": {"upsert": 1.0}, "rows": 24},
+    ]
+
+    summary = summarize_metrics(records)
+
+    assert summary["extract"] == {
+        "count": 2,
+        "failures": 1,
+        "max_duration_s": 3.0,
+        "phases": {"fetch": 5.0},
+        "duration_s": 5.0,
+        "bytes_read": 100,
+        "bytes_written": 0,
+        "rows": 0,
+        "retries": 2,
+    }
+    assert summary["load"]["rows"] == 24